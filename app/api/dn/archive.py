@@ -6,7 +6,7 @@ from typing import Any, Dict, List
 
 from fastapi import APIRouter
 
-from app.core.google import SPREADSHEET_URL, create_gspread_client
+from app.core.google import SPREADSHEET_URL, get_gspread_client
 from app.core.sheet import fetch_plan_sheets, parse_date
 from app.dn_columns import get_sheet_columns
 from app.utils.time import TZ_GMT7
@@ -70,7 +70,7 @@ def archive_plan_mos():
     """
 
     try:
-        gc = create_gspread_client()
+        gc = get_gspread_client()
         sh = gc.open_by_url(SPREADSHEET_URL)
         plan_sheets = fetch_plan_sheets(sh)
 
@@ -151,13 +151,14 @@ def archive_plan_mos():
 
                 for r in normalized_rows:
                     take_archive = False
-                    plan_val = r[plan_idx] if plan_idx is not None else ""
                     status_val = r[status_idx] if status_idx is not None else ""
-                    parsed = parse_date(plan_val) if plan_val else None
-                    plan_date = parsed.date() if isinstance(parsed, datetime) else None
-
-                    if plan_date and plan_date < threshold_date and (status_val or "").strip().upper() == "POD":
-                        take_archive = True
+                    # Only POD rows can be archived; check that before paying for the date parse.
+                    if (status_val or "").strip().upper() == "POD":
+                        plan_val = r[plan_idx] if plan_idx is not None else ""
+                        parsed = parse_date(plan_val) if plan_val else None
+                        plan_date = parsed.date() if isinstance(parsed, datetime) else None
+                        if plan_date and plan_date < threshold_date:
+                            take_archive = True
 
                     if take_archive:
                         archive_rows.append(r)
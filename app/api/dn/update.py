@@ -2,48 +2,56 @@
 
 from __future__ import annotations
 
+from collections import Counter
 from typing import Any, List, Optional
-import json
+import logging
 from datetime import datetime
 from app.utils.logging import logger
 
 from fastapi import APIRouter, BackgroundTasks, Body, Depends, File, Form, HTTPException, UploadFile
+from sqlalchemy import update as sa_update
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from app.constants import (
     DN_RE,
-    ARRIVAL_STATUSES,
-    DEPARTURE_STATUSES,
+    DN_MAX_LENGTH,
+    DN_MIN_LENGTH,
+    STATUS_TIMESTAMP_FIELD,
 )
 from app.crud import (
-    add_dn_record,
+    apply_dn_updates,
+    bulk_add_dn_records,
     delete_dn,
     delete_dn_record,
-    ensure_dn,
-    get_existing_dn_numbers,
-    _ACTIVE_DN_EXPR,
+    insert_new_dns,
 )
 from app.db import get_db, SessionLocal
 from app.models import DN
+from app.services.dn_batcher import dn_batcher
 from app.services.dn_checkins import DNCheckinError, create_dn_checkin
 from app.storage import save_file
 from app.utils.string import normalize_dn
-from app.utils.time import TZ_GMT7
+from app.utils.time import TZ_GMT7, current_sheet_timestamp_gmt7
 from app.core.sheet import sync_dn_record_to_sheet
+from app.core.sheet_batcher import sheet_write_batcher
+from app.core.sheet_queue import submit_sheet_sync
 
 router = APIRouter(prefix="/api/dn")
 
 
-def _current_timestamp_gmt7() -> str:
-    now = datetime.now(TZ_GMT7)
-    return f"{now.month}/{now.day}/{now.year} {now.hour}:{now.minute:02d}:{now.second:02d}"
-
-
 def _format_log_entries(entries: dict[str, Any]) -> str:
     return "; ".join(f"{key} = {value!r}" for key, value in entries.items()) + ";"
 
 
-async def _run_post_update_tasks(
+def _clean(value: Any) -> Any:
+    """Strip string form values, mapping blank strings to None."""
+    if isinstance(value, str):
+        return value.strip() or None
+    return value
+
+
+def _sync_dn_update_to_sheet(
     *,
     dn_number: str,
     status_delivery: str | None,
@@ -51,53 +59,56 @@ async def _run_post_update_tasks(
     remark: str | None,
     updated_by_value: str | None,
     phone_number_value: str | None,
-    gs_sheet_name: str | None,
-    gs_row_index: Optional[int],
+    gs_sheet_name: str,
+    gs_row_index: int,
     dn_row_id: Optional[int],
-    checkin_payload: dict[str, Any] | None,
 ) -> None:
-    should_check_sheet = (
-        gs_sheet_name and isinstance(gs_row_index, int) and gs_row_index > 0 and status_delivery is not None
-    )
-
-    if should_check_sheet:
-        try:
-            gpread_result = sync_dn_record_to_sheet(
-                gs_sheet_name,  # type: ignore[arg-type]
-                gs_row_index,  # type: ignore[arg-type]
-                dn_number,
-                status_delivery,
-                status_site,
-                remark,
-                updated_by_value,
-                phone_number_value,
-            )
-            logger.info("Google Sheet update result: %s", json.dumps(gpread_result))
-            corrected_row: Optional[int] = None
-            if isinstance(gpread_result, dict):
-                if isinstance(gpread_result.get("row_corrected"), int):
-                    corrected_row = gpread_result["row_corrected"]
-                elif isinstance(gpread_result.get("row"), int):
-                    corrected_row = gpread_result["row"]
-
-            if corrected_row is not None and dn_row_id is not None:
-                with SessionLocal() as bg_db:
-                    dn_row = bg_db.query(DN).filter(DN.id == dn_row_id).one_or_none()
-                    if dn_row is not None:
-                        if getattr(dn_row, "gs_row", None) != corrected_row:
-                            dn_row.gs_row = corrected_row
-                        if gs_sheet_name and getattr(dn_row, "gs_sheet", None) != gs_sheet_name:
-                            dn_row.gs_sheet = gs_sheet_name
-                        bg_db.add(dn_row)
-                        bg_db.commit()
-        except Exception:
-            logger.exception("Failed to sync DN record to Google Sheet", extra={"dn_number": dn_number})
-
-    if checkin_payload:
-        try:
-            await create_dn_checkin(checkin_payload)
-        except DNCheckinError:
-            logger.exception("Failed to sync DN update to check-in service", extra={"dn_number": dn_number})
+    try:
+        gpread_result = sync_dn_record_to_sheet(
+            gs_sheet_name,
+            gs_row_index,
+            dn_number,
+            status_delivery,
+            status_site,
+            remark,
+            updated_by_value,
+            phone_number_value,
+            batcher=sheet_write_batcher,
+        )
+        logger.info("Google Sheet update result: %s", gpread_result)
+        corrected_row: Optional[int] = None
+        if isinstance(gpread_result, dict):
+            if isinstance(gpread_result.get("row_corrected"), int):
+                corrected_row = gpread_result["row_corrected"]
+            elif isinstance(gpread_result.get("row"), int):
+                corrected_row = gpread_result["row"]
+
+        # gs_sheet/gs_row were read from this DN just before the update, so only a
+        # relocated row needs writing back; no need to load the row to compare.
+        if corrected_row is not None and dn_row_id is not None and corrected_row != gs_row_index:
+            with SessionLocal.begin() as bg_db:
+                bg_db.execute(
+                    sa_update(DN).where(DN.id == dn_row_id).values(gs_row=corrected_row, gs_sheet=gs_sheet_name)
+                )
+    except Exception:
+        logger.exception("Failed to sync DN record to Google Sheet", extra={"dn_number": dn_number})
+
+
+async def _run_dn_checkin(dn_number: str, checkin_payload: dict[str, Any]) -> None:
+    try:
+        await create_dn_checkin(checkin_payload)
+    except DNCheckinError:
+        logger.exception("Failed to sync DN update to check-in service", extra={"dn_number": dn_number})
+
+
+def _persist_dn_update(
+    db: Session,
+    dn_number: str,
+    ensure_payload: dict[str, Any],
+    record_fields: dict[str, Any],
+) -> tuple[str | None, Any, Optional[int], int]:
+    """Apply a single DN update when the DN update batcher is not running."""
+    return apply_dn_updates(db, [(dn_number, ensure_payload, record_fields)])[0]
 
 
 @router.post("/update")
@@ -116,80 +127,51 @@ async def update_dn(
     db: Session = Depends(get_db),
 ):
     dn_number = normalize_dn(dnNumber)
-    if not DN_RE.fullmatch(dn_number):
+    if not DN_MIN_LENGTH <= len(dn_number) <= DN_MAX_LENGTH or not DN_RE.fullmatch(dn_number):
         raise HTTPException(status_code=400, detail="Invalid DN number")
 
-    photo_metadata: dict[str, Any] | None = None
-    if photo is not None:
-        photo_metadata = {
-            "filename": getattr(photo, "filename", None),
-            "content_type": getattr(photo, "content_type", None),
-            "has_content": bool(photo.filename),
+    if logger.isEnabledFor(logging.INFO):
+        payload_fields = (
+            ("dn_number.raw", dnNumber),
+            ("dn_number.normalized", dn_number),
+            ("status", status),
+            ("status_delivery", status_delivery),
+            ("status_site", status_site),
+            ("remark", remark),
+            ("lng", lng),
+            ("lat", lat),
+            ("updated_by", updated_by),
+            ("phone_number", phone_number),
+        )
+        if photo is not None:
+            payload_fields += (
+                ("photo.filename", photo.filename),
+                ("photo.content_type", photo.content_type),
+                ("photo.has_content", bool(photo.filename)),
+            )
+        payload_entries = {
+            key: value
+            for key, value in payload_fields
+            if _clean(value) is not None
         }
-
-    payload_entries: list[tuple[str, Any]] = []
-
-    def append_if_present(key: str, value: Any) -> None:
-        if value is None:
-            return
-        if isinstance(value, str):
-            if value.strip() == "":
-                return
-        payload_entries.append((key, value))
-
-    append_if_present("dn_number.raw", dnNumber)
-    append_if_present("dn_number.normalized", dn_number)
-    append_if_present("status", status)
-    append_if_present("status_delivery", status_delivery)
-    append_if_present("status_site", status_site)
-    append_if_present("remark", remark)
-    append_if_present("lng", lng)
-    append_if_present("lat", lat)
-    append_if_present("updated_by", updated_by)
-    append_if_present("phone_number", phone_number)
-
-    if photo_metadata:
-        for key, value in photo_metadata.items():
-            append_if_present(f"photo.{key}", value)
-
-    if payload_entries:
-        formatted_payload = "; ".join(f"{key} = {value!r}" for key, value in payload_entries) + ";"
-        logger.info("Received DN update payload: %s", formatted_payload)
+        if payload_entries:
+            logger.info("Received DN update payload: %s", _format_log_entries(payload_entries))
 
     photo_url = None
     if photo and photo.filename:
-        content = photo.file.read()
-        photo_url = save_file(content, photo.content_type or "application/octet-stream")
+        # Stream the spooled upload straight into storage off the event loop.
+        await photo.seek(0)
+        photo_url = await run_in_threadpool(save_file, photo.file, photo.content_type or "application/octet-stream")
 
     lng_val = str(lng) if lng else None
     lat_val = str(lat) if lat else None
 
-    updated_by_value = None
-    if updated_by is not None:
-        updated_by_value = updated_by.strip() or None
-
-    phone_number_value = None
-    if isinstance(phone_number, str):
-        phone_number_value = phone_number.strip() or None
+    updated_by_value, phone_number_value = _clean(updated_by), _clean(phone_number)
 
     # legacy 兼容：如果 status_delivery 为空但有 status，则用 status 作为 status_delivery
-    if (not status_delivery or status_delivery.strip() == "") and status:
+    if status and _clean(status_delivery) is None:
         status_delivery = status
 
-    existing_dn = db.query(DN).filter(DN.dn_number == dn_number).filter(_ACTIVE_DN_EXPR).one_or_none()
-    gs_sheet_name = existing_dn.gs_sheet if existing_dn is not None else None
-    raw_gs_row = existing_dn.gs_row if existing_dn is not None else None
-
-    if isinstance(raw_gs_row, int):
-        gs_row_index: int | None = raw_gs_row
-    elif isinstance(raw_gs_row, str):
-        try:
-            gs_row_index = int(raw_gs_row)
-        except ValueError:
-            gs_row_index = None
-    else:
-        gs_row_index = None
-
     ensure_payload: dict[str, Any] = {
         "remark": remark,
         "photo_url": photo_url,
@@ -205,31 +187,38 @@ async def update_dn(
     if phone_number_value is not None:
         ensure_payload["driver_contact_number"] = phone_number_value
 
-    status_upper = (status_delivery or "").strip().upper()
-    timestamp_value: str | None = None
-    if status_upper in ARRIVAL_STATUSES or status_upper in DEPARTURE_STATUSES:
-        timestamp_value = _current_timestamp_gmt7()
-    if status_upper in ARRIVAL_STATUSES and timestamp_value is not None:
-        ensure_payload["actual_arrive_time_ata"] = timestamp_value
-    if status_upper in DEPARTURE_STATUSES and timestamp_value is not None:
-        ensure_payload["actual_depart_from_start_point_atd"] = timestamp_value
-
-    # Ensure DN exists / update fields from payload; capture returned DN row
-    dn_row = ensure_dn(db, dn_number, **ensure_payload)
-
-    rec = add_dn_record(
-        db,
-        dn_number=dn_number,
-        status_delivery=status_delivery,
-        status_site=status_site,
-        remark=remark,
-        photo_url=photo_url,
-        lng=lng_val,
-        lat=lat_val,
-        updated_by=updated_by_value,
-        phone_number=phone_number_value,
-    )
-    logger.info(f"Added DN record: {dn_number}")
+    timestamp_field = STATUS_TIMESTAMP_FIELD.get((status_delivery or "").strip().upper())
+    if timestamp_field is not None:
+        ensure_payload[timestamp_field] = current_sheet_timestamp_gmt7()
+
+    record_fields: dict[str, Any] = {
+        "status_delivery": status_delivery,
+        "status_site": status_site,
+        "remark": remark,
+        "photo_url": photo_url,
+        "lng": lng_val,
+        "lat": lat_val,
+        "updated_by": updated_by_value,
+        "phone_number": phone_number_value,
+    }
+    # Coalesce with concurrent updates when the batcher runs; otherwise keep the
+    # synchronous session's round-trips off the event loop.
+    if dn_batcher.running:
+        update_result = await dn_batcher.submit(dn_number, ensure_payload, record_fields)
+    else:
+        update_result = await run_in_threadpool(_persist_dn_update, db, dn_number, ensure_payload, record_fields)
+    gs_sheet_name, raw_gs_row, dn_row_id, record_id = update_result
+    logger.info("Added DN record: %s", dn_number)
+
+    if isinstance(raw_gs_row, int):
+        gs_row_index: int | None = raw_gs_row
+    elif isinstance(raw_gs_row, str):
+        try:
+            gs_row_index = int(raw_gs_row)
+        except ValueError:
+            gs_row_index = None
+    else:
+        gs_row_index = None
 
     checkin_payload = {
         "dn_id": dn_number,
@@ -243,21 +232,28 @@ async def update_dn(
     if photo_url:
         checkin_payload["photo_url"] = photo_url
 
-    background_tasks.add_task(
-        _run_post_update_tasks,
-        dn_number=dn_number,
-        status_delivery=status_delivery,
-        status_site=status_site,
-        remark=remark,
-        updated_by_value=updated_by_value,
-        phone_number_value=phone_number_value,
-        gs_sheet_name=gs_sheet_name,
-        gs_row_index=gs_row_index,
-        dn_row_id=getattr(dn_row, "id", None),
-        checkin_payload=checkin_payload,
+    should_sync_sheet = (
+        gs_sheet_name and isinstance(gs_row_index, int) and gs_row_index > 0 and status_delivery is not None
     )
+    if should_sync_sheet:
+        sheet_job_kwargs: dict[str, Any] = {
+            "dn_number": dn_number,
+            "status_delivery": status_delivery,
+            "status_site": status_site,
+            "remark": remark,
+            "updated_by_value": updated_by_value,
+            "phone_number_value": phone_number_value,
+            "gs_sheet_name": gs_sheet_name,
+            "gs_row_index": gs_row_index,
+            "dn_row_id": dn_row_id,
+        }
+        # Prefer the bounded sheet-sync pool; fall back to a background task if it is unavailable.
+        if not submit_sheet_sync(_sync_dn_update_to_sheet, **sheet_job_kwargs):
+            background_tasks.add_task(_sync_dn_update_to_sheet, **sheet_job_kwargs)
 
-    return {"ok": True, "id": rec.id, "photo": photo_url}
+    background_tasks.add_task(_run_dn_checkin, dn_number, checkin_payload)
+
+    return {"ok": True, "id": record_id, "photo": photo_url}
 
 
 @router.post("/batch_update")
@@ -275,36 +271,41 @@ def batch_update_dn(
             "failure_details": {},
         }
 
-    normalized_numbers: List[str] = []
-    failure_details: dict[str, str] = {}
-    seen_numbers: set[str] = set()
-
-    def add_failure(number: str, reason: str) -> None:
-        failure_details[number] = reason
-
-    for raw_number in dn_numbers:
-        normalized = normalize_dn(raw_number)
-        if not normalized or not DN_RE.fullmatch(normalized):
-            base_key = raw_number if isinstance(raw_number, str) and raw_number else "<empty>"
-            failure_key = str(base_key) if base_key is not None else "<empty>"
-            add_failure(failure_key, "无效的 DN number")
-            continue
-        if normalized in seen_numbers:
-            add_failure(normalized, "请求中重复")
-            continue
-        seen_numbers.add(normalized)
-        normalized_numbers.append(normalized)
-
-    existing_numbers = get_existing_dn_numbers(db, normalized_numbers)
-    success_numbers: List[str] = []
-
-    for number in normalized_numbers:
-        if number in existing_numbers:
-            add_failure(number, "DN number 已存在")
-            continue
-        ensure_dn(db, number, status_delivery="NO STATUS", status_site=None)
-        add_dn_record(db, dn_number=number, status_delivery="NO STATUS", status_site=None, remark=None, photo_url=None, lng=None, lat=None)
-        success_numbers.append(number)
+    # Normalize and validate every entry up front, then dedupe in a single pass.
+    dn_fullmatch = DN_RE.fullmatch
+    normalized_entries = [normalize_dn(raw_number) for raw_number in dn_numbers]
+    valid_mask = [
+        DN_MIN_LENGTH <= len(normalized) <= DN_MAX_LENGTH and dn_fullmatch(normalized) is not None
+        for normalized in normalized_entries
+    ]
+
+    failure_details: dict[str, str] = {
+        (raw_number if isinstance(raw_number, str) and raw_number else "<empty>"): "无效的 DN number"
+        for raw_number, is_valid in zip(dn_numbers, valid_mask)
+        if not is_valid
+    }
+    valid_numbers = [normalized for normalized, is_valid in zip(normalized_entries, valid_mask) if is_valid]
+    normalized_numbers = list(dict.fromkeys(valid_numbers))
+    if len(normalized_numbers) != len(valid_numbers):
+        occurrences = Counter(valid_numbers)
+        failure_details.update((number, "请求中重复") for number in normalized_numbers if occurrences[number] > 1)
+
+    # New DNs start with the single record created below, hence update_count=1. Both
+    # inserts share one transaction so a DN is never committed without its first record.
+    try:
+        inserted_numbers = insert_new_dns(
+            db, normalized_numbers, commit=False, status_delivery="NO STATUS", update_count=1
+        )
+        success_numbers = [number for number in normalized_numbers if number in inserted_numbers]
+        bulk_add_dn_records(db, success_numbers, commit=False, status_delivery="NO STATUS")
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    if len(success_numbers) != len(normalized_numbers):
+        failure_details.update(
+            (number, "DN number 已存在") for number in normalized_numbers if number not in inserted_numbers
+        )
 
     status_value = "ok" if success_numbers else "fail"
     return {
@@ -1,6 +1,10 @@
 """Health endpoint."""
 
 from fastapi import APIRouter
+from sqlalchemy.pool import QueuePool
+
+from app.db import engine
+from app.settings import settings
 
 router = APIRouter()
 
@@ -8,3 +12,21 @@ router = APIRouter()
 @router.get("/")
 def healthz():
     return {"ok": True, "message": "You can use admin panel now."}
+
+
+@router.get("/health/db")
+def database_pool_health():
+    """Report connection pool usage so checkout saturation shows up before requests stall."""
+    pool = engine.pool
+    payload = {"ok": True, "pool": pool.status()}
+    if isinstance(pool, QueuePool):
+        checked_out = pool.checkedout()
+        capacity = pool.size() + max(settings.db_max_overflow, 0)
+        payload.update(
+            checked_out=checked_out,
+            capacity=capacity,
+            timeout=pool.timeout(),
+            saturated=checked_out >= capacity,
+        )
+        payload["ok"] = not payload["saturated"]
+    return payload
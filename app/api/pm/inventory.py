@@ -1,8 +1,7 @@
 from __future__ import annotations
 
-from typing import Any, List
-
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.db import get_db
@@ -45,10 +44,11 @@ def list_pm(db: Session = Depends(get_db)):
     """Return all PMs."""
     from app.models import PM
 
-    items = db.query(PM).order_by(PM.pm_name.asc()).all()
+    # Project only the returned columns; plain row tuples skip ORM hydration.
+    rows = db.execute(select(PM.id, PM.pm_name, PM.lng, PM.lat, PM.address).order_by(PM.pm_name.asc())).all()
     result = [
-        {"id": pm.id, "pm_name": pm.pm_name, "lng": pm.lng, "lat": pm.lat, "address": pm.address}
-        for pm in items
+        {"id": pm_id, "pm_name": pm_name, "lng": lng, "lat": lat, "address": address}
+        for pm_id, pm_name, lng, lat, address in rows
     ]
     return {"ok": True, "total": len(result), "items": result}
 
@@ -105,10 +105,10 @@ def pm_inventory(query: PMInventoryQuery = Depends(), db: Session = Depends(get_
     """Return all DN numbers currently in stock for the given PM."""
     pm_name_value = query.pm_name
 
-    records = crud.list_pm_inventory(db, pm_name=pm_name_value)
-
-    items: List[dict[str, Any]] = []
-    for r in records:
-        items.append({"id": r.id, "dn_number": r.dn_number, "in_time": r.in_time.isoformat() if r.in_time else None})
+    rows = crud.list_pm_inventory(db, pm_name=pm_name_value)
+    items = [
+        {"id": record_id, "dn_number": dn_number, "in_time": in_time.isoformat() if in_time else None}
+        for record_id, dn_number, in_time in rows
+    ]
 
     return {"ok": True, "pm_name": pm_name_value, "total": len(items), "items": items}
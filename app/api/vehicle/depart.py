@@ -1,8 +1,10 @@
 """Vehicle departure endpoint."""
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
+from app.api.utils.validation import json_body, json_body_openapi
 from app.core.sync import serialize_vehicle
 from app.crud import mark_vehicle_departed
 from app.db import get_db
@@ -13,8 +15,15 @@ from app.utils.time import ensure_gmt7_timezone
 router = APIRouter(prefix="/api/vehicle")
 
 
-@router.post("/depart")
-def vehicle_depart(payload: VehicleDepartRequest, db: Session = Depends(get_db)):
+@router.post(
+    "/depart",
+    response_class=ORJSONResponse,
+    openapi_extra=json_body_openapi(VehicleDepartRequest),
+)
+def vehicle_depart(
+    payload: VehicleDepartRequest = Depends(json_body(VehicleDepartRequest)),
+    db: Session = Depends(get_db),
+):
     vehicle_plate = normalize_vehicle_plate(payload.vehicle_plate)
     if not vehicle_plate:
         raise HTTPException(status_code=400, detail="vehicle_plate_required")
@@ -25,4 +34,4 @@ def vehicle_depart(payload: VehicleDepartRequest, db: Session = Depends(get_db))
     if vehicle is None:
         raise HTTPException(status_code=404, detail="vehicle_not_found")
 
-    return {"ok": True, "vehicle": serialize_vehicle(vehicle)}
+    return ORJSONResponse({"ok": True, "vehicle": serialize_vehicle(vehicle)})
@@ -1,22 +1,85 @@
 """Vehicle querying endpoints."""
 
-from datetime import datetime, time, timezone
+import hashlib
+from datetime import date, datetime, time, timezone
+from functools import lru_cache
+from typing import Any, Callable, Iterator
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+import orjson
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from sqlalchemy.orm import Session
 
-from app.constants import VEHICLE_VALID_STATUSES
-from app.core.sync import serialize_vehicle
-from app.crud import get_vehicle_by_plate, list_vehicles
-from app.db import get_db
+from app.constants import VEHICLE_VALID_STATUSES_SET
+from app.core.sync import serialize_vehicle, serialize_vehicle_mapping
+from app.crud import (
+    get_vehicle_by_plate,
+    iter_vehicles_row_batches,
+    list_vehicles_rows,
+    vehicle_list_fingerprint,
+)
+from app.db import SessionLocal, get_db
 from app.utils.string import normalize_vehicle_plate
 from app.utils.time import TZ_GMT7
 
 router = APIRouter(prefix="/api/vehicle")
 
+VEHICLE_CACHE_CONTROL = "private, max-age=5"
 
-@router.get("/vehicle")
-def get_vehicle_info(vehicle_plate: str = Query(..., alias="vehiclePlate"), db: Session = Depends(get_db)):
+
+def _etag(*parts: object) -> str:
+    digest = hashlib.blake2b(":".join(map(str, parts)).encode(), digest_size=8).hexdigest()
+    return f'"{digest}"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def _cached_response(
+    build_response: Callable[[dict[str, str]], Response], etag: str, if_none_match: str | None
+) -> Response:
+    """Return 304 when the client already holds ``etag``, otherwise ``build_response(headers)``."""
+    headers = {"ETag": etag, "Cache-Control": VEHICLE_CACHE_CONTROL}
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return build_response(headers)
+
+
+def _stream_vehicles(filters: dict[str, Any]) -> Iterator[bytes]:
+    """Yield the ``{"ok": true, "vehicles": [...]}`` body one cursor batch at a time."""
+    # The request-scoped session is closed before a streamed body is sent, so use our own.
+    with SessionLocal() as db:
+        yield b'{"ok":true,"vehicles":['
+        separator = b""
+        for batch in iter_vehicles_row_batches(db, **filters):
+            yield separator + b",".join([orjson.dumps(serialize_vehicle_mapping(row)) for row in batch])
+            separator = b","
+        yield b"]}"
+
+
+@lru_cache(maxsize=512)
+def _day_bounds_utc(date_str: str) -> tuple[datetime, datetime]:
+    """Return the UTC bounds of a ``YYYY-MM-DD`` day in GMT+7; raises ``ValueError`` on bad input."""
+    if len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-":
+        requested_date = date.fromisoformat(date_str)
+    else:
+        # Rare unpadded input such as 2025-3-5 is still accepted, as before.
+        requested_date = datetime.strptime(date_str, "%Y-%m-%d").date()
+    start_local = datetime.combine(requested_date, time(0, 0, 0, tzinfo=TZ_GMT7))
+    end_local = datetime.combine(requested_date, time(23, 59, 59, 999999, tzinfo=TZ_GMT7))
+    return start_local.astimezone(timezone.utc), end_local.astimezone(timezone.utc)
+
+
+@router.get("/vehicle", response_class=ORJSONResponse)
+def get_vehicle_info(
+    vehicle_plate: str = Query(..., alias="vehiclePlate"),
+    if_none_match: str | None = Header(None),
+    db: Session = Depends(get_db),
+):
     normalized_plate = normalize_vehicle_plate(vehicle_plate)
     if not normalized_plate:
         raise HTTPException(status_code=400, detail="vehicle_plate_required")
@@ -25,19 +88,28 @@ def get_vehicle_info(vehicle_plate: str = Query(..., alias="vehiclePlate"), db:
     if vehicle is None:
         raise HTTPException(status_code=404, detail="vehicle_not_found")
 
-    return {"ok": True, "vehicle": serialize_vehicle(vehicle)}
+    etag = _etag(
+        vehicle.vehicle_plate, vehicle.status, vehicle.arrive_time, vehicle.depart_time, vehicle.updated_at
+    )
+    return _cached_response(
+        lambda headers: ORJSONResponse({"ok": True, "vehicle": serialize_vehicle(vehicle)}, headers=headers),
+        etag,
+        if_none_match,
+    )
 
 
-@router.get("/vehicles")
+@router.get("/vehicles", response_class=ORJSONResponse)
 def list_vehicles_endpoint(
     status: str | None = Query(None),
     date: str | None = Query(None),
+    stream: bool = Query(False),
+    if_none_match: str | None = Header(None),
     db: Session = Depends(get_db),
 ):
     normalized_status: str | None = None
     if status:
         normalized_status = status.strip().lower()
-        if normalized_status not in VEHICLE_VALID_STATUSES:
+        if normalized_status not in VEHICLE_VALID_STATUSES_SET:
             raise HTTPException(status_code=400, detail="invalid_status")
 
     filter_by = "depart_time" if normalized_status == "departed" else "arrive_time"
@@ -45,14 +117,21 @@ def list_vehicles_endpoint(
     date_from = date_to = None
     if date:
         try:
-            requested_date = datetime.strptime(date, "%Y-%m-%d")
+            date_from, date_to = _day_bounds_utc(date)
         except ValueError:
             raise HTTPException(status_code=400, detail="invalid_date")
 
-        start_local = datetime.combine(requested_date.date(), time(0, 0, 0, tzinfo=TZ_GMT7))
-        end_local = datetime.combine(requested_date.date(), time(23, 59, 59, 999999, tzinfo=TZ_GMT7))
-        date_from = start_local.astimezone(timezone.utc)
-        date_to = end_local.astimezone(timezone.utc)
+    filters = {"status": normalized_status, "filter_by": filter_by, "date_from": date_from, "date_to": date_to}
+    count, latest_update = vehicle_list_fingerprint(db, **filters)
+    etag = _etag(normalized_status, filter_by, date, count, latest_update)
+
+    def _build(headers: dict[str, str]) -> Response:
+        if stream:
+            # Large exports: constant memory, first bytes sent as soon as the first batch is read.
+            return StreamingResponse(_stream_vehicles(filters), media_type="application/json", headers=headers)
+        rows = list_vehicles_rows(db, **filters)
+        # Values are already JSON-ready; returning the response directly skips jsonable_encoder.
+        payload = {"ok": True, "vehicles": [serialize_vehicle_mapping(row) for row in rows]}
+        return ORJSONResponse(payload, headers=headers)
 
-    vehicles = list_vehicles(db, status=normalized_status, filter_by=filter_by, date_from=date_from, date_to=date_to)
-    return {"ok": True, "vehicles": [serialize_vehicle(vehicle) for vehicle in vehicles]}
+    return _cached_response(_build, etag, if_none_match)
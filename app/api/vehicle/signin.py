@@ -1,8 +1,10 @@
 """Vehicle sign-in endpoint."""
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
+from app.api.utils.validation import json_body, json_body_openapi
 from app.core.sync import serialize_vehicle
 from app.crud import upsert_vehicle_signin
 from app.db import get_db
@@ -13,13 +15,20 @@ from app.utils.time import ensure_gmt7_timezone
 router = APIRouter(prefix="/api/vehicle")
 
 
-@router.post("/signin")
-def vehicle_signin(payload: VehicleSigninRequest, db: Session = Depends(get_db)):
+@router.post(
+    "/signin",
+    response_class=ORJSONResponse,
+    openapi_extra=json_body_openapi(VehicleSigninRequest),
+)
+def vehicle_signin(
+    payload: VehicleSigninRequest = Depends(json_body(VehicleSigninRequest)),
+    db: Session = Depends(get_db),
+):
     vehicle_plate = normalize_vehicle_plate(payload.vehicle_plate)
     if not vehicle_plate:
         raise HTTPException(status_code=400, detail="vehicle_plate_required")
 
-    lsp = (payload.lsp or "").strip()
+    lsp = payload.lsp
     if not lsp:
         raise HTTPException(status_code=400, detail="lsp_required")
 
@@ -35,4 +44,4 @@ def vehicle_signin(payload: VehicleSigninRequest, db: Session = Depends(get_db))
         arrive_time=arrive_time,
     )
 
-    return {"ok": True, "vehicle": serialize_vehicle(vehicle)}
+    return ORJSONResponse({"ok": True, "vehicle": serialize_vehicle(vehicle)})
@@ -6,19 +6,26 @@ import re
 
 __all__ = [
     "DN_RE",
+    "DN_MIN_LENGTH",
+    "DN_MAX_LENGTH",
     "VALID_STATUSES",
     "VALID_STATUS_DESCRIPTION",
     "VEHICLE_VALID_STATUSES",
+    "VEHICLE_VALID_STATUSES_SET",
     "STANDARD_STATUS_DELIVERY_VALUES",
     "STATUS_DELIVERY_LOOKUP",
     "ARRIVAL_STATUSES",
     "DEPARTURE_STATUSES",
+    "STATUS_TIMESTAMP_FIELD",
     "EARLY_BIRD_AREA_THRESHOLDS",
     "EARLY_BIRD_AREA_THRESHOLDS_AFTER_NOV_9",
 ]
 
 # Regular expression for DN number validation
 DN_RE = re.compile(r"^[A-Za-z]{2,5}\d{11,16}$")
+# Length bounds implied by DN_RE (2-5 letters + 11-16 digits); a cheap pre-check before the regex
+DN_MIN_LENGTH = 13
+DN_MAX_LENGTH = 21
 
 # Valid DN statuses
 VALID_STATUSES: tuple[str, ...] = (
@@ -51,6 +58,7 @@ VALID_STATUS_DESCRIPTION = ", ".join(VALID_STATUSES)
 
 # Valid vehicle statuses
 VEHICLE_VALID_STATUSES: tuple[str, ...] = ("arrived", "departed")
+VEHICLE_VALID_STATUSES_SET: frozenset[str] = frozenset(VEHICLE_VALID_STATUSES)
 
 # Standard status_delivery values for normalization
 STANDARD_STATUS_DELIVERY_VALUES: tuple[str, ...] = (
@@ -62,18 +70,17 @@ STANDARD_STATUS_DELIVERY_VALUES: tuple[str, ...] = (
     "POD",
 )
 
-# Lookup table for normalizing status_delivery values
+# Lookup table for normalizing status_delivery values, keyed by casefolded text.
+# Includes the canonical values themselves plus accepted synonyms.
 STATUS_DELIVERY_LOOKUP: dict[str, str] = {
-    canonical.lower(): canonical for canonical in STANDARD_STATUS_DELIVERY_VALUES
-}
-# Additional synonyms for status_delivery. Keys are lower-cased to match lookup usage
-STATUS_DELIVERY_LOOKUP.update(
-    {k.lower(): v for k, v in {
+    key.casefold(): canonical
+    for key, canonical in {
+        **{canonical: canonical for canonical in STANDARD_STATUS_DELIVERY_VALUES},
         "Arrive at Warehouse": "ARRIVED AT WH",
         "TRANSPORTING FROM WH": "DEPARTED FROM WH",
         "TRANSPORTING FROM XD/PM": "DEPARTED FROM XD/PM",
-    }.items()}
-)
+    }.items()
+}
 
 # Statuses that trigger arrival timestamp (write to column S)
 ARRIVAL_STATUSES: frozenset[str] = frozenset({
@@ -92,6 +99,12 @@ DEPARTURE_STATUSES: frozenset[str] = frozenset(
     }
 )
 
+# status_delivery (upper-case) -> DN timestamp column it stamps
+STATUS_TIMESTAMP_FIELD: dict[str, str] = {
+    **{status: "actual_arrive_time_ata" for status in ARRIVAL_STATUSES},
+    **{status: "actual_depart_from_start_point_atd" for status in DEPARTURE_STATUSES},
+}
+
 # Area-specific arrival thresholds (hour in GMT+7) used by the early-bird report.
 EARLY_BIRD_AREA_THRESHOLDS: dict[str, int] = {
     "jabo": 6,
@@ -9,12 +9,12 @@ from typing import Any, Dict, List, Tuple
 from uuid import uuid4
 from urllib.parse import unquote_plus
 
-from gspread.utils import rowcol_to_a1
+from gspread.utils import absolute_range_name, rowcol_to_a1
 from sqlalchemy import func
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
-from app.core.google import AGING_ORDERS_SPREADSHEET_URL, create_gspread_client
+from app.core.google import AGING_ORDERS_SPREADSHEET_URL, get_gspread_client
 from app.models import AgingOrder
 from app.utils.logging import logger
 from app.utils.time import TZ_GMT7
@@ -163,7 +163,7 @@ def _append_order_to_unknown_sheet(order_name: str, pm_value: str, shipment_no:
         return None
 
     try:
-        client = create_gspread_client()
+        client = get_gspread_client()
         spreadsheet = client.open_by_url(AGING_ORDERS_SPREADSHEET_URL)
         worksheet = _find_unknown_worksheet(spreadsheet)
         if worksheet is None:
@@ -271,6 +271,40 @@ def run_pm_location_sheet_updates(
         logger.exception("Background PM Location sheet update failed", extra={"order_name": order_name})
 
 
+class _CellWriteBuffer:
+    """Collect single-cell writes and send them in one ``values.batchUpdate`` call.
+
+    If the batch call fails, each cell is retried with ``update_acell`` so one bad
+    range does not drop the rest.
+    """
+
+    def __init__(self, spreadsheet: Any) -> None:
+        self._spreadsheet = spreadsheet
+        self._writes: List[Tuple[Any, str, str]] = []
+
+    def add(self, worksheet: Any, row: int, col: int, value: str) -> None:
+        self._writes.append((worksheet, rowcol_to_a1(row, col), value))
+
+    def flush(self) -> None:
+        writes, self._writes = self._writes, []
+        if not writes:
+            return
+        data = [
+            {"range": absolute_range_name(worksheet.title, a1), "values": [[value]]}
+            for worksheet, a1, value in writes
+        ]
+        try:
+            self._spreadsheet.values_batch_update({"valueInputOption": "USER_ENTERED", "data": data})
+            return
+        except Exception as exc:  # pragma: no cover - gspread runtime errors
+            logger.warning("Batch PM Location write failed, retrying %d cells individually: %s", len(writes), exc)
+        for worksheet, a1, value in writes:
+            try:
+                worksheet.update_acell(a1, value)
+            except Exception as exc:  # pragma: no cover
+                logger.warning("Failed to update sheet %s cell %s: %s", worksheet.title, a1, exc)
+
+
 def update_pm_location_in_sheets(
     rows: List[AgingOrder],
     pm_value: str,
@@ -293,10 +327,12 @@ def update_pm_location_in_sheets(
     normalized_target_order = _normalize_text_input(order_name) if order_name else None
     visited_positions: set[Tuple[str, int, int]] = set()
     fallback_needed = False
+    pending_writes: _CellWriteBuffer | None = None
 
     try:
-        client = create_gspread_client()
+        client = get_gspread_client()
         spreadsheet = client.open_by_url(AGING_ORDERS_SPREADSHEET_URL)
+        pending_writes = _CellWriteBuffer(spreadsheet)
         sheet_cache: Dict[str, Any] = {}
         pm_col_cache: Dict[str, int] = {}
         order_col_cache: Dict[str, int] = {}
@@ -384,21 +420,9 @@ def update_pm_location_in_sheets(
                 continue
             visited_positions.add(pos_key)
 
-            try:
-                a1_cell = rowcol_to_a1(target_row_index, pm_col)
-                worksheet.update_acell(a1_cell, pm_value)
-                if insert_time_col:
-                    insert_a1 = rowcol_to_a1(target_row_index, insert_time_col)
-                    worksheet.update_acell(insert_a1, insert_time_value)
-            except Exception as exc:  # pragma: no cover
-                logger.warning(
-                    "Failed to update PM Location/insert time in sheet %s at row %s col %s: %s",
-                    worksheet.title if worksheet else row.sheet_title,
-                    target_row_index,
-                    pm_col,
-                    exc,
-                )
-                continue
+            pending_writes.add(worksheet, target_row_index, pm_col, pm_value)
+            if insert_time_col:
+                pending_writes.add(worksheet, target_row_index, insert_time_col, insert_time_value)
 
         # Fallback: if any rows were mismatched, search all sheets for the target order and update all matches
         if fallback_needed and normalized_target_order:
@@ -417,24 +441,17 @@ def update_pm_location_in_sheets(
                     except Exception as exc:  # pragma: no cover
                         logger.warning("Failed to read headers for worksheet %s during fallback: %s", worksheet.title, exc)
                         insert_time_col_cache[worksheet.title] = insert_time_col
-                try:
-                    a1_cell = rowcol_to_a1(row_idx, pm_col)
-                    worksheet.update_acell(a1_cell, pm_value)
-                    if insert_time_col:
-                        insert_a1 = rowcol_to_a1(row_idx, insert_time_col)
-                        worksheet.update_acell(insert_a1, insert_time_value)
-                    visited_positions.add(pos_key)
-                except Exception as exc:  # pragma: no cover
-                    logger.warning(
-                        "Failed fallback PM Location/insert time update in sheet %s at row %s col %s: %s",
-                        worksheet.title,
-                        row_idx,
-                        pm_col,
-                        exc,
-                    )
-                    continue
+                pending_writes.add(worksheet, row_idx, pm_col, pm_value)
+                if insert_time_col:
+                    pending_writes.add(worksheet, row_idx, insert_time_col, insert_time_value)
+                visited_positions.add(pos_key)
     except Exception as exc:  # pragma: no cover
         logger.warning("Failed to update PM Location in Google Sheets: %s", exc)
+    finally:
+        # One values.batchUpdate for every PM Location / insert time cell queued above,
+        # including those queued before an error cut the loop short.
+        if pending_writes is not None:
+            pending_writes.flush()
 
 
 def sync_aging_orders_sheet_to_db(db: Session) -> dict[str, int]:
@@ -444,7 +461,7 @@ def sync_aging_orders_sheet_to_db(db: Session) -> dict[str, int]:
 
     logger.info("Starting Aging Orders sheet sync")
 
-    client = create_gspread_client()
+    client = get_gspread_client()
     spreadsheet = client.open_by_url(AGING_ORDERS_SPREADSHEET_URL)
 
     worksheets = [
@@ -468,7 +485,7 @@ def sync_aging_orders_sheet_to_db(db: Session) -> dict[str, int]:
             shipment_col_idx = 0
 
         for row_index, row_values in enumerate(values[1:], start=2):
-            if not any((cell or "").strip() for cell in row_values):
+            if not "".join(row_values).strip():
                 continue
             row_dict = {headers[idx]: row_values[idx] for idx in range(min(len(headers), len(row_values)))}
             normalized = _normalize_row(row_dict)
@@ -3,25 +3,44 @@
 from __future__ import annotations
 
 import json
+import threading
+import time
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
 from typing import Any
 
 import gspread
+from google.oauth2.service_account import Credentials
 
 from app.settings import settings
 from app.utils.logging import logger
 
-__all__ = ["create_gspread_client", "SPREADSHEET_URL", "AGING_ORDERS_SPREADSHEET_URL", "GS_KEY_PATH", "make_gs_cell_url"]
+__all__ = [
+    "create_gspread_client",
+    "get_gspread_client",
+    "load_service_account_info",
+    "SPREADSHEET_URL",
+    "AGING_ORDERS_SPREADSHEET_URL",
+    "GS_KEY_PATH",
+    "make_gs_cell_url",
+]
 
 GS_KEY_PATH = Path("/etc/secrets/gskey.json")
 SPREADSHEET_URL = settings.google_spreadsheet_url
 AGING_ORDERS_SPREADSHEET_URL = settings.aging_orders_spreadsheet_url
 
+# Rebuild the shared client a little before the 1h access-token lifetime so its
+# HTTP session does not outlive long idle periods.
+GSPREAD_CLIENT_MAX_AGE_SECONDS = 3000
+
 _SERVICE_ACCOUNT_INFO: dict[str, Any] | None = None
+_CREDENTIALS: Credentials | None = None
+_CLIENT_LOCK = threading.Lock()
+_CLIENT_ENTRY: tuple[gspread.Client, float] | None = None
 
 
-def _load_service_account_info() -> dict[str, Any]:
+def load_service_account_info() -> dict[str, Any]:
     """Load Google service account credentials from env or filesystem."""
     global _SERVICE_ACCOUNT_INFO
     if _SERVICE_ACCOUNT_INFO is not None:
@@ -58,12 +77,21 @@ def _load_service_account_info() -> dict[str, Any]:
     return info
 
 
+def _load_credentials() -> Credentials:
+    """Parse the service account key once; the credentials refresh their own tokens."""
+    global _CREDENTIALS
+    if _CREDENTIALS is None:
+        _CREDENTIALS = Credentials.from_service_account_info(
+            load_service_account_info(), scopes=gspread.auth.DEFAULT_SCOPES
+        )
+    return _CREDENTIALS
+
+
 def create_gspread_client() -> gspread.Client:
     """Create a gspread client using configured credentials."""
-    service_account_info = _load_service_account_info()
     logger.debug("Creating gspread client using configured service account credentials")
     try:
-        gc = gspread.service_account_from_dict(service_account_info)
+        gc = gspread.authorize(_load_credentials())
     except Exception as exc:  # pragma: no cover - gspread failure surfaces as runtime error
         logger.exception("Failed to authenticate using Google service account credentials: %s", exc)
         raise
@@ -72,6 +100,43 @@ def create_gspread_client() -> gspread.Client:
     return gc
 
 
+def get_gspread_client(max_age_seconds: float = GSPREAD_CLIENT_MAX_AGE_SECONDS) -> gspread.Client:
+    """Return the process-wide gspread client, rebuilding it once it is older than ``max_age_seconds``."""
+    global _CLIENT_ENTRY
+    entry = _CLIENT_ENTRY
+    if entry is not None and time.monotonic() - entry[1] < max_age_seconds:
+        return entry[0]
+
+    with _CLIENT_LOCK:
+        entry = _CLIENT_ENTRY
+        if entry is None or time.monotonic() - entry[1] >= max_age_seconds:
+            entry = (create_gspread_client(), time.monotonic())
+            _CLIENT_ENTRY = entry
+        return entry[0]
+
+
+_GS_ROW_PLACEHOLDER = "__gs_row__"
+
+
+@lru_cache(maxsize=256)
+def _gs_cell_url_parts(sheet_id: int) -> tuple[str, str]:
+    """Split the cell URL for ``sheet_id`` around the row number, which is the only per-call part."""
+    parsed = urlparse(SPREADSHEET_URL)
+    # parse existing query params and replace/add gid
+    qsl = dict(parse_qsl(parsed.query, keep_blank_values=True))
+    qsl["gid"] = str(sheet_id)
+    # set range to the given row
+    qsl["range"] = f"R{_GS_ROW_PLACEHOLDER}"
+    new_query = urlencode(qsl)
+
+    # Always set fragment to gid=sheet_id
+    new_fragment = f"gid={sheet_id}"
+
+    template = urlunparse((parsed.scheme, parsed.netloc, parsed.path, parsed.params, new_query, new_fragment))
+    head, _, tail = template.partition(_GS_ROW_PLACEHOLDER)
+    return head, tail
+
+
 def make_gs_cell_url(sheet_name: str | None, row: int | None) -> str | None:
     """Construct a Google Sheets URL that points to a given sheet (by title) and row.
 
@@ -90,18 +155,7 @@ def make_gs_cell_url(sheet_name: str | None, row: int | None) -> str | None:
         if sheet_id is None:
             return None
 
-        parsed = urlparse(SPREADSHEET_URL)
-        # parse existing query params and replace/add gid
-        qsl = dict(parse_qsl(parsed.query, keep_blank_values=True))
-        qsl["gid"] = str(sheet_id)
-        # set range to column A and the given row
-        qsl["range"] = f"R{int(row)}"
-        new_query = urlencode(qsl)
-
-        # Always set fragment to gid=sheet_id
-        new_fragment = f"gid={sheet_id}"
-
-        rebuilt = urlunparse((parsed.scheme, parsed.netloc, parsed.path, parsed.params, new_query, new_fragment))
-        return rebuilt
+        head, tail = _gs_cell_url_parts(sheet_id)
+        return f"{head}{int(row)}{tail}"
     except Exception:
         return None
@@ -2,20 +2,28 @@
 
 from __future__ import annotations
 
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
 from functools import lru_cache
-from time import perf_counter
-from typing import Any, List
+from time import monotonic, perf_counter, sleep
+from typing import TYPE_CHECKING, Any, List
 
+import gspread.exceptions
 import gspread.utils
 import pandas as pd
 
-from app.core.google import SPREADSHEET_URL, create_gspread_client
+from app.core.google import SPREADSHEET_URL, get_gspread_client
+from app.core.sheets_api import sheets_batch_update, sheets_values_get
 from app import state
 from app.dn_columns import get_sheet_columns
 from app.utils.logging import dn_sync_logger, logger
 from app.utils.string import normalize_dn
-from app.utils.time import TZ_GMT7
+from app.utils.time import TZ_GMT7, current_sheet_timestamp_gmt7, parse_day_mon_year
+
+if TYPE_CHECKING:
+    from app.core.sheet_batcher import SheetWriteBatcher
 
 MONTH_MAP = {"Sept": "Sep", "Okt": "Oct"}
 DATE_FORMATS = [
@@ -26,10 +34,29 @@ DATE_FORMATS = [
     "%d%b",
     "%Y/%m/%d",
 ]
+# Cheap shape checks that pick the DATE_FORMATS worth trying, so a cell only
+# goes through strptime for formats it could possibly match.
+_DATE_FORMAT_DISPATCH: tuple[tuple[re.Pattern[str], tuple[str, ...]], ...] = (
+    (re.compile(r"\d{1,2}\s+[^\W\d_]+\s+\d+"), ("%d %b %y", "%d %b %Y")),
+    (re.compile(r"\d{1,2}-[^\W\d_]+-\d+"), ("%d-%b-%Y", "%d-%b-%y")),
+    (re.compile(r"\d{1,2}[^\W\d_]+"), ("%d%b",)),
+    (re.compile(r"\d{1,4}/\d{1,2}/\d{1,2}"), ("%Y/%m/%d",)),
+)
+# values.batchGet options returning raw cell values, with dates as serial numbers.
+_UNFORMATTED_SERIAL_DATES = {"valueRenderOption": "UNFORMATTED_VALUE", "dateTimeRenderOption": "SERIAL_NUMBER"}
+_SHEETS_EPOCH = date(1899, 12, 30)
 ARCHIVE_TEXT_COLOR = {"red": 0.6, "green": 0.6, "blue": 0.6}
 DEFAULT_ARCHIVE_THRESHOLD_DAYS = 7
 NOTE_TEXT = "Modified by Fast Tracker"
 NOTE_LINK_URI = "https://idnsc.dpdns.org/admin"
+# Opened spreadsheet + worksheet handles are reused for this long by row syncs.
+SPREADSHEET_CACHE_TTL_SECONDS = 600
+# Plan MOS sheets are fetched concurrently; kept small to stay under the Sheets read quota.
+PLAN_SHEET_FETCH_MAX_WORKERS = 6
+# Archive formatting batches are sent a few at a time, retrying quota/transient errors with backoff.
+ARCHIVE_UPDATE_MAX_WORKERS = 4
+ARCHIVE_UPDATE_MAX_ATTEMPTS = 5
+_RETRYABLE_API_ERROR_CODES = frozenset({429, 500, 503})
 
 __all__ = [
     "parse_date",
@@ -37,7 +64,10 @@ __all__ = [
     "process_sheet_data",
     "process_all_sheets",
     "normalize_sheet_value",
+    "normalize_sheet_columns",
+    "apply_repeat_cell_requests",
     "sync_dn_record_to_sheet",
+    "reset_sheet_cache",
     "mark_plan_mos_rows_for_archiving",
     "ARCHIVE_TEXT_COLOR",
     "DEFAULT_ARCHIVE_THRESHOLD_DAYS",
@@ -59,11 +89,19 @@ def parse_date(date_str: str):
         normalized = normalized.replace(incorrect, correct)
     trimmed = normalized.strip()
 
-    for fmt in DATE_FORMATS:
-        try:
-            return datetime.strptime(trimmed, fmt)
-        except ValueError:
+    parsed = parse_day_mon_year(trimmed)
+    if parsed is not None:
+        return datetime(parsed.year, parsed.month, parsed.day)
+
+    for pattern, formats in _DATE_FORMAT_DISPATCH:
+        if pattern.fullmatch(trimmed) is None:
             continue
+        for fmt in formats:
+            try:
+                return datetime.strptime(trimmed, fmt)
+            except ValueError:
+                continue
+        break
 
     return normalized
 
@@ -84,31 +122,36 @@ def fetch_plan_sheets(spreadsheet) -> list:
     return plan_sheets
 
 
-def process_sheet_data(sheet, columns: List[str]) -> pd.DataFrame:
-    """Read sheet values and align columns."""
+def _read_sheet_rows(sheet, columns: List[str]) -> List[List[str]]:
+    """Return the sheet's data rows (sheet row 4 onwards), each exactly ``len(columns)`` wide.
+
+    Reads ``A4:<last defined column>`` straight from the values endpoint, so header rows and
+    columns beyond the sheet definition are never downloaded and gspread's gap filling is skipped.
+    """
+    column_count = len(columns)
+    last_column = gspread.utils.rowcol_to_a1(1, max(column_count, 1))[:-1]
     fetch_start = perf_counter()
-    all_values = sheet.get_all_values()
+    data = sheets_values_get(
+        sheet.spreadsheet_id, gspread.utils.absolute_range_name(sheet.title, f"A4:{last_column}")
+    )
     dn_sync_logger.debug(
-        "sheet.get_all_values for '%s' returned %d rows in %.3fs",
+        "values.get for '%s' returned %d rows in %.3fs",
         sheet.title,
-        len(all_values),
+        len(data),
         perf_counter() - fetch_start,
     )
-    data = all_values[3:]
-    trimmed: List[List[str]] = []
-    row_numbers: List[int] = []
-    column_count = len(columns)
+    if any(len(row) != column_count for row in data):
+        # The API drops trailing empty cells; pad only when some row is short.
+        data = [row + [""] * (column_count - len(row)) if len(row) < column_count else row for row in data]
+    return data
 
-    for index, row in enumerate(data, start=4):
-        row_values = row[:column_count]
-        if len(row_values) < column_count:
-            row_values = row_values + [""] * (column_count - len(row_values))
-        trimmed.append(row_values)
-        row_numbers.append(index)
 
-    df = pd.DataFrame(trimmed, columns=columns)
+def process_sheet_data(sheet, columns: List[str]) -> pd.DataFrame:
+    """Read sheet values and align columns."""
+    data = _read_sheet_rows(sheet, columns)
+    df = pd.DataFrame(data, columns=columns)
     df["gs_sheet"] = sheet.title
-    df["gs_row"] = row_numbers
+    df["gs_row"] = range(4, 4 + len(data))
     dn_sync_logger.debug("Sheet '%s' produced DataFrame with %d rows", sheet.title, len(df))
     return df
 
@@ -124,11 +167,29 @@ def process_all_sheets(sh) -> pd.DataFrame:
     except Exception:
         dn_sync_logger.exception("Failed to update gs_sheet_name_to_id_map")
     columns = get_sheet_columns()
-    all_data = [process_sheet_data(sheet, columns) for sheet in plan_sheets]
-    if not all_data:
+    if not plan_sheets:
         dn_sync_logger.info("No plan sheets found to process; returning empty DataFrame")
         return pd.DataFrame(columns=columns)
-    combined = pd.concat(all_data, ignore_index=True)
+    if len(plan_sheets) > 1:
+        # Each get_all_values() is one HTTPS round-trip; overlap them on a small pool.
+        # ``map`` keeps the sheet order so the combined frame matches the sequential path.
+        workers = min(PLAN_SHEET_FETCH_MAX_WORKERS, len(plan_sheets))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="plan-sheet-fetch") as executor:
+            sheet_rows = list(executor.map(lambda sheet: _read_sheet_rows(sheet, columns), plan_sheets))
+    else:
+        sheet_rows = [_read_sheet_rows(plan_sheets[0], columns)]
+
+    # All sheets share one column layout, so build a single frame instead of concatenating one per sheet.
+    all_rows: List[List[str]] = []
+    gs_sheets: List[str] = []
+    gs_rows: List[int] = []
+    for sheet, rows in zip(plan_sheets, sheet_rows):
+        all_rows.extend(rows)
+        gs_sheets.extend([sheet.title] * len(rows))
+        gs_rows.extend(range(4, 4 + len(rows)))
+    combined = pd.DataFrame(all_rows, columns=columns)
+    combined["gs_sheet"] = gs_sheets
+    combined["gs_row"] = gs_rows
     dn_sync_logger.info("Combined sheet data into DataFrame with %d rows", len(combined))
     dn_sync_logger.debug("Completed sheet processing in %.3fs", perf_counter() - total_start)
     return combined
@@ -143,6 +204,110 @@ def normalize_sheet_value(value: Any) -> Any:
     return value
 
 
+def normalize_sheet_columns(df: pd.DataFrame) -> List[List[Any]]:
+    """Return the columns of ``df`` as lists with :func:`normalize_sheet_value` applied to every cell.
+
+    Each column is one list pass with a fast path for ``str`` cells, avoiding per-cell dispatch
+    and a second DataFrame; pandas' ``.str`` accessor measured slower than this for sheet-sized
+    frames. Columns are returned in ``df.columns`` order.
+    """
+    return [
+        [(value.strip() or None) if isinstance(value, str) else normalize_sheet_value(value) for value in df[column].tolist()]
+        for column in df.columns
+    ]
+
+
+def _add_note_and_format(worksheet, a1_address: str, note_text: str | None = None, link_uri: str | None = None) -> None:
+    """Insert a note and apply formatting (fontSize=8 and optional link) to a cell.
+
+    This helper swallows exceptions and logs failures at debug level.
+    """
+    try:
+        if note_text:
+            worksheet.insert_note(a1_address, note_text)
+        fmt: dict[str, Any] = {"textFormat": {"fontSize": 8}}
+        if link_uri:
+            # nest link under textFormat if requested (gspread accepts this structure)
+            fmt["textFormat"]["link"] = {"uri": link_uri}
+        worksheet.format(a1_address, fmt)
+    except Exception:
+        dn_sync_logger.debug("Failed to add note/format to cell %s", a1_address)
+
+
+def apply_repeat_cell_requests(spreadsheet, batch_requests: List[dict[str, Any]]) -> None:
+    """Send repeatCell requests in one batchUpdate, falling back to per-cell writes on failure."""
+    try:
+        # The pooled REST client reuses its connection across writes, unlike the per-call gspread session.
+        sheets_batch_update(spreadsheet.id, batch_requests)
+    except Exception as bexc:
+        # fallback: try to write individually if batch fails
+        dn_sync_logger.exception("Batch update failed, falling back to per-cell updates: %s", bexc)
+        worksheets: dict[int, Any] = {}
+        for req in batch_requests:
+            try:
+                r = req.get("repeatCell")
+                rng = r.get("range")
+                cell = r.get("cell")
+                sheet_id = rng.get("sheetId")
+                worksheet = worksheets.get(sheet_id)
+                if worksheet is None:
+                    worksheet = worksheets[sheet_id] = spreadsheet.get_worksheet_by_id(sheet_id)
+                # convert range to a1
+                r0 = rng.get("startRowIndex") + 1
+                c0 = rng.get("startColumnIndex") + 1
+                a1 = gspread.utils.rowcol_to_a1(r0, c0)
+                # write value if present
+                val = None
+                if cell and cell.get("userEnteredValue"):
+                    val = cell.get("userEnteredValue").get("stringValue")
+                if val is not None:
+                    worksheet.update_cell(r0, c0, val)
+                # add note & format
+                _add_note_and_format(worksheet, a1, note_text=NOTE_TEXT, link_uri=NOTE_LINK_URI)
+            except Exception:
+                dn_sync_logger.exception("Fallback per-cell write failed for request: %s", req)
+
+
+_sheet_cache_lock = threading.Lock()
+_sheet_cache: tuple[Any, dict[str, Any], float] | None = None
+
+
+def reset_sheet_cache() -> None:
+    """Drop the cached spreadsheet/worksheet handles so the next sync reopens them."""
+    global _sheet_cache
+    with _sheet_cache_lock:
+        _sheet_cache = None
+
+
+def _open_spreadsheet_cached(*, refresh: bool = False) -> tuple[Any, dict[str, Any]]:
+    """Return ``(spreadsheet, worksheets_by_title)``, reopening after the TTL or on ``refresh``."""
+    global _sheet_cache
+    with _sheet_cache_lock:
+        cached = _sheet_cache
+        if refresh or cached is None or monotonic() - cached[2] >= SPREADSHEET_CACHE_TTL_SECONDS:
+            sh = get_gspread_client().open_by_url(SPREADSHEET_URL)
+            worksheets = sh.worksheets()
+            # Whenever we enumerate worksheets, refresh the sheet name->id mapping
+            try:
+                state.update_gs_map_from_sheets(worksheets)
+            except Exception:
+                dn_sync_logger.debug("Failed to refresh gs_sheet_name_to_id_map while opening spreadsheet")
+            cached = _sheet_cache = (sh, {ws.title: ws for ws in worksheets}, monotonic())
+        return cached[0], cached[1]
+
+
+def _get_worksheet_cached(sheet_name: str) -> tuple[Any, Any]:
+    """Return ``(spreadsheet, worksheet)``; an unknown title triggers one reopen in case the sheet is new."""
+    sh, worksheets = _open_spreadsheet_cached()
+    worksheet = worksheets.get(sheet_name)
+    if worksheet is None:
+        sh, worksheets = _open_spreadsheet_cached(refresh=True)
+        worksheet = worksheets.get(sheet_name)
+        if worksheet is None:
+            raise gspread.exceptions.WorksheetNotFound(sheet_name)
+    return sh, worksheet
+
+
 def sync_dn_record_to_sheet(
     sheet_name: str,
     row_index: int,
@@ -152,69 +317,31 @@ def sync_dn_record_to_sheet(
     remark: str | None = None,
     updated_by: str | None = None,
     phone_number: str | None = None,
+    batcher: SheetWriteBatcher | None = None,
 ) -> dict[str, Any]:
-    """一次性写入 status_delivery、status_site、remark、updated_by、phone_number、atd/ata 到 Google Sheet。"""
-    from app.constants import ARRIVAL_STATUSES, DEPARTURE_STATUSES
+    """一次性写入 status_delivery、status_site、remark、updated_by、phone_number、atd/ata 到 Google Sheet。
+
+    When ``batcher`` is given the cell writes are queued on it and flushed together
+    with other pending updates instead of being sent immediately; the result then
+    carries ``queued=True`` and ``updated=False``, as the flush outcome is not known yet.
+    """
+    from app.constants import STATUS_TIMESTAMP_FIELD
 
     column_names = get_sheet_columns()
     result: dict[str, Any] = {}
     try:
-        def _add_note_and_format(worksheet, a1_address: str, note_text: str | None = None, link_uri: str | None = None) -> None:
-            """Insert a note and apply formatting (fontSize=8 and optional link) to a cell.
+        sh, worksheet = _get_worksheet_cached(sheet_name)
+        column_positions = {name: position for position, name in enumerate(column_names, start=1)}
+        dn_column_position = column_positions["dn_number"]
+        if "status_delivery" not in column_positions:
+            raise ValueError("status_delivery column not found in sheet definition")
 
-            This helper swallows exceptions and logs failures at debug level.
-            """
-            try:
-                if note_text:
-                    worksheet.insert_note(a1_address, note_text)
-                fmt: dict[str, Any] = {"textFormat": {"fontSize": 8}}
-                if link_uri:
-                    # nest link under textFormat if requested (gspread accepts this structure)
-                    fmt["textFormat"]["link"] = {"uri": link_uri}
-                worksheet.format(a1_address, fmt)
-            except Exception:
-                dn_sync_logger.debug("Failed to add note/format to cell %s", a1_address)
+        # 校验 DN 行: one read of the DN column serves both the row check and the search below.
+        dn_column_values = worksheet.col_values(dn_column_position)
+        expected_cell = dn_column_values[row_index - 1] if 0 < row_index <= len(dn_column_values) else None
 
-        gc = create_gspread_client()
-        sh = gc.open_by_url(SPREADSHEET_URL)
-        # When we open the spreadsheet for an update, refresh the sheet name->id mapping
-        try:
-            state.update_gs_map_from_sheets(sh.worksheets())
-        except Exception:
-            dn_sync_logger.debug("Failed to refresh gs_sheet_name_to_id_map during sync_dn_record_to_sheet")
-        worksheet = sh.worksheet(sheet_name)
-        dn_column_position = column_names.index("dn_number") + 1
-        status_delivery_column_position = column_names.index("status_delivery") + 1
-        status_site_column_position = None
-        if "status_site" in column_names:
-            status_site_column_position = column_names.index("status_site") + 1
-        issue_remark_column_position = None
-        if "issue_remark" in column_names:
-            issue_remark_column_position = column_names.index("issue_remark") + 1
-        driver_contact_name_column_position = None
-        if "driver_contact_name" in column_names:
-            driver_contact_name_column_position = column_names.index("driver_contact_name") + 1
-        driver_contact_number_column_position = None
-        if "driver_contact_number" in column_names:
-            driver_contact_number_column_position = column_names.index("driver_contact_number") + 1
-        atd_column_position = None
-        ata_column_position = None
-        if "actual_depart_from_start_point_atd" in column_names:
-            atd_column_position = column_names.index("actual_depart_from_start_point_atd") + 1
-        if "actual_arrive_time_ata" in column_names:
-            ata_column_position = column_names.index("actual_arrive_time_ata") + 1
-
-        # 校验 DN 行
-        found_cell_value = False
-        try:
-            dn_cell_value = worksheet.cell(row_index, dn_column_position).value
-            normalized_sheet_dn = normalize_dn(dn_cell_value or "")
-        except Exception:
-            found_cell_value = False
-
-        if not found_cell_value or normalized_sheet_dn != dn_number:
+        if normalize_dn(expected_cell or "") != dn_number:
             # 查找正确行
-            dn_column_values = worksheet.col_values(dn_column_position)
             found_matches = [
                 idx for idx, value in enumerate(dn_column_values, start=1) if normalize_dn(value or "") == dn_number
             ]
@@ -252,63 +379,39 @@ def sync_dn_record_to_sheet(
                 }
             )
 
-        # Prepare values to write
-        if status_delivery is not None:
-            _add_repeat_cell_request(status_delivery_column_position, status_delivery)
-            result["status_delivery_updated"] = True
-        if status_site_column_position is not None and status_site is not None:
-            _add_repeat_cell_request(status_site_column_position, status_site)
-            result["status_site_updated"] = True
-        if issue_remark_column_position is not None and remark is not None:
-            _add_repeat_cell_request(issue_remark_column_position, remark)
-            result["issue_remark_updated"] = True
-        if driver_contact_name_column_position is not None and updated_by is not None:
-            _add_repeat_cell_request(driver_contact_name_column_position, updated_by)
-            result["driver_contact_name_updated"] = True
-        if driver_contact_number_column_position is not None and phone_number is not None:
-            _add_repeat_cell_request(driver_contact_number_column_position, phone_number)
-            result["driver_contact_number_updated"] = True
+        # Prepare values to write: (sheet column, new value); columns missing from the sheet are skipped.
+        field_values = (
+            ("status_delivery", status_delivery),
+            ("status_site", status_site),
+            ("issue_remark", remark),
+            ("driver_contact_name", updated_by),
+            ("driver_contact_number", phone_number),
+        )
+        for column_name, value in field_values:
+            column_position = column_positions.get(column_name)
+            if column_position is not None and value is not None:
+                _add_repeat_cell_request(column_position, value)
+                result[f"{column_name}_updated"] = True
 
         # 写 atd/ata
-        status_delivery_upper = (status_delivery or "").strip().upper()
-        now_gmt7 = datetime.now(TZ_GMT7)
-        timestamp_str = f"{now_gmt7.month}/{now_gmt7.day}/{now_gmt7.year} {now_gmt7.hour}:{now_gmt7.minute:02d}:{now_gmt7.second:02d}"
-        if status_delivery_upper in ARRIVAL_STATUSES and ata_column_position is not None:
-            _add_repeat_cell_request(ata_column_position, timestamp_str)
-            result["actual_arrive_time_ata_updated"] = True
-        if status_delivery_upper in DEPARTURE_STATUSES and atd_column_position is not None:
-            _add_repeat_cell_request(atd_column_position, timestamp_str)
-            result["actual_depart_from_start_point_atd_updated"] = True
+        timestamp_field = STATUS_TIMESTAMP_FIELD.get((status_delivery or "").strip().upper())
+        timestamp_column_position = column_positions.get(timestamp_field) if timestamp_field else None
+        if timestamp_column_position is not None:
+            _add_repeat_cell_request(timestamp_column_position, current_sheet_timestamp_gmt7())
+            result[f"{timestamp_field}_updated"] = True
 
         # 添加 note 和 hyperlink 到 status_delivery cell
-        # Execute batch update (single request containing all repeatCell requests)
-        if batch_requests:
-            try:
-                sh.batch_update({"requests": batch_requests})
-            except Exception as bexc:
-                # fallback: try to write individually if batch fails
-                dn_sync_logger.exception("Batch update failed, falling back to per-cell updates: %s", bexc)
-                for req in batch_requests:
-                    try:
-                        r = req.get("repeatCell")
-                        rng = r.get("range")
-                        cell = r.get("cell")
-                        # convert range to a1
-                        r0 = rng.get("startRowIndex") + 1
-                        c0 = rng.get("startColumnIndex") + 1
-                        a1 = gspread.utils.rowcol_to_a1(r0, c0)
-                        # write value if present
-                        val = None
-                        if cell and cell.get("userEnteredValue"):
-                            val = cell.get("userEnteredValue").get("stringValue")
-                        if val is not None:
-                            worksheet.update_cell(r0, c0, val)
-                        # add note & format
-                        _add_note_and_format(worksheet, a1, note_text=NOTE_TEXT, link_uri=NOTE_LINK_URI)
-                    except Exception:
-                        dn_sync_logger.exception("Fallback per-cell write failed for request: %s", req)
-
-        result["updated"] = True
+        # Execute batch update (single request containing all repeatCell requests),
+        # or hand the requests to the batcher so bursts share one batchUpdate call.
+        if batch_requests and batcher is not None:
+            # The write happens on a later flush, so report it as queued rather than done.
+            batcher.enqueue(sh, batch_requests)
+            result["updated"] = False
+            result["queued"] = True
+        else:
+            if batch_requests:
+                apply_repeat_cell_requests(sh, batch_requests)
+            result["updated"] = True
         result["row"] = row_index
         result["sheet"] = sheet_name
         result["dn_number"] = dn_number
@@ -318,6 +421,102 @@ def sync_dn_record_to_sheet(
         return result
 
 
+def _batch_get_plan_rows(sh, plan_sheets: List[Any]) -> List[List[List[Any]]]:
+    """Read the data rows (row 4 onwards) of every plan sheet in one values.batchGet call.
+
+    Values are unformatted, so real date cells arrive as spreadsheet serial numbers
+    (see :func:`_serial_to_date`) instead of display strings that need parsing.
+    The returned list is aligned with ``plan_sheets``; a sheet without data rows maps to ``[]``.
+    """
+    if not plan_sheets:
+        return []
+    ranges = []
+    for sheet in plan_sheets:
+        last_column = gspread.utils.rowcol_to_a1(1, max(sheet.col_count, 1))[:-1]
+        ranges.append(gspread.utils.absolute_range_name(sheet.title, f"A4:{last_column}"))
+    fetch_start = perf_counter()
+    response = sh.values_batch_get(ranges, params=_UNFORMATTED_SERIAL_DATES)
+    value_ranges = response.get("valueRanges", [])
+    dn_sync_logger.debug(
+        "values_batch_get for %d plan sheets returned in %.3fs", len(plan_sheets), perf_counter() - fetch_start
+    )
+    return [
+        (value_ranges[index].get("values", []) if index < len(value_ranges) else [])
+        for index in range(len(plan_sheets))
+    ]
+
+
+_UNPARSED = object()
+
+
+def _pod_row_indices(values: List[List[Any]], status_delivery_index: int) -> List[int]:
+    """Return positions in ``values`` whose status_delivery cell is POD (case/whitespace-insensitive)."""
+    return [
+        index
+        for index, row in enumerate(values)
+        if len(row) > status_delivery_index
+        and isinstance(row[status_delivery_index], str)
+        and row[status_delivery_index].strip().upper() == "POD"
+    ]
+
+
+def _serial_to_date(serial: int | float) -> date:
+    """Convert a Sheets date serial number (days since 1899-12-30) to a date."""
+    return _SHEETS_EPOCH + timedelta(days=int(serial))
+
+
+def _plan_mos_serial(plan_cell: Any) -> int | None:
+    """Return a Plan MOS date cell as a Sheets day serial, or None when it is not a date.
+
+    Serial numbers are used as-is; text goes through the sheet formats, then pandas' parser.
+    """
+    if isinstance(plan_cell, (int, float)) and not isinstance(plan_cell, bool):
+        return int(plan_cell)
+    parsed_plan = parse_date(plan_cell)
+    if isinstance(parsed_plan, datetime):
+        return (parsed_plan.date() - _SHEETS_EPOCH).days
+    try:
+        pandas_date = pd.to_datetime(plan_cell, errors="coerce")
+    except Exception:
+        pandas_date = None
+    if pandas_date is not None and not pd.isna(pandas_date):
+        return (pandas_date.date() - _SHEETS_EPOCH).days
+    return None
+
+
+def _batch_update_with_backoff(sh, requests: List[dict[str, Any]]) -> None:
+    """Send one batchUpdate, retrying rate-limit and transient API errors with exponential backoff."""
+    delay = 1.0
+    for attempt in range(1, ARCHIVE_UPDATE_MAX_ATTEMPTS + 1):
+        try:
+            sh.batch_update({"requests": requests})
+            return
+        except gspread.exceptions.APIError as exc:
+            if exc.code not in _RETRYABLE_API_ERROR_CODES or attempt == ARCHIVE_UPDATE_MAX_ATTEMPTS:
+                raise
+            logger.warning(
+                "Archive batch_update failed with %s (attempt %d/%d); retrying in %.0fs",
+                exc.code,
+                attempt,
+                ARCHIVE_UPDATE_MAX_ATTEMPTS,
+                delay,
+            )
+            sleep(delay)
+            delay *= 2
+
+
+def _send_archive_batches(sh, request_batches: List[List[dict[str, Any]]]) -> None:
+    """Send the archive formatting batches, several at a time when there is more than one."""
+    if len(request_batches) <= 1:
+        for requests in request_batches:
+            _batch_update_with_backoff(sh, requests)
+        return
+    workers = min(ARCHIVE_UPDATE_MAX_WORKERS, len(request_batches))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="archive-format") as executor:
+        # Consuming the iterator re-raises the first failed batch.
+        list(executor.map(lambda requests: _batch_update_with_backoff(sh, requests), request_batches))
+
+
 def mark_plan_mos_rows_for_archiving(threshold_days: int | None = None) -> dict[str, Any]:
     """Mark rows for archiving where plan_mos_date is older than threshold and status_delivery is POD."""
     if threshold_days is None:
@@ -341,7 +540,7 @@ def mark_plan_mos_rows_for_archiving(threshold_days: int | None = None) -> dict[
         threshold_date.isoformat(),
     )
 
-    gc = create_gspread_client()
+    gc = get_gspread_client()
     sh = gc.open_by_url(SPREADSHEET_URL)
     plan_sheets = fetch_plan_sheets(sh)
     # keep the in-memory sheet name -> id mapping up-to-date
@@ -356,83 +555,83 @@ def mark_plan_mos_rows_for_archiving(threshold_days: int | None = None) -> dict[
     affected_rows: List[dict[str, Any]] = []
     pending_requests: List[dict[str, Any]] = []
 
+    request_batches: List[List[dict[str, Any]]] = []
+
     def flush_requests() -> None:
         if not pending_requests:
             return
-        sh.batch_update({"requests": list(pending_requests)})
+        request_batches.append(list(pending_requests))
         pending_requests.clear()
 
-    for sheet in plan_sheets:
-        values = sheet.get_all_values()
-        if len(values) <= 3:
+    sheet_values = _batch_get_plan_rows(sh, plan_sheets)
+    # Plan dates are compared as Sheets day serials: plain ints, no date objects per row.
+    threshold_serial = (threshold_date - _SHEETS_EPOCH).days
+    plan_serials: dict[Any, int | None] = {}
+
+    for sheet, values in zip(plan_sheets, sheet_values):
+        if not values:
             continue
 
         sheet_column_count = getattr(sheet, "col_count", None) or max((len(row) for row in values), default=0)
         effective_color_range_end = max(sheet_column_count, 0)
 
-        for row_offset, row_values in enumerate(values[3:], start=4):
-            if not row_values:
-                continue
-            if not any((cell or "").strip() for cell in row_values):
-                continue
-
+        for row_index in _pod_row_indices(values, status_delivery_index):
+            row_values = values[row_index]
             plan_cell = row_values[plan_mos_index] if len(row_values) > plan_mos_index else ""
-            status_cell = row_values[status_delivery_index] if len(row_values) > status_delivery_index else ""
+            status_cell = row_values[status_delivery_index]
             if not plan_cell:
                 continue
 
-            parsed_plan = parse_date(plan_cell)
-            plan_date_value: date | None = None
-            if isinstance(parsed_plan, datetime):
-                plan_date_value = parsed_plan.date()
-            else:
-                try:
-                    pandas_date = pd.to_datetime(plan_cell, errors="coerce")
-                except Exception:
-                    pandas_date = None
-                if pandas_date is not None and not pd.isna(pandas_date):
-                    plan_date_value = pandas_date.date()
-
-            if plan_date_value is None or plan_date_value >= threshold_date:
-                continue
-
-            if (status_cell or "").strip().upper() != "POD":
+            plan_serial = plan_serials.get(plan_cell, _UNPARSED)
+            if plan_serial is _UNPARSED:
+                plan_serial = plan_serials[plan_cell] = _plan_mos_serial(plan_cell)
+            if plan_serial is None or plan_serial >= threshold_serial:
                 continue
 
             matched_rows += 1
-            row_number = row_offset
+            row_number = row_index + 4
             row_start_index = row_number - 1
 
             entry: dict[str, Any] = {
                 "sheet": sheet.title,
                 "row": row_number,
-                "plan_mos_date": plan_cell,
+                "plan_mos_date": plan_cell if isinstance(plan_cell, str) else _serial_to_date(plan_serial).strftime("%d %b %y"),
                 "status_delivery": status_cell,
             }
             if effective_color_range_end > 0:
-                pending_requests.append(
-                    {
-                        "repeatCell": {
-                            "range": {
-                                "sheetId": sheet.id,
-                                "startRowIndex": row_start_index,
-                                "endRowIndex": row_start_index + 1,
-                                "startColumnIndex": 0,
-                                "endColumnIndex": effective_color_range_end,
-                            },
-                            "cell": {
-                                "userEnteredFormat": {
-                                    "textFormat": {
-                                        "foregroundColor": ARCHIVE_TEXT_COLOR,
-                                        "fontSize": 8,
-                                        "link": {"uri": NOTE_LINK_URI},
+                previous_range = pending_requests[-1]["repeatCell"]["range"] if pending_requests else None
+                if (
+                    previous_range is not None
+                    and previous_range["sheetId"] == sheet.id
+                    and previous_range["endRowIndex"] == row_start_index
+                    and previous_range["endColumnIndex"] == effective_color_range_end
+                ):
+                    # Rows are scanned top-down, so a run of adjacent matches grows one range.
+                    previous_range["endRowIndex"] = row_start_index + 1
+                else:
+                    pending_requests.append(
+                        {
+                            "repeatCell": {
+                                "range": {
+                                    "sheetId": sheet.id,
+                                    "startRowIndex": row_start_index,
+                                    "endRowIndex": row_start_index + 1,
+                                    "startColumnIndex": 0,
+                                    "endColumnIndex": effective_color_range_end,
+                                },
+                                "cell": {
+                                    "userEnteredFormat": {
+                                        "textFormat": {
+                                            "foregroundColor": ARCHIVE_TEXT_COLOR,
+                                            "fontSize": 8,
+                                            "link": {"uri": NOTE_LINK_URI},
+                                        }
                                     }
-                                }
-                            },
-                            "fields": "userEnteredFormat.textFormat.foregroundColor,userEnteredFormat.textFormat.fontSize,userEnteredFormat.textFormat.link",
+                                },
+                                "fields": "userEnteredFormat.textFormat.foregroundColor,userEnteredFormat.textFormat.fontSize,userEnteredFormat.textFormat.link",
+                            }
                         }
-                    }
-                )
+                    )
                 formatted_rows += 1
                 entry["formatted"] = True
             else:
@@ -444,6 +643,7 @@ def mark_plan_mos_rows_for_archiving(threshold_days: int | None = None) -> dict[
                 flush_requests()
 
     flush_requests()
+    _send_archive_batches(sh, request_batches)
 
     logger.info("Matched %d rows for archiving criteria; formatted %d rows", matched_rows, formatted_rows)
 
@@ -0,0 +1,102 @@
+"""Coalesce Google Sheet cell writes into windowed batchUpdate calls.
+
+Bursts of DN updates each produce a handful of repeatCell requests. Instead of
+sending one ``spreadsheets.batchUpdate`` per DN, pending requests are buffered
+per spreadsheet and flushed together once the window elapses or enough rows
+have accumulated, keeping us well under the Sheets write quota.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import defaultdict
+from typing import Any, List
+
+from app.core.sheet import apply_repeat_cell_requests
+from app.utils.logging import dn_sync_logger
+
+__all__ = [
+    "SHEET_BATCH_WINDOW_SECONDS",
+    "SHEET_BATCH_MAX_ROWS",
+    "SheetWriteBatcher",
+    "sheet_write_batcher",
+]
+
+SHEET_BATCH_WINDOW_SECONDS = 0.5
+SHEET_BATCH_MAX_ROWS = 100
+
+
+class SheetWriteBatcher:
+    """Thread-safe buffer of repeatCell requests keyed by spreadsheet id.
+
+    ``enqueue`` is called from the sheet-sync worker threads; a timer flushes
+    each spreadsheet's buffer after ``window_seconds`` and a full buffer is
+    flushed immediately by the thread that filled it.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float = SHEET_BATCH_WINDOW_SECONDS,
+        max_rows: int = SHEET_BATCH_MAX_ROWS,
+    ) -> None:
+        self.window_seconds = window_seconds
+        self.max_rows = max_rows
+        self._lock = threading.Lock()
+        self._pending: defaultdict[str, List[dict[str, Any]]] = defaultdict(list)
+        self._row_counts: defaultdict[str, int] = defaultdict(int)
+        self._spreadsheets: dict[str, Any] = {}
+        self._timers: dict[str, threading.Timer] = {}
+
+    def enqueue(self, spreadsheet, requests: List[dict[str, Any]]) -> None:
+        """Buffer the repeatCell ``requests`` produced for one DN row."""
+        key = spreadsheet.id
+        with self._lock:
+            self._pending[key].extend(requests)
+            self._row_counts[key] += 1
+            self._spreadsheets[key] = spreadsheet
+            if self._row_counts[key] < self.max_rows:
+                if key not in self._timers:
+                    timer = threading.Timer(self.window_seconds, self.flush, args=(key,))
+                    timer.daemon = True
+                    self._timers[key] = timer
+                    timer.start()
+                return
+            batch = self._take(key)
+        self._send(*batch)
+
+    def flush(self, key: str) -> None:
+        """Send everything buffered for spreadsheet ``key``."""
+        with self._lock:
+            batch = self._take(key)
+        self._send(*batch)
+
+    def flush_all(self) -> None:
+        """Send every pending buffer, e.g. on shutdown."""
+        with self._lock:
+            batches = [self._take(key) for key in list(self._pending)]
+        for batch in batches:
+            self._send(*batch)
+
+    def _take(self, key: str) -> tuple[Any, List[dict[str, Any]], int]:
+        # Caller must hold ``self._lock``.
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        return (
+            self._spreadsheets.pop(key, None),
+            self._pending.pop(key, []),
+            self._row_counts.pop(key, 0),
+        )
+
+    @staticmethod
+    def _send(spreadsheet, requests: List[dict[str, Any]], row_count: int) -> None:
+        if spreadsheet is None or not requests:
+            return
+        try:
+            apply_repeat_cell_requests(spreadsheet, requests)
+            dn_sync_logger.debug("Flushed %d sheet rows in one batchUpdate (%d requests)", row_count, len(requests))
+        except Exception:
+            dn_sync_logger.exception("Failed to flush %d batched sheet rows", row_count)
+
+
+sheet_write_batcher = SheetWriteBatcher()
@@ -0,0 +1,85 @@
+"""Bounded background execution for Google Sheet write-backs.
+
+DN updates hand their sheet sync work to a fixed-size queue drained by a small
+thread pool, so slow Google Sheets round-trips never occupy request workers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable
+
+from app.core.sheet_batcher import sheet_write_batcher
+from app.core.sheets_api import close_sheets_api_client
+from app.utils.logging import logger
+
+__all__ = [
+    "SHEET_SYNC_MAX_WORKERS",
+    "SHEET_SYNC_QUEUE_SIZE",
+    "start_sheet_sync_worker",
+    "stop_sheet_sync_worker",
+    "submit_sheet_sync",
+]
+
+SHEET_SYNC_MAX_WORKERS = 4
+SHEET_SYNC_QUEUE_SIZE = 1024
+
+_executor: ThreadPoolExecutor | None = None
+_queue: asyncio.Queue[Callable[[], Any]] | None = None
+_workers: list[asyncio.Task[None]] = []
+
+
+async def _consume(queue: asyncio.Queue[Callable[[], Any]], executor: ThreadPoolExecutor) -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+        job = await queue.get()
+        try:
+            await loop.run_in_executor(executor, job)
+        except Exception:
+            logger.exception("Google Sheet background job failed")
+        finally:
+            queue.task_done()
+
+
+async def start_sheet_sync_worker() -> None:
+    """Create the executor/queue pair and spawn the consumer coroutines."""
+    global _executor, _queue
+    if _queue is not None:
+        return
+    _executor = ThreadPoolExecutor(max_workers=SHEET_SYNC_MAX_WORKERS, thread_name_prefix="sheet-sync")
+    _queue = asyncio.Queue(maxsize=SHEET_SYNC_QUEUE_SIZE)
+    for _ in range(SHEET_SYNC_MAX_WORKERS):
+        _workers.append(asyncio.create_task(_consume(_queue, _executor)))
+
+
+async def stop_sheet_sync_worker() -> None:
+    """Cancel the consumers, flush batched sheet writes and release the executor and HTTP pool."""
+    global _executor, _queue
+    for task in _workers:
+        task.cancel()
+    await asyncio.gather(*_workers, return_exceptions=True)
+    _workers.clear()
+    await asyncio.to_thread(sheet_write_batcher.flush_all)
+    close_sheets_api_client()
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+    _executor = None
+    _queue = None
+
+
+def submit_sheet_sync(func: Callable[..., Any], /, *args: Any, **kwargs: Any) -> bool:
+    """Queue ``func`` for the sheet-sync pool; return False when it was not accepted.
+
+    Must be called from the event loop thread. Callers should fall back to running
+    the job themselves when the worker is not started or the queue is full.
+    """
+    if _queue is None:
+        return False
+    try:
+        _queue.put_nowait(partial(func, *args, **kwargs))
+    except asyncio.QueueFull:
+        logger.warning("Google Sheet sync queue is full (%d jobs)", SHEET_SYNC_QUEUE_SIZE)
+        return False
+    return True
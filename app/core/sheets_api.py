@@ -0,0 +1,86 @@
+"""Direct Google Sheets REST calls over a long-lived HTTP connection pool.
+
+The process-wide gspread client (see :func:`app.core.google.get_gspread_client`) is
+rebuilt, with a new ``requests`` session and TLS handshake, each time it ages out.
+Calls sent from here reuse one keep-alive ``httpx.Client`` and one service-account
+token for the whole process lifetime.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+from urllib.parse import quote
+
+import httpx
+import orjson
+from google.auth.transport.requests import Request as GoogleAuthRequest
+from google.oauth2.service_account import Credentials
+
+from app.core.google import load_service_account_info
+
+__all__ = ["SHEETS_API_BASE_URL", "sheets_batch_update", "sheets_values_get", "close_sheets_api_client"]
+
+SHEETS_API_BASE_URL = "https://sheets.googleapis.com/v4/spreadsheets"
+SHEETS_API_SCOPES = ("https://www.googleapis.com/auth/spreadsheets",)
+SHEETS_API_TIMEOUT = 10.0
+
+_lock = threading.Lock()
+_client: httpx.Client | None = None
+_credentials: Credentials | None = None
+
+
+def _get_client() -> httpx.Client:
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                _client = httpx.Client(base_url=SHEETS_API_BASE_URL, timeout=SHEETS_API_TIMEOUT)
+    return _client
+
+
+def _authorization_header() -> dict[str, str]:
+    global _credentials
+    with _lock:
+        if _credentials is None:
+            _credentials = Credentials.from_service_account_info(
+                load_service_account_info(), scopes=SHEETS_API_SCOPES
+            )
+        if not _credentials.valid:
+            _credentials.refresh(GoogleAuthRequest())
+        return {"Authorization": f"Bearer {_credentials.token}"}
+
+
+def sheets_batch_update(spreadsheet_id: str, requests: list[dict[str, Any]]) -> dict[str, Any]:
+    """POST ``spreadsheets.batchUpdate`` and return the decoded response."""
+    response = _get_client().post(
+        f"/{spreadsheet_id}:batchUpdate",
+        json={"requests": requests},
+        headers=_authorization_header(),
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+def sheets_values_get(spreadsheet_id: str, range_name: str) -> list[list[Any]]:
+    """GET ``spreadsheets.values`` for ``range_name`` and return the raw row lists.
+
+    Only the ``values`` field is requested and the body is decoded with orjson; rows keep
+    the API's trimming (trailing empty cells and rows are omitted), so callers pad as needed.
+    """
+    response = _get_client().get(
+        f"/{spreadsheet_id}/values/{quote(range_name, safe='')}",
+        params={"majorDimension": "ROWS", "fields": "values"},
+        headers=_authorization_header(),
+    )
+    response.raise_for_status()
+    return orjson.loads(response.content).get("values", [])
+
+
+def close_sheets_api_client() -> None:
+    """Close the pooled connections, e.g. on application shutdown."""
+    global _client
+    with _lock:
+        client, _client = _client, None
+    if client is not None:
+        client.close()
@@ -3,15 +3,19 @@
 from __future__ import annotations
 
 import asyncio
+import io
+import logging
 import traceback
 from dataclasses import dataclass
+from operator import attrgetter, itemgetter
 from decimal import Decimal, InvalidOperation
 from datetime import datetime
 from time import perf_counter
-from typing import Any, List, Mapping, Tuple
+from typing import Any, Callable, List, Mapping, Tuple
 from decimal import Decimal, InvalidOperation
 
-from sqlalchemy import func
+import pandas as pd
+from sqlalchemy import column, exists, func, select, table, update
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
@@ -24,16 +28,17 @@ from app.constants import (
     VALID_STATUS_DESCRIPTION,
     VEHICLE_VALID_STATUSES,
 )
-from app.core.google import SPREADSHEET_URL, create_gspread_client
+from app.core.google import SPREADSHEET_URL, get_gspread_client
 from app.core.sheet import (
     process_all_sheets,
-    normalize_sheet_value,
+    normalize_sheet_columns,
     parse_date,
 )
-from app.crud import create_dn_sync_log, get_dn_map_by_numbers, get_latest_dn_records_map, _ACTIVE_DN_EXPR
-from app.db import SessionLocal
+from app.crud import create_dn_sync_log, get_dn_rows_by_numbers, get_latest_dn_record_locations_map, _ACTIVE_DN_EXPR
+from app.db import SessionLocal, uses_postgresql
 from app.dn_columns import get_mutable_dn_columns
 from app.models import DN, Vehicle
+from app.settings import settings
 from app.utils.logging import dn_sync_logger, logger
 from app.utils.string import normalize_dn
 from app.utils.time import to_gmt7_iso, TZ_GMT7
@@ -53,11 +58,21 @@ __all__ = [
     "scheduled_dn_sheet_sync",
     "normalize_database_fields",
     "serialize_vehicle",
+    "serialize_vehicle_mapping",
     "_normalize_status_delivery_value",
     "is_in_maintenance_window",
 ]
 
 
+# Upper bound on DN payloads sent per INSERT/UPDATE executemany during a sheet sync.
+DN_SYNC_WRITE_CHUNK_SIZE = 5000
+# Session-local table holding the sheet's DN numbers while is_deleted flags are updated.
+_SHEET_DN_NUMBERS_TABLE = "_sync_sheet_dn_numbers"
+# Larger create batches are COPYed through this staging table instead of a multi-row INSERT.
+DN_SYNC_COPY_THRESHOLD = 1000
+_DN_STAGING_TABLE = "_sync_dn_staging"
+
+
 @dataclass
 class DnSyncResult:
     """Aggregated DN sync outcome."""
@@ -118,6 +133,14 @@ def _log_sheet_diff(action: str, dn_number: str, entries: Mapping[str, Tuple[Any
     dn_sync_logger.info("sheet_diff action=%s dn=%s changes=%s", action, dn_number, formatted)
 
 
+# Exact spellings the sheet commonly carries, mapped straight to their canonical value.
+_STATUS_DELIVERY_FAST_LOOKUP: dict[str, str] = {
+    variant: canonical
+    for key, canonical in STATUS_DELIVERY_LOOKUP.items()
+    for variant in {key, key.upper(), key.title(), canonical}
+}
+
+
 def _normalize_status_delivery_value(raw_value: str | None) -> str | None:
     """Normalize delivery status input to standard values.
 
@@ -136,13 +159,17 @@ def _normalize_status_delivery_value(raw_value: str | None) -> str | None:
     if not isinstance(raw_value, str):
         return raw_value
 
+    canonical = _STATUS_DELIVERY_FAST_LOOKUP.get(raw_value)
+    if canonical is not None:
+        return canonical
+
     # Trim and normalize whitespace
     trimmed = " ".join(raw_value.split())
     if not trimmed:
         return None
 
     # Check if it's a standard value (case-insensitive)
-    normalized = STATUS_DELIVERY_LOOKUP.get(trimmed.lower())
+    normalized = STATUS_DELIVERY_LOOKUP.get(trimmed.casefold())
     if normalized:
         return normalized
 
@@ -154,31 +181,47 @@ def normalize_database_fields(db: Session) -> None:
     """Normalize plan_mos_date and status_delivery fields in database."""
     dn_sync_logger.debug("Starting database field normalization")
 
-    dn_entries = db.query(DN).filter(DN.plan_mos_date.isnot(None)).filter(_ACTIVE_DN_EXPR).all()
+    # One projected scan covers both fields; values are normalized once per distinct value.
+    rows = db.execute(select(DN.id, DN.plan_mos_date, DN.status_delivery).where(_ACTIVE_DN_EXPR)).all()
+    plan_date_cache: dict[str, str | None] = {}
+    status_cache: dict[Any, Any] = {}
+    update_payloads: List[dict[str, Any]] = []
     normalized_plan_dates = 0
+    normalized_status_delivery = 0
 
-    for entry in dn_entries:
-        raw_value = entry.plan_mos_date.strip() if entry.plan_mos_date else None
-        if not raw_value:
-            continue
-        parsed_value = parse_date(raw_value)
-        if isinstance(parsed_value, datetime):
-            normalized_value = parsed_value.strftime("%d %b %y")
-            if normalized_value != entry.plan_mos_date:
-                entry.plan_mos_date = normalized_value
+    for dn_id, plan_mos_date, status_delivery in rows:
+        payload: dict[str, Any] = {}
+
+        if plan_mos_date:
+            if plan_mos_date in plan_date_cache:
+                normalized_plan = plan_date_cache[plan_mos_date]
+            else:
+                raw_value = plan_mos_date.strip()
+                parsed_value = parse_date(raw_value) if raw_value else None
+                normalized_plan = parsed_value.strftime("%d %b %y") if isinstance(parsed_value, datetime) else None
+                plan_date_cache[plan_mos_date] = normalized_plan
+            if normalized_plan is not None and normalized_plan != plan_mos_date:
+                payload["plan_mos_date"] = normalized_plan
                 normalized_plan_dates += 1
 
-    status_entries = db.query(DN).filter(_ACTIVE_DN_EXPR).all()
-    normalized_status_delivery = 0
-    for entry in status_entries:
-        normalized_value = _normalize_status_delivery_value(entry.status_delivery)
-        if normalized_value is None:
-            normalized_value = "No Status"
-        if normalized_value != entry.status_delivery:
-            entry.status_delivery = normalized_value
+        if status_delivery in status_cache:
+            normalized_status = status_cache[status_delivery]
+        else:
+            normalized_status = _normalize_status_delivery_value(status_delivery)
+            if normalized_status is None:
+                normalized_status = "No Status"
+            status_cache[status_delivery] = normalized_status
+        if normalized_status != status_delivery:
+            payload["status_delivery"] = normalized_status
             normalized_status_delivery += 1
 
-    if normalized_plan_dates or normalized_status_delivery:
+        if payload:
+            payload["id"] = dn_id
+            update_payloads.append(payload)
+
+    if update_payloads:
+        for offset in range(0, len(update_payloads), DN_SYNC_WRITE_CHUNK_SIZE):
+            db.execute(update(DN), update_payloads[offset : offset + DN_SYNC_WRITE_CHUNK_SIZE])
         db.commit()
 
     if normalized_plan_dates:
@@ -191,6 +234,189 @@ def normalize_database_fields(db: Session) -> None:
         dn_sync_logger.debug("No status_delivery values required normalization")
 
 
+def _map_distinct(values: List[Any], transform: Callable[[Any], Any]) -> List[Any]:
+    """Apply ``transform`` to a column, calling it once per distinct value."""
+    mapped = {value: transform(value) for value in set(values)}
+    return [mapped[value] for value in values]
+
+
+def _format_plan_mos_date(value: Any) -> Any:
+    """Rewrite a recognised plan_mos_date as ``%d %b %y``; anything else is kept as-is."""
+    if isinstance(value, str) and value:
+        parsed = parse_date(value)
+        if isinstance(parsed, datetime):
+            return parsed.strftime("%d %b %y")
+    return value
+
+
+def _normalize_sheet_dn_number(value: Any) -> str:
+    raw_number = str(value).strip() if value is not None else ""
+    return normalize_dn(raw_number) if raw_number else ""
+
+
+def _log_duplicate_dn_numbers(dn_numbers: pd.Series) -> None:
+    """Warn about DN numbers that appear on more than one sheet row (the last row wins)."""
+    duplicated = dn_numbers[dn_numbers.duplicated(keep=False) & (dn_numbers != "")]
+    if duplicated.empty:
+        return
+    counts = duplicated.groupby(duplicated, sort=False).size()
+    logger.warning(
+        "Found %d duplicate DN numbers in Google Sheets (later rows overwrite earlier ones): %s",
+        len(counts),
+        counts.head(5).to_dict(),  # Show first 5 duplicates
+    )
+
+
+def _build_sheet_records(combined_df: pd.DataFrame) -> Tuple[List[dict[str, Any]], int, int]:
+    """Turn the combined sheet frame into DN records.
+
+    Cells are normalized a column at a time, and plan_mos_date / status_delivery are mapped once
+    per distinct value; only the keep/skip decision and the record dict are built per row.
+    Returns ``(records, skipped_missing_number, skipped_empty_payload)``.
+    """
+    if combined_df.empty:
+        dn_sync_logger.info("Combined DataFrame is empty; no rows to process")
+        return [], 0, 0
+    sheet_columns = list(combined_df.columns)
+    if "dn_number" not in sheet_columns:
+        dn_sync_logger.warning("Sheet data missing 'dn_number' column; skipping processing")
+        return [], 0, 0
+
+    dn_index = sheet_columns.index("dn_number")
+    columns = normalize_sheet_columns(combined_df)
+    original_plan_mos_dates: List[Any] | None = None
+    if "plan_mos_date" in sheet_columns:
+        plan_mos_index = sheet_columns.index("plan_mos_date")
+        original_plan_mos_dates = columns[plan_mos_index]
+        columns[plan_mos_index] = _map_distinct(original_plan_mos_dates, _format_plan_mos_date)
+    if "status_delivery" in sheet_columns:
+        status_delivery_index = sheet_columns.index("status_delivery")
+        columns[status_delivery_index] = _map_distinct(columns[status_delivery_index], _normalize_status_delivery_value)
+    columns[dn_index] = [_normalize_sheet_dn_number(value) for value in columns[dn_index]]
+
+    columns_tuple = tuple(sheet_columns)
+    # A row has payload when any cell other than dn_number is set; dn_number is a non-empty
+    # string by the time that is checked, so every remaining None belongs to another column.
+    empty_payload_none_count = len(columns_tuple) - 1
+    # Per-row plan_mos_date tracing is only worth the call when debug logging is on.
+    trace_plan_mos_dates = original_plan_mos_dates is not None and logger.isEnabledFor(logging.DEBUG)
+    records: List[dict[str, Any]] = []
+    skipped_missing_number = 0
+    skipped_empty_payload = 0
+
+    for position, row_values in enumerate(zip(*columns)):
+        normalized_number = row_values[dn_index]
+        if not normalized_number:
+            skipped_missing_number += 1
+            continue
+        if row_values.count(None) >= empty_payload_none_count:
+            skipped_empty_payload += 1
+            continue
+
+        cleaned = dict(zip(columns_tuple, row_values))
+
+        # Log plan_mos_date processing for debugging
+        if trace_plan_mos_dates:
+            original_plan_mos_date = original_plan_mos_dates[position]
+            if isinstance(original_plan_mos_date, str) and original_plan_mos_date:
+                logger.debug(
+                    "DN %s plan_mos_date processing: original='%s' -> normalized='%s'",
+                    normalized_number,
+                    original_plan_mos_date,
+                    cleaned.get("plan_mos_date"),
+                )
+
+        records.append(cleaned)
+
+    return records, skipped_missing_number, skipped_empty_payload
+
+
+def _copy_text_field(value: Any) -> str:
+    if value is None:
+        return "\\N"
+    return str(value).replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+
+def _quote_identifier(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _copy_rows(cursor, table_name: str, columns: List[str], rows: List[Tuple[Any, ...]]) -> None:
+    """COPY ``rows`` into ``table_name`` in PostgreSQL text format; ``None`` becomes NULL."""
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write("\t".join(map(_copy_text_field, row)))
+        buffer.write("\n")
+    buffer.seek(0)
+    column_list = ", ".join(_quote_identifier(name) for name in columns)
+    cursor.copy_expert(f"COPY {table_name} ({column_list}) FROM STDIN", buffer)
+
+
+def _copy_insert_new_dns(db: Session, payloads: List[dict[str, Any]]) -> None:
+    """Insert ``payloads`` into ``dn`` through a COPYed staging table, skipping existing DN numbers.
+
+    Keys missing from a payload are loaded as NULL; columns no payload sets keep their defaults.
+    """
+    columns = list(dict.fromkeys(key for payload in payloads for key in payload))
+    column_list = ", ".join(_quote_identifier(name) for name in columns)
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.execute(
+            f"CREATE TEMP TABLE {_DN_STAGING_TABLE} ON COMMIT DROP AS SELECT {column_list} FROM dn WITH NO DATA"
+        )
+        _copy_rows(cursor, _DN_STAGING_TABLE, columns, [tuple(payload.get(name) for name in columns) for payload in payloads])
+        cursor.execute(
+            f"INSERT INTO dn ({column_list}) SELECT {column_list} FROM {_DN_STAGING_TABLE} "
+            "ON CONFLICT (dn_number) DO NOTHING"
+        )
+        cursor.execute(f"DROP TABLE {_DN_STAGING_TABLE}")
+    finally:
+        cursor.close()
+
+
+def _apply_sheet_presence(db: Session, dn_numbers: List[str]) -> Tuple[int, int]:
+    """Set is_deleted to 'N' for DNs on the sheet and 'Y' for all others.
+
+    Returns ``(reset_active_count, mark_deleted_count)``. On psycopg2 the sheet's DN
+    numbers are COPYed into a temporary table and both UPDATEs join against it,
+    instead of binding every number twice as IN / NOT IN parameters.
+    """
+    if not dn_numbers or not uses_postgresql(db, "psycopg2"):
+        reset_active_count = 0
+        if dn_numbers:
+            reset_active_count = (
+                db.query(DN)
+                .filter(DN.dn_number.in_(dn_numbers))
+                .filter(func.coalesce(DN.is_deleted, "N") != "N")
+                .update({DN.is_deleted: "N"}, synchronize_session=False)
+            )
+            missing_q = db.query(DN).filter(~DN.dn_number.in_(dn_numbers))
+        else:
+            missing_q = db.query(DN)
+        mark_deleted_count = missing_q.filter(func.coalesce(DN.is_deleted, "N") != "Y").update(
+            {DN.is_deleted: "Y"}, synchronize_session=False
+        )
+        return reset_active_count, mark_deleted_count
+
+    sheet_numbers = table(_SHEET_DN_NUMBERS_TABLE, column("dn_number"))
+    on_sheet = exists().where(sheet_numbers.c.dn_number == DN.dn_number)
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.execute(f"CREATE TEMP TABLE {_SHEET_DN_NUMBERS_TABLE} (dn_number text PRIMARY KEY) ON COMMIT DROP")
+        _copy_rows(cursor, _SHEET_DN_NUMBERS_TABLE, ["dn_number"], [(number,) for number in dn_numbers])
+        cursor.execute(f"ANALYZE {_SHEET_DN_NUMBERS_TABLE}")
+        reset_active_count = db.query(DN).filter(on_sheet).filter(func.coalesce(DN.is_deleted, "N") != "N").update(
+            {DN.is_deleted: "N"}, synchronize_session=False
+        )
+        mark_deleted_count = db.query(DN).filter(~on_sheet).filter(func.coalesce(DN.is_deleted, "N") != "Y").update(
+            {DN.is_deleted: "Y"}, synchronize_session=False
+        )
+        cursor.execute(f"DROP TABLE {_SHEET_DN_NUMBERS_TABLE}")
+    finally:
+        cursor.close()
+    return reset_active_count, mark_deleted_count
+
+
 def sync_dn_sheet_to_db(db: Session) -> DnSyncResult:
     """Synchronise Google Sheet data into the database."""
     start_time = datetime.utcnow()
@@ -198,8 +424,8 @@ def sync_dn_sheet_to_db(db: Session) -> DnSyncResult:
 
     try:
         client_start = perf_counter()
-        gc = create_gspread_client()
-        dn_sync_logger.debug("Created gspread client in %.3fs", perf_counter() - client_start)
+        gc = get_gspread_client()
+        dn_sync_logger.debug("Obtained gspread client in %.3fs", perf_counter() - client_start)
         open_start = perf_counter()
         sh = gc.open_by_url(SPREADSHEET_URL)
         dn_sync_logger.debug("Spreadsheet opened in %.3fs", perf_counter() - open_start)
@@ -213,6 +439,7 @@ def sync_dn_sheet_to_db(db: Session) -> DnSyncResult:
             combined_df["dn_number"] = combined_df["dn_number"].apply(
                 lambda x: normalize_dn(str(x).strip()) if x is not None else ""
             )
+            _log_duplicate_dn_numbers(combined_df["dn_number"])
             combined_df = combined_df.drop_duplicates(subset=["dn_number"], keep="last")
             deduplicated_rows = len(combined_df)
             if original_rows != deduplicated_rows:
@@ -228,124 +455,12 @@ def sync_dn_sheet_to_db(db: Session) -> DnSyncResult:
         raise
 
     sheet_columns: List[str] = list(combined_df.columns)
-    records: List[dict[str, Any]] = []
-    dn_numbers: set[str] = set()
-
     total_rows = len(combined_df) if not combined_df.empty else 0
-    skipped_missing_number = 0
-    skipped_empty_payload = 0
     dn_sync_logger.info("Preparing to process %d sheet rows", total_rows)
 
     processing_start = perf_counter()
-
-    row_normalization_total = 0.0
-    plan_mos_parse_total = 0.0
-    plan_mos_parse_count = 0
-    dn_normalization_total = 0.0
-    record_build_total = 0.0
-    rows_iterated = 0
-    rows_persisted = 0
-
-    if not combined_df.empty:
-        columns_tuple = tuple(sheet_columns)
-        try:
-            dn_index = sheet_columns.index("dn_number")
-        except ValueError:
-            dn_sync_logger.warning("Sheet data missing 'dn_number' column; skipping processing")
-            dn_index = None
-
-        plan_mos_index = sheet_columns.index("plan_mos_date") if "plan_mos_date" in sheet_columns else None
-        status_delivery_index = sheet_columns.index("status_delivery") if "status_delivery" in sheet_columns else None
-
-        # Track duplicate DN numbers for logging
-        dn_occurrence_count: dict[str, int] = {}
-
-        if dn_index is not None:
-            for row_values in combined_df.itertuples(index=False, name=None):
-                rows_iterated += 1
-                row_normalization_start = perf_counter()
-                normalized_row: list[Any] = []
-                has_payload = False
-                original_plan_mos_date = None  # Track original plan_mos_date for logging
-
-                for idx, raw_value in enumerate(row_values):
-                    normalized_value = normalize_sheet_value(raw_value)
-                    if (
-                        plan_mos_index is not None
-                        and idx == plan_mos_index
-                        and isinstance(normalized_value, str)
-                        and normalized_value
-                    ):
-                        parse_start = perf_counter()
-                        original_plan_mos_date = normalized_value  # Store original value for logging
-                        parsed_plan_mos_date = parse_date(normalized_value)
-                        plan_mos_parse_total += perf_counter() - parse_start
-                        plan_mos_parse_count += 1
-                        if isinstance(parsed_plan_mos_date, datetime):
-                            normalized_value = parsed_plan_mos_date.strftime("%d %b %y")
-
-                    if idx != dn_index and normalized_value is not None:
-                        has_payload = True
-
-                    normalized_row.append(normalized_value)
-
-                row_normalization_total += perf_counter() - row_normalization_start
-
-                if status_delivery_index is not None:
-                    normalized_status = _normalize_status_delivery_value(normalized_row[status_delivery_index])
-                    normalized_row[status_delivery_index] = normalized_status
-
-                dn_normalization_start = perf_counter()
-                raw_number = normalized_row[dn_index]
-                raw_number_str = str(raw_number).strip() if raw_number is not None else ""
-                normalized_number = normalize_dn(raw_number_str) if raw_number_str else ""
-                dn_normalization_total += perf_counter() - dn_normalization_start
-                if not normalized_number:
-                    skipped_missing_number += 1
-                    continue
-
-                if not has_payload:
-                    skipped_empty_payload += 1
-                    continue
-
-                record_build_start = perf_counter()
-                normalized_row[dn_index] = normalized_number
-                cleaned = dict(zip(columns_tuple, normalized_row))
-
-                # Track duplicate DN numbers
-                dn_occurrence_count[normalized_number] = dn_occurrence_count.get(normalized_number, 0) + 1
-                if dn_occurrence_count[normalized_number] > 1:
-                    logger.warning(
-                        "Duplicate DN %s found (occurrence #%d) - later rows will overwrite earlier ones",
-                        normalized_number,
-                        dn_occurrence_count[normalized_number],
-                    )
-
-                # Log plan_mos_date processing for debugging
-                if plan_mos_index is not None and original_plan_mos_date is not None:
-                    current_plan_mos_date = cleaned.get("plan_mos_date")
-                    logger.debug(
-                        "DN %s plan_mos_date processing: original='%s' -> normalized='%s'",
-                        normalized_number,
-                        original_plan_mos_date,
-                        current_plan_mos_date,
-                    )
-
-                records.append(cleaned)
-                record_build_total += perf_counter() - record_build_start
-                rows_persisted += 1
-                dn_numbers.add(normalized_number)
-
-        # Log duplicate DN statistics
-        duplicate_dns = {dn: count for dn, count in dn_occurrence_count.items() if count > 1}
-        if duplicate_dns:
-            logger.warning(
-                "Found %d duplicate DN numbers in Google Sheets: %s",
-                len(duplicate_dns),
-                dict(list(duplicate_dns.items())[:5]),  # Show first 5 duplicates
-            )
-    else:
-        dn_sync_logger.info("Combined DataFrame is empty; no rows to process")
+    records, skipped_missing_number, skipped_empty_payload = _build_sheet_records(combined_df)
+    dn_numbers: set[str] = {record["dn_number"] for record in records}
 
     if not dn_numbers:
         dn_sync_logger.info(
@@ -355,9 +470,12 @@ def sync_dn_sheet_to_db(db: Session) -> DnSyncResult:
         )
         return DnSyncResult(synced_numbers=[], created_count=0, updated_count=0, ignored_count=0)
 
-    latest_records_for_update = get_latest_dn_records_map(db, dn_numbers)
-    existing_dn_map = get_dn_map_by_numbers(db, dn_numbers)
-    mutable_columns = set(get_mutable_dn_columns())
+    latest_records_for_update = get_latest_dn_record_locations_map(db, dn_numbers)
+    existing_dn_map = get_dn_rows_by_numbers(db, dn_numbers)
+    mutable_columns = frozenset(get_mutable_dn_columns())
+    # Sheet columns the sync may not write (always dn_number), resolved once per sync. Each
+    # record's fields are a C-level copy of the record minus these few keys.
+    excluded_sheet_columns = [key for key in sheet_columns if key == "dn_number" or key not in mutable_columns]
 
     create_payload_by_number: dict[str, dict[str, Any]] = {}
     update_payload_by_number: dict[str, dict[str, Any]] = {}
@@ -365,54 +483,59 @@ def sync_dn_sheet_to_db(db: Session) -> DnSyncResult:
     numbers_to_update: set[str] = set()
     numbers_unchanged: set[str] = set()
 
-    assignable_filter_total = 0.0
-    change_detection_total = 0.0
-    payload_mutation_total = 0.0
-    latest_merge_total = 0.0
     created_columns: set[str] = set()
     updated_columns: set[str] = set()
     created_field_total = 0
     updated_field_total = 0
 
+    # Per key set (with / without latest-record fields): getter for the fields compared as one tuple.
+    compare_getters: dict[bool, Any] = {}
+
     for entry in records:
         number = entry["dn_number"]
-        sheet_fields = {key: entry.get(key) for key in sheet_columns if key != "dn_number"}
+        assignable_fields = entry.copy()
+        for key in excluded_sheet_columns:
+            del assignable_fields[key]
         latest = latest_records_for_update.get(number)
         existing_dn = existing_dn_map.get(number)
         if latest:
-            merge_start = perf_counter()
-
-            # Update sheet_fields: use chosen status and other values from latest
-            sheet_fields.update(
-                {
-                    "status_delivery": _normalize_status_delivery_value(entry.get("status_delivery")),
-                    "status_site": entry.get("status_site"),
-                    "remark": entry.get("remark"),
-                    "photo_url": latest.photo_url,
-                    "lng": latest.lng,
-                    "lat": latest.lat,
-                }
-            )
-            latest_merge_total += perf_counter() - merge_start
+            # Update the sheet fields: use chosen status and other values from latest
+            latest_fields = {
+                "status_delivery": _normalize_status_delivery_value(entry.get("status_delivery")),
+                "status_site": entry.get("status_site"),
+                "remark": entry.get("remark"),
+                "photo_url": latest.photo_url,
+                "lng": latest.lng,
+                "lat": latest.lat,
+            }
+            assignable_fields.update({k: v for k, v in latest_fields.items() if k in mutable_columns})
         elif not existing_dn and number not in numbers_to_create:
             dn_sync_logger.debug("Preparing creation for DN %s from sheet data", number)
+        # Write the same canonical blank status normalize_database_fields would store.
+        if assignable_fields.get("status_delivery", "") is None:
+            assignable_fields["status_delivery"] = "No Status"
 
-        assignable_start = perf_counter()
-        assignable_fields = {k: v for k, v in sheet_fields.items() if k in mutable_columns}
-        assignable_filter_total += perf_counter() - assignable_start
-
-        comparison_start = perf_counter()
         if existing_dn:
             changed_fields: dict[str, Any] = {}
             field_diffs: dict[str, Tuple[Any, Any]] = {}
-            for key, value in assignable_fields.items():
+            fields_to_compare: Any = assignable_fields.items()
+            compare_getter = compare_getters.get(latest is not None)
+            if compare_getter is None:
+                compare_keys = [key for key in assignable_fields if key != "remark"]
+                compare_getter = itemgetter(*compare_keys) if compare_keys else None
+                compare_getters[latest is not None] = compare_getter
+            # One C-level tuple comparison clears an unchanged row; only the remark rule,
+            # which does not depend on equality, still needs the per-field pass then.
+            if compare_getter is not None and compare_getter(existing_dn) == compare_getter(assignable_fields):
+                fields_to_compare = [("remark", assignable_fields["remark"])] if "remark" in assignable_fields else ()
+            for key, value in fields_to_compare:
                 # Protect driver_contact_number from being overwritten if DN has been updated
-                if key == "driver_contact_number" and (existing_dn.update_count or 0) > 0:
+                if key == "driver_contact_number" and (existing_dn["update_count"] or 0) > 0:
                     # Skip this field - don't allow Google Sheet to overwrite it
                     dn_sync_logger.debug(
                         "Skipping driver_contact_number update for DN %s (update_count=%d > 0)",
                         number,
-                        existing_dn.update_count,
+                        existing_dn["update_count"],
                     )
                     continue
 
@@ -424,7 +547,7 @@ def sync_dn_sheet_to_db(db: Session) -> DnSyncResult:
                 #   non-empty, do we set remark to issue_remark.
                 if key == "remark":
                     issue_remark = entry.get("issue_remark")
-                    existing_remark = getattr(existing_dn, key, None)
+                    existing_remark = existing_dn.get(key)
                     # Normalize empty strings as None for checking
                     existing_empty = existing_remark is None or (
                         isinstance(existing_remark, str) and not existing_remark.strip()
@@ -444,11 +567,11 @@ def sync_dn_sheet_to_db(db: Session) -> DnSyncResult:
                     # In all other cases, do not overwrite local remark (skip)
                     continue
 
-                if not _values_match(getattr(existing_dn, key, None), value):
-                    if key == "status_delivery":
-                        if getattr(existing_dn, key, None) == "No Status" and value is None:
-                            continue
-                    current_value = getattr(existing_dn, key, None)
+                current_value = existing_dn.get(key)
+                # Most fields of an unchanged row are identical; skip the normalising comparison.
+                if current_value == value:
+                    continue
+                if not _values_match(current_value, value):
                     changed_fields[key] = value
                     field_diffs[key] = (current_value, value)
                     dn_sync_logger.debug(
@@ -460,7 +583,6 @@ def sync_dn_sheet_to_db(db: Session) -> DnSyncResult:
                     )
             if changed_fields:
                 _log_sheet_diff("update", number, field_diffs)
-            change_detection_total += perf_counter() - comparison_start
             if not changed_fields:
                 numbers_unchanged.add(number)
                 continue
@@ -468,19 +590,16 @@ def sync_dn_sheet_to_db(db: Session) -> DnSyncResult:
                 dn_sync_logger.debug("Preparing update for existing DN %s after detecting differences", number)
             numbers_to_update.add(number)
             updated_columns.update(changed_fields.keys())
-            payload = update_payload_by_number.setdefault(number, {"id": existing_dn.id, "dn_number": number})
-            mutation_start = perf_counter()
+            payload = update_payload_by_number.setdefault(number, {"id": existing_dn["id"], "dn_number": number})
             payload.update(changed_fields)
-            payload_mutation_total += perf_counter() - mutation_start
             updated_field_total += len(changed_fields)
         else:
-            change_detection_total += perf_counter() - comparison_start
             numbers_to_create.add(number)
+            if "status_delivery" in mutable_columns:
+                assignable_fields.setdefault("status_delivery", "No Status")
             created_columns.update(assignable_fields.keys())
             payload = create_payload_by_number.setdefault(number, {"dn_number": number})
-            mutation_start = perf_counter()
             payload.update(assignable_fields)
-            payload_mutation_total += perf_counter() - mutation_start
             created_field_total += len(assignable_fields)
             if assignable_fields:
                 create_diffs = {k: (None, v) for k, v in assignable_fields.items()}
@@ -518,11 +637,15 @@ def sync_dn_sheet_to_db(db: Session) -> DnSyncResult:
 
     if create_payloads or update_payloads:
         db_start = perf_counter()
-        if create_payloads:
+        # Chunked so one large sync never builds a single huge parameter list.
+        if created_count > DN_SYNC_COPY_THRESHOLD and uses_postgresql(db, "psycopg2"):
+            _copy_insert_new_dns(db, create_payloads)
+        elif create_payloads:
             insert_stmt = insert(DN).on_conflict_do_nothing(index_elements=[DN.dn_number])
-            db.execute(insert_stmt, create_payloads)
-        if update_payloads:
-            db.bulk_update_mappings(DN, update_payloads)
+            for offset in range(0, created_count, DN_SYNC_WRITE_CHUNK_SIZE):
+                db.execute(insert_stmt, create_payloads[offset : offset + DN_SYNC_WRITE_CHUNK_SIZE])
+        for offset in range(0, updated_count, DN_SYNC_WRITE_CHUNK_SIZE):
+            db.execute(update(DN), update_payloads[offset : offset + DN_SYNC_WRITE_CHUNK_SIZE])
         db.commit()
         dn_sync_logger.debug(
             "Persisted %d new and %d updated DN entries in %.3fs",
@@ -535,23 +658,7 @@ def sync_dn_sheet_to_db(db: Session) -> DnSyncResult:
         dn_sync_logger.info("No DN sheet changes detected; skipping database write")
 
     dn_numbers_list = sorted(dn_numbers)
-    reset_active_count = 0
-    mark_deleted_count = 0
-
-    if dn_numbers_list:
-        reset_active_count = (
-            db.query(DN)
-            .filter(DN.dn_number.in_(dn_numbers_list))
-            .filter(func.coalesce(DN.is_deleted, "N") != "N")
-            .update({DN.is_deleted: "N"}, synchronize_session=False)
-        )
-        missing_q = db.query(DN).filter(~DN.dn_number.in_(dn_numbers_list))
-    else:
-        missing_q = db.query(DN)
-
-    mark_deleted_count = missing_q.filter(func.coalesce(DN.is_deleted, "N") != "Y").update(
-        {DN.is_deleted: "Y"}, synchronize_session=False
-    )
+    reset_active_count, mark_deleted_count = _apply_sheet_presence(db, dn_numbers_list)
 
     if reset_active_count or mark_deleted_count:
         db.commit()
@@ -566,9 +673,12 @@ def sync_dn_sheet_to_db(db: Session) -> DnSyncResult:
                 mark_deleted_count,
             )
 
-    normalization_start = perf_counter()
-    normalize_database_fields(db)
-    dn_sync_logger.debug("normalize_database_fields completed in %.3fs", perf_counter() - normalization_start)
+    # Sheet writes above are already canonical; the full-table pass only backfills rows
+    # written elsewhere and is opt-in.
+    if settings.dn_sync_normalize_database:
+        normalization_start = perf_counter()
+        normalize_database_fields(db)
+        dn_sync_logger.debug("normalize_database_fields completed in %.3fs", perf_counter() - normalization_start)
 
     dn_sync_logger.info(
         (
@@ -684,16 +794,47 @@ def is_in_maintenance_window() -> bool:
         return False
 
 
+_VEHICLE_ATTRS = attrgetter(
+    "vehicle_plate",
+    "vehicle_type",
+    "driver_name",
+    "contact_number",
+    "lsp",
+    "status",
+    "arrive_time",
+    "depart_time",
+    "created_at",
+    "updated_at",
+)
+
+
 def serialize_vehicle(vehicle: Vehicle) -> dict[str, Any]:
+    plate, vehicle_type, driver, contact, lsp, status, arrive, depart, created, updated = _VEHICLE_ATTRS(vehicle)
+    return {
+        "vehiclePlate": plate,
+        "vehicleType": vehicle_type,
+        "driverName": driver,
+        "contactNumber": contact,
+        "LSP": lsp,
+        "status": status,
+        "arriveTime": to_gmt7_iso(arrive),
+        "departTime": to_gmt7_iso(depart),
+        "createdAt": to_gmt7_iso(created),
+        "updatedAt": to_gmt7_iso(updated),
+    }
+
+
+def serialize_vehicle_mapping(row: Mapping[str, Any]) -> dict[str, Any]:
+    """Serialize a column mapping from :func:`app.crud.list_vehicles_rows`."""
     return {
-        "vehiclePlate": vehicle.vehicle_plate,
-        "vehicleType": vehicle.vehicle_type,
-        "driverName": vehicle.driver_name,
-        "contactNumber": vehicle.contact_number,
-        "LSP": vehicle.lsp,
-        "status": vehicle.status,
-        "arriveTime": to_gmt7_iso(vehicle.arrive_time),
-        "departTime": to_gmt7_iso(vehicle.depart_time),
-        "createdAt": to_gmt7_iso(vehicle.created_at),
-        "updatedAt": to_gmt7_iso(vehicle.updated_at),
+        "vehiclePlate": row["vehicle_plate"],
+        "vehicleType": row["vehicle_type"],
+        "driverName": row["driver_name"],
+        "contactNumber": row["contact_number"],
+        "LSP": row["lsp"],
+        "status": row["status"],
+        "arriveTime": to_gmt7_iso(row["arrive_time"]),
+        "departTime": to_gmt7_iso(row["depart_time"]),
+        "createdAt": to_gmt7_iso(row["created_at"]),
+        "updatedAt": to_gmt7_iso(row["updated_at"]),
     }
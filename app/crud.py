@@ -1,13 +1,32 @@
 # crud.py
 from __future__ import annotations
 
-import json
-from typing import Any, Optional, Iterable, Tuple, List, Set, Dict, Sequence, Literal
+import orjson
+from typing import Any, Optional, Iterable, Iterator, Tuple, List, Set, Dict, Sequence, Literal
 from datetime import datetime, timezone
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, func, or_, case, exists
+from sqlalchemy.orm import Session, aliased, raiseload
+from sqlalchemy import (
+    Row,
+    RowMapping,
+    String,
+    and_,
+    any_,
+    bindparam,
+    case,
+    delete,
+    exists,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
+from .db import uses_postgresql
 from .models import DN, DNRecord, DNSyncLog, Vehicle, StatusDeliveryLspStat, PM, PMInventory
 import unicodedata
+from .utils.string import normalize_vehicle_plate as _normalize_vehicle_plate
 from .dn_columns import (
     filter_assignable_dn_fields,
     ensure_dynamic_columns_loaded,
@@ -15,10 +34,37 @@ from .dn_columns import (
 )
 
 _ACTIVE_DN_EXPR = func.coalesce(DN.is_deleted, "N") == "N"
+# Built once and bound per call; matches the ix_vehicle_plate_upper expression index.
+_VEHICLE_BY_PLATE = select(Vehicle).where(func.upper(Vehicle.vehicle_plate) == bindparam("plate"))
+# Point lookups built once at import; only bind values change per call, so each call skips
+# statement construction and hits the compiled-SQL cache directly.
+_LATEST_DN_SYNC_LOG = select(DNSyncLog).order_by(DNSyncLog.created_at.desc(), DNSyncLog.id.desc()).limit(1)
+_DN_RECORDS_BY_NUMBER = (
+    select(DNRecord)
+    .where(DNRecord.dn_number == bindparam("dn_number"))
+    .order_by(DNRecord.created_at.desc())
+    .limit(bindparam("limit"))
+)
+_OPEN_PM_INVENTORY_BY_DN = (
+    select(PMInventory)
+    .where(PMInventory.dn_number == bindparam("dn_number"))
+    .where(func.coalesce(PMInventory.status, "") != "out")
+    .order_by(PMInventory.in_time.desc())
+    .limit(1)
+)
 
 
-def _normalize_vehicle_plate(vehicle_plate: str) -> str:
-    return "".join(vehicle_plate.split()).upper()
+def _in_values(db: Session, column: Any, values: Sequence[str]) -> Any:
+    """Membership test for a potentially long list of identifiers.
+
+    PostgreSQL gets ``column = ANY(:values)`` with the list bound as one array parameter,
+    so the statement is the same for every list length and its compiled form is cached
+    once, instead of re-rendering one placeholder per value; other dialects keep the
+    expanding ``IN``.
+    """
+    if uses_postgresql(db):
+        return column == any_(literal(list(values), type_=ARRAY(String)))
+    return column.in_(values)
 
 
 def _normalize_timestamp(value: datetime | None) -> datetime | None:
@@ -47,7 +93,7 @@ def upsert_vehicle_signin(
 
     arrive_time = _normalize_timestamp(arrive_time) or datetime.now(timezone.utc)
 
-    vehicle = db.query(Vehicle).filter(func.upper(Vehicle.vehicle_plate) == plate).one_or_none()
+    vehicle = db.scalars(_VEHICLE_BY_PLATE, {"plate": plate}).one_or_none()
 
     if vehicle is None:
         vehicle = Vehicle(vehicle_plate=plate, lsp=lsp)
@@ -71,7 +117,7 @@ def get_vehicle_by_plate(db: Session, vehicle_plate: str) -> Vehicle | None:
     if not plate:
         return None
 
-    return db.query(Vehicle).filter(func.upper(Vehicle.vehicle_plate) == plate).one_or_none()
+    return db.scalars(_VEHICLE_BY_PLATE, {"plate": plate}).one_or_none()
 
 
 def mark_vehicle_departed(
@@ -95,6 +141,30 @@ def mark_vehicle_departed(
     return vehicle
 
 
+def _vehicle_list_conditions(
+    *,
+    status: str | None,
+    filter_by: Literal["arrive_time", "depart_time"],
+    date_from: datetime | None,
+    date_to: datetime | None,
+) -> list:
+    conditions = []
+
+    if status:
+        conditions.append(Vehicle.status == status)
+
+    if date_from is not None or date_to is not None:
+        column = Vehicle.depart_time if filter_by == "depart_time" else Vehicle.arrive_time
+        conditions.append(column.isnot(None))
+
+        if date_from is not None:
+            conditions.append(column >= date_from)
+        if date_to is not None:
+            conditions.append(column <= date_to)
+
+    return conditions
+
+
 def list_vehicles(
     db: Session,
     *,
@@ -103,65 +173,107 @@ def list_vehicles(
     date_from: datetime | None = None,
     date_to: datetime | None = None,
 ) -> List[Vehicle]:
-    query = db.query(Vehicle)
+    conditions = _vehicle_list_conditions(status=status, filter_by=filter_by, date_from=date_from, date_to=date_to)
+    return (
+        db.query(Vehicle)
+        .options(raiseload("*"))
+        .filter(*conditions)
+        .order_by(Vehicle.arrive_time.desc(), Vehicle.id.desc())
+        .all()
+    )
 
-    if status:
-        query = query.filter(Vehicle.status == status)
 
-    if date_from is not None or date_to is not None:
-        column = Vehicle.depart_time if filter_by == "depart_time" else Vehicle.arrive_time
-        if filter_by == "depart_time":
-            query = query.filter(Vehicle.depart_time.isnot(None))
-        else:
-            query = query.filter(Vehicle.arrive_time.isnot(None))
+_VEHICLE_LIST_COLUMNS = (
+    Vehicle.vehicle_plate,
+    Vehicle.vehicle_type,
+    Vehicle.driver_name,
+    Vehicle.contact_number,
+    Vehicle.lsp,
+    Vehicle.status,
+    Vehicle.arrive_time,
+    Vehicle.depart_time,
+    Vehicle.created_at,
+    Vehicle.updated_at,
+)
 
-        if date_from is not None:
-            query = query.filter(column >= date_from)
-        if date_to is not None:
-            query = query.filter(column <= date_to)
 
-    return query.order_by(Vehicle.arrive_time.desc(), Vehicle.id.desc()).all()
+def _vehicle_rows_stmt(
+    *,
+    status: str | None,
+    filter_by: Literal["arrive_time", "depart_time"],
+    date_from: datetime | None,
+    date_to: datetime | None,
+):
+    conditions = _vehicle_list_conditions(status=status, filter_by=filter_by, date_from=date_from, date_to=date_to)
+    return (
+        select(*_VEHICLE_LIST_COLUMNS)
+        .where(*conditions)
+        .order_by(Vehicle.arrive_time.desc(), Vehicle.id.desc())
+    )
+
+
+def list_vehicles_rows(
+    db: Session,
+    *,
+    status: str | None = None,
+    filter_by: Literal["arrive_time", "depart_time"] = "arrive_time",
+    date_from: datetime | None = None,
+    date_to: datetime | None = None,
+) -> Sequence[RowMapping]:
+    """Same filtering as :func:`list_vehicles` but returns column mappings.
+
+    Read-only callers that only serialize the result skip ORM hydration this way.
+    """
+    stmt = _vehicle_rows_stmt(status=status, filter_by=filter_by, date_from=date_from, date_to=date_to)
+    return db.execute(stmt).mappings().all()
+
+
+def iter_vehicles_row_batches(
+    db: Session,
+    *,
+    status: str | None = None,
+    filter_by: Literal["arrive_time", "depart_time"] = "arrive_time",
+    date_from: datetime | None = None,
+    date_to: datetime | None = None,
+    batch_size: int = 1000,
+) -> Iterator[Sequence[RowMapping]]:
+    """Yield :func:`list_vehicles_rows` results in batches from a server-side cursor."""
+    stmt = _vehicle_rows_stmt(status=status, filter_by=filter_by, date_from=date_from, date_to=date_to)
+    result = db.execute(stmt, execution_options={"yield_per": batch_size})
+    yield from result.mappings().partitions()
+
+
+def vehicle_list_fingerprint(
+    db: Session,
+    *,
+    status: str | None = None,
+    filter_by: Literal["arrive_time", "depart_time"] = "arrive_time",
+    date_from: datetime | None = None,
+    date_to: datetime | None = None,
+) -> tuple[int, datetime | None]:
+    """Return ``(row_count, max(updated_at))`` for the :func:`list_vehicles` filters."""
+    conditions = _vehicle_list_conditions(status=status, filter_by=filter_by, date_from=date_from, date_to=date_to)
+    stmt = select(func.count(Vehicle.id), func.max(Vehicle.updated_at)).where(*conditions)
+    count, latest = db.execute(stmt).one()
+    return count, latest
 
 
 def ensure_dn(db: Session, dn_number: str, **fields: Any) -> DN:
     ensure_dynamic_columns_loaded(db)
     allowed_columns = get_mutable_dn_columns(db)
     assignable = filter_assignable_dn_fields(fields, allowed_columns=allowed_columns)
-    # Exclude is_deleted from non_null_assignable to avoid conflicts
-    # since we explicitly set it in the constructor
-    non_null_assignable = {k: v for k, v in assignable.items() if v is not None and k != "is_deleted"}
-
-    dn = db.query(DN).filter(DN.dn_number == dn_number).one_or_none()
-    if not dn:
-        dn = DN(dn_number=dn_number, is_deleted="N", **non_null_assignable)
-        db.add(dn)
-        db.commit()
-        db.refresh(dn)
-        return dn
-
-    updated = False
-    if dn.is_deleted != "N":
-        dn.is_deleted = "N"
-        updated = True
-    for key, value in non_null_assignable.items():
-        if getattr(dn, key, None) != value:
-            setattr(dn, key, value)
-            updated = True
-
-    # Allow explicit updates to nullable fields (e.g. last_updated_by) when
-    # they are provided in the payload even if the value is None.
-    for key, value in assignable.items():
-        if key in non_null_assignable:
-            continue
-        if getattr(dn, key, None) is not None and value is None:
-            setattr(dn, key, None)
-            updated = True
-
-    if updated:
-        db.add(dn)
-        db.commit()
-        db.refresh(dn)
-
+    # is_deleted is always reset explicitly below
+    assignable.pop("is_deleted", None)
+
+    # Single-statement upsert: provided fields overwrite the stored ones (an explicit
+    # None clears a nullable field such as last_updated_by) and the DN is undeleted.
+    stmt = pg_insert(DN).values(dn_number=dn_number, is_deleted="N", **assignable)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[DN.dn_number],
+        set_={**{key: stmt.excluded[key] for key in assignable}, "is_deleted": "N"},
+    ).returning(DN)
+    dn = db.scalars(stmt, execution_options={"populate_existing": True}).one()
+    db.commit()
     return dn
 
 
@@ -214,6 +326,34 @@ def delete_dn(db: Session, dn_number: str) -> Dict[str, Any] | None:
     return {"dn": dn_data, "records": related_records_data}
 
 
+def _dn_fields_from_record(
+    status_delivery: str | None = None,
+    status_site: str | None = None,
+    remark: str | None = None,
+    photo_url: str | None = None,
+    lng: str | None = None,
+    lat: str | None = None,
+    updated_by: str | None = None,
+    phone_number: str | None = None,
+) -> dict[str, Any]:
+    """Map DN record fields onto the DN columns they overwrite."""
+    fields: dict[str, Any] = {
+        "remark": remark,
+        "photo_url": photo_url,
+        "lng": lng,
+        "lat": lat,
+    }
+    if status_delivery is not None:
+        fields["status_delivery"] = status_delivery
+    if status_site is not None:
+        fields["status_site"] = status_site
+    if updated_by is not None:
+        fields["last_updated_by"] = updated_by
+    if phone_number is not None:
+        fields["driver_contact_number"] = phone_number
+    return fields
+
+
 def add_dn_record(
     db: Session,
     dn_number: str,
@@ -242,20 +382,16 @@ def add_dn_record(
     db.refresh(rec)
 
     # Keep the DN table in sync with the latest record that was just created.
-    ensure_payload: dict[str, Any] = {
-        "remark": remark,
-        "photo_url": photo_url,
-        "lng": lng,
-        "lat": lat,
-    }
-    if status_delivery is not None:
-        ensure_payload["status_delivery"] = status_delivery
-    if status_site is not None:
-        ensure_payload["status_site"] = status_site
-    if updated_by is not None:
-        ensure_payload["last_updated_by"] = updated_by
-    if phone_number is not None:
-        ensure_payload["driver_contact_number"] = phone_number
+    ensure_payload = _dn_fields_from_record(
+        status_delivery=status_delivery,
+        status_site=status_site,
+        remark=remark,
+        photo_url=photo_url,
+        lng=lng,
+        lat=lat,
+        updated_by=updated_by,
+        phone_number=phone_number,
+    )
 
     # Increment update_count
     dn = ensure_dn(
@@ -270,6 +406,20 @@ def add_dn_record(
     return rec
 
 
+def bulk_add_dn_records(db: Session, dn_numbers: Sequence[str], *, commit: bool = True, **fields: Any) -> None:
+    """Insert one DNRecord per number in a single bulk insert.
+
+    Unlike :func:`add_dn_record` this does not touch the DN rows; callers creating
+    brand-new DNs set their columns (and ``update_count``) when inserting them.
+    Pass ``commit=False`` to leave the transaction open for the caller.
+    """
+    if not dn_numbers:
+        return
+    db.bulk_insert_mappings(DNRecord, [{"dn_number": number, **fields} for number in dn_numbers])
+    if commit:
+        db.commit()
+
+
 def create_dn_sync_log(
     db: Session,
     *,
@@ -283,7 +433,7 @@ def create_dn_sync_log(
     log = DNSyncLog(
         status=status,
         synced_count=len(numbers_list),
-        dn_numbers_json=json.dumps(numbers_list) if numbers_list else None,
+        dn_numbers_json=orjson.dumps(numbers_list).decode() if numbers_list else None,
         message=message,
         error_message=error_message,
         error_traceback=error_traceback,
@@ -295,18 +445,39 @@ def create_dn_sync_log(
 
 
 def get_latest_dn_sync_log(db: Session) -> Optional[DNSyncLog]:
-    return db.query(DNSyncLog).order_by(DNSyncLog.created_at.desc(), DNSyncLog.id.desc()).first()
+    return db.scalars(_LATEST_DN_SYNC_LOG).first()
 
 
 def list_dn_records(db: Session, dn_number: str, limit: int = 50) -> List[DNRecord]:
-    q = db.query(DNRecord).filter(DNRecord.dn_number == dn_number).order_by(DNRecord.created_at.desc()).limit(limit)
-    return q.all()
+    return list(db.scalars(_DN_RECORDS_BY_NUMBER, {"dn_number": dn_number, "limit": limit}))
 
 
 def list_all_dn_records(db: Session) -> List[DNRecord]:
     return db.query(DNRecord).order_by(DNRecord.created_at.desc(), DNRecord.id.desc()).all()
 
 
+def _page_with_total(ordered_q: Any, page: int, page_size: Optional[int]) -> Tuple[int, list]:
+    """Return ``(total, items)`` for an ordered query with a single windowed SELECT.
+
+    ``count(*) OVER ()`` is evaluated before OFFSET/LIMIT, so each row of the page carries the
+    full match count; only a page past the end needs a separate COUNT.
+    """
+    if page_size is None:
+        items = ordered_q.all()
+        return len(items), items
+
+    rows = (
+        ordered_q.add_columns(func.count().over().label("total_count"))
+        .offset((page - 1) * page_size)
+        .limit(page_size)
+        .all()
+    )
+    if rows:
+        return rows[0].total_count, [row[0] for row in rows]
+    total = ordered_q.order_by(None).count() if page > 1 else 0
+    return total, []
+
+
 def search_dn_records(
     db: Session,
     *,
@@ -349,17 +520,12 @@ def search_dn_records(
     if conds:
         base_q = base_q.filter(and_(*conds))
 
-    total = base_q.count()
     ordered_q = base_q.order_by(DNRecord.created_at.desc(), DNRecord.id.desc())
-    if page_size is None:
-        items = ordered_q.all()
-    else:
-        items = ordered_q.offset((page - 1) * page_size).limit(page_size).all()
-    return total, items
+    return _page_with_total(ordered_q, page, page_size)
 
 
 def get_dn_record_by_id(db: Session, rec_id: int) -> Optional[DNRecord]:
-    return db.query(DNRecord).get(rec_id)
+    return db.get(DNRecord, rec_id)
 
 
 def update_dn_record(
@@ -375,41 +541,37 @@ def update_dn_record(
     phone_number: Optional[str] = None,
     phone_number_set: bool = False,
 ) -> Optional[DNRecord]:
-    obj = db.query(DNRecord).get(rec_id)
-    if not obj:
-        return None
-
+    values: Dict[str, Any] = {}
     if status_delivery is not None:
-        obj.status_delivery = status_delivery
+        values["status_delivery"] = status_delivery
     if status_site is not None:
-        obj.status_site = status_site
+        values["status_site"] = status_site
     if remark is not None:
-        obj.remark = remark
+        values["remark"] = remark
     if photo_url is not None:
-        obj.photo_url = photo_url
-    if updated_by_set:
-        obj.updated_by = updated_by
-    elif updated_by is not None:
-        obj.updated_by = updated_by
-    if phone_number_set:
-        obj.phone_number = phone_number
-    elif phone_number is not None:
-        obj.phone_number = phone_number
-
-    db.add(obj)
+        values["photo_url"] = photo_url
+    if updated_by_set or updated_by is not None:
+        values["updated_by"] = updated_by
+    if phone_number_set or phone_number is not None:
+        values["phone_number"] = phone_number
+
+    if not values:
+        return db.get(DNRecord, rec_id)
+
+    # One UPDATE ... RETURNING instead of SELECT, UPDATE and a refresh SELECT.
+    stmt = update(DNRecord).where(DNRecord.id == rec_id).values(**values).returning(DNRecord)
+    obj = db.scalars(stmt).one_or_none()
     db.commit()
-    db.refresh(obj)
     return obj
 
 
 def delete_dn_record(db: Session, rec_id: int) -> Dict[str, Any] | None:
-    obj = db.query(DNRecord).get(rec_id)
-    if not obj:
+    stmt = delete(DNRecord).where(DNRecord.id == rec_id).returning(*DNRecord.__table__.columns)
+    row = db.execute(stmt).one_or_none()
+    if row is None:
         return None
-    record_data = _serialize_dn_record(obj)
-    db.delete(obj)
     db.commit()
-    return record_data
+    return _serialize_dn_record(row)
 
 
 def list_dn_records_by_dn_numbers(
@@ -423,16 +585,9 @@ def list_dn_records_by_dn_numbers(
     if not dn_numbers:
         return 0, []
 
-    base_q = db.query(DNRecord).filter(DNRecord.dn_number.in_(dn_numbers))
+    base_q = db.query(DNRecord).filter(_in_values(db, DNRecord.dn_number, dn_numbers))
 
-    total = base_q.count()
-    items = (
-        base_q.order_by(DNRecord.created_at.desc(), DNRecord.id.desc())
-        .offset((page - 1) * page_size)
-        .limit(page_size)
-        .all()
-    )
-    return total, items
+    return _page_with_total(base_q.order_by(DNRecord.created_at.desc(), DNRecord.id.desc()), page, page_size)
 
 
 def list_dn_by_dn_numbers(
@@ -458,17 +613,11 @@ def list_dn_by_dn_numbers(
     base_q = (
         db.query(DN)
         .outerjoin(latest_record_subq, DN.dn_number == latest_record_subq.c.dn_number)
-        .filter(DN.dn_number.in_(numbers))
+        .filter(_in_values(db, DN.dn_number, numbers))
     )
 
-    total = base_q.count()
-
     latest_record_expr = func.coalesce(latest_record_subq.c.latest_record_created_at, DN.created_at)
-
-    items = (
-        base_q.order_by(latest_record_expr.desc(), DN.id.desc()).offset((page - 1) * page_size).limit(page_size).all()
-    )
-    return total, items
+    return _page_with_total(base_q.order_by(latest_record_expr.desc(), DN.id.desc()), page, page_size)
 
 
 def list_dn_by_du_ids(
@@ -494,17 +643,11 @@ def list_dn_by_du_ids(
     base_q = (
         db.query(DN)
         .outerjoin(latest_record_subq, DN.dn_number == latest_record_subq.c.dn_number)
-        .filter(DN.du_id.in_(identifiers))
+        .filter(_in_values(db, DN.du_id, identifiers))
     )
 
-    total = base_q.count()
-
     latest_record_expr = func.coalesce(latest_record_subq.c.latest_record_created_at, DN.created_at)
-
-    items = (
-        base_q.order_by(latest_record_expr.desc(), DN.id.desc()).offset((page - 1) * page_size).limit(page_size).all()
-    )
-    return total, items
+    return _page_with_total(base_q.order_by(latest_record_expr.desc(), DN.id.desc()), page, page_size)
 
 
 # PM / PMInventory helpers
@@ -607,29 +750,24 @@ def find_pm_by_dn(db: Session, dn_number: str) -> PMInventory | None:
     if not dn_number or not isinstance(dn_number, str):
         return None
     dn = dn_number.strip()
-    rec = (
-        db.query(PMInventory)
-        .filter(PMInventory.dn_number == dn)
-        .filter(func.coalesce(PMInventory.status, "") != "out")
-        .order_by(PMInventory.in_time.desc())
-        .first()
-    )
-    return rec
+    return db.scalars(_OPEN_PM_INVENTORY_BY_DN, {"dn_number": dn}).first()
+
 
+def list_pm_inventory(db: Session, pm_name: str) -> list[Row[Tuple[int, str, Optional[datetime]]]]:
+    """Return ``(id, dn_number, in_time)`` rows for pm_name with status != 'out'.
 
-def list_pm_inventory(db: Session, pm_name: str) -> list[PMInventory]:
-    """Return all PMInventory records for pm_name with status != 'out'."""
+    Only the listed columns are selected so large inventories skip ORM hydration.
+    """
     if not pm_name or not isinstance(pm_name, str):
         return []
     name = unicodedata.normalize("NFC", pm_name).strip()
-    records = (
-        db.query(PMInventory)
-        .filter(func.lower(PMInventory.pm_name) == name.lower())
-        .filter(func.coalesce(PMInventory.status, "") != "out")
+    stmt = (
+        select(PMInventory.id, PMInventory.dn_number, PMInventory.in_time)
+        .where(func.lower(PMInventory.pm_name) == name.lower())
+        .where(func.coalesce(PMInventory.status, "") != "out")
         .order_by(PMInventory.in_time.desc())
-        .all()
     )
-    return records
+    return list(db.execute(stmt).all())
 
 
 def delete_pm(db: Session, pm_name: str) -> bool:
@@ -654,8 +792,98 @@ def get_existing_dn_numbers(db: Session, dn_numbers: Iterable[str]) -> Set[str]:
     if not unique_numbers:
         return set()
 
-    rows = db.query(DN.dn_number).filter(DN.dn_number.in_(unique_numbers)).all()
-    return {row[0] for row in rows}
+    return set(db.scalars(select(DN.dn_number).where(_in_values(db, DN.dn_number, list(unique_numbers)))))
+
+
+def apply_dn_updates(
+    db: Session,
+    updates: Sequence[Tuple[str, Dict[str, Any], Dict[str, Any]]],
+) -> List[Tuple[Optional[str], Optional[int], int, int]]:
+    """Apply many ``(dn_number, dn_fields, record_fields)`` updates in one transaction.
+
+    Equivalent to calling :func:`ensure_dn` followed by :func:`add_dn_record` for each
+    update in order, but DN rows are written with ``INSERT ... ON CONFLICT DO UPDATE``
+    and records with a single multi-row insert. Returns one
+    ``(gs_sheet, gs_row, dn_id, record_id)`` tuple per update, where the sheet location
+    is the one the DN had while active before its update.
+    """
+    if not updates:
+        return []
+
+    allowed_columns = get_mutable_dn_columns(db)
+    numbers = list(dict.fromkeys(dn_number for dn_number, _, _ in updates))
+    locations: Dict[str, Tuple[Optional[str], Optional[int]]] = {
+        row.dn_number: (row.gs_sheet, row.gs_row)
+        for row in db.execute(
+            select(DN.dn_number, DN.gs_sheet, DN.gs_row).where(_in_values(db, DN.dn_number, numbers), _ACTIVE_DN_EXPR)
+        )
+    }
+
+    # A DN may only be touched once per ON CONFLICT statement, and multi-row VALUES
+    # need a shared column set, so split the updates into ordered rounds by both.
+    rounds: List[Dict[Tuple[str, ...], List[Tuple[int, str, Dict[str, Any]]]]] = []
+    round_index_by_number: Dict[str, int] = {}
+    for position, (dn_number, dn_fields, record_fields) in enumerate(updates):
+        merged = {**dn_fields, **_dn_fields_from_record(**record_fields)}
+        assignable = filter_assignable_dn_fields(merged, allowed_columns=allowed_columns)
+        assignable.pop("is_deleted", None)
+        round_index = round_index_by_number.get(dn_number, -1) + 1
+        round_index_by_number[dn_number] = round_index
+        if round_index == len(rounds):
+            rounds.append({})
+        rounds[round_index].setdefault(tuple(sorted(assignable)), []).append((position, dn_number, assignable))
+
+    results: List[Any] = [None] * len(updates)
+    for round_groups in rounds:
+        for columns, items in round_groups.items():
+            rows = [{"dn_number": dn_number, "is_deleted": "N", "update_count": 1, **fields} for _, dn_number, fields in items]
+            stmt = pg_insert(DN).values(rows)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[DN.dn_number],
+                set_={
+                    **{column: stmt.excluded[column] for column in columns},
+                    "is_deleted": "N",
+                    "update_count": func.coalesce(DN.update_count, 0) + 1,
+                },
+            ).returning(DN.dn_number, DN.id, DN.gs_sheet, DN.gs_row)
+            returned = {row.dn_number: row for row in db.execute(stmt)}
+            for position, dn_number, _ in items:
+                row = returned[dn_number]
+                location = locations.get(dn_number, (None, None))
+                # Later updates of the same DN see it active with its current location.
+                locations[dn_number] = (row.gs_sheet, row.gs_row)
+                results[position] = (*location, row.id)
+
+    record_ids = db.scalars(
+        insert(DNRecord).returning(DNRecord.id, sort_by_parameter_order=True),
+        [{"dn_number": dn_number, **record_fields} for dn_number, _, record_fields in updates],
+    ).all()
+    db.commit()
+    return [(*result, record_id) for result, record_id in zip(results, record_ids)]
+
+
+def insert_new_dns(db: Session, dn_numbers: Iterable[str], *, commit: bool = True, **fields: Any) -> Set[str]:
+    """Insert DN rows that do not exist yet and return the numbers actually inserted.
+
+    The existence check is folded into ``INSERT ... ON CONFLICT DO NOTHING RETURNING``
+    so callers need a single round-trip instead of a SELECT followed by per-row upserts.
+    Pass ``commit=False`` to leave the transaction open for the caller.
+    """
+    numbers = [number for number in dict.fromkeys(dn_numbers) if number]
+    if not numbers:
+        return set()
+
+    rows = [{"dn_number": number, "is_deleted": "N", **fields} for number in numbers]
+    stmt = (
+        pg_insert(DN)
+        .values(rows)
+        .on_conflict_do_nothing(index_elements=[DN.dn_number])
+        .returning(DN.dn_number)
+    )
+    inserted = {row[0] for row in db.execute(stmt)}
+    if commit:
+        db.commit()
+    return inserted
 
 
 def get_dn_map_by_numbers(db: Session, dn_numbers: Iterable[str]) -> Dict[str, DN]:
@@ -665,30 +893,73 @@ def get_dn_map_by_numbers(db: Session, dn_numbers: Iterable[str]) -> Dict[str, D
     if not numbers:
         return {}
 
-    rows = db.query(DN).filter(DN.dn_number.in_(numbers)).order_by(DN.dn_number.asc()).all()
+    rows = db.query(DN).filter(_in_values(db, DN.dn_number, numbers)).order_by(DN.dn_number.asc()).all()
 
     return {row.dn_number: row for row in rows}
 
 
+def _latest_dn_record_ranked(db: Session, unique_numbers: List[str], *entities: Any) -> Any:
+    """Subquery of ``entities`` for the DNs' records, ranked newest-first per DN as ``rn``."""
+    return (
+        select(
+            *entities,
+            func.row_number()
+            .over(
+                partition_by=DNRecord.dn_number,
+                order_by=(DNRecord.created_at.desc(), DNRecord.id.desc()),
+            )
+            .label("rn"),
+        )
+        .where(_in_values(db, DNRecord.dn_number, unique_numbers))
+        .subquery()
+    )
+
+
 def get_latest_dn_records_map(db: Session, dn_numbers: Iterable[str]) -> Dict[str, DNRecord]:
+    """Return the newest DNRecord (by created_at, then id) for each DN number.
+
+    The database keeps one row per DN via ``row_number()``, instead of every record being
+    streamed back and deduplicated here.
+    """
     unique_numbers = [number for number in {number for number in dn_numbers if number}]
     if not unique_numbers:
         return {}
 
-    q = (
-        db.query(DNRecord)
-        .filter(DNRecord.dn_number.in_(unique_numbers))
-        .order_by(DNRecord.dn_number.asc(), DNRecord.created_at.desc(), DNRecord.id.desc())
-    )
+    ranked = _latest_dn_record_ranked(db, unique_numbers, DNRecord)
+    latest_record = aliased(DNRecord, ranked)
+    stmt = select(latest_record).where(ranked.c.rn == 1)
+    return {rec.dn_number: rec for rec in db.scalars(stmt)}
+
+
+def get_dn_rows_by_numbers(db: Session, dn_numbers: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+    """Like :func:`get_dn_map_by_numbers` but returns each DN as a plain ``column -> value`` dict.
+
+    Read-only comparisons over many DNs skip ORM hydration this way, and a dict lookup per
+    field is roughly 10x cheaper than attribute access on a result ``Row``.
+    """
+
+    numbers = [number for number in {number for number in dn_numbers if number}]
+    if not numbers:
+        return {}
 
-    latest: Dict[str, DNRecord] = {}
-    for rec in q:
-        key = rec.dn_number
-        if key not in latest:
-            latest[key] = rec
-            if len(latest) == len(unique_numbers):
-                break
-    return latest
+    stmt = select(*DN.__table__.columns).where(_in_values(db, DN.dn_number, numbers))
+    return {row["dn_number"]: dict(row) for row in db.execute(stmt).mappings()}
+
+
+def get_latest_dn_record_locations_map(db: Session, dn_numbers: Iterable[str]) -> Dict[str, Row]:
+    """Return ``(dn_number, photo_url, lng, lat)`` of the latest DNRecord per DN.
+
+    Picks the same row as :func:`get_latest_dn_records_map` but selects only these
+    columns, for callers that need a DN's last known location and photo.
+    """
+
+    unique_numbers = [number for number in {number for number in dn_numbers if number}]
+    if not unique_numbers:
+        return {}
+
+    ranked = _latest_dn_record_ranked(db, unique_numbers, DNRecord.dn_number, DNRecord.photo_url, DNRecord.lng, DNRecord.lat)
+    stmt = select(ranked.c.dn_number, ranked.c.photo_url, ranked.c.lng, ranked.c.lat).where(ranked.c.rn == 1)
+    return {row.dn_number: row for row in db.execute(stmt)}
 
 
 def search_dn_list(
@@ -746,7 +1017,7 @@ def search_dn_list(
     if trimmed_status_site_values:
         conds.append(DN.status_site.in_(trimmed_status_site_values))
     if dn_numbers:
-        conds.append(DN.dn_number.in_(dn_numbers))
+        conds.append(_in_values(db, DN.dn_number, dn_numbers))
     if du_id:
         conds.append(DN.du_id == du_id)
     trimmed_phone_number = phone_number.strip() if isinstance(phone_number, str) else None
@@ -862,14 +1133,8 @@ def search_dn_list(
     if conds:
         base_q = base_q.filter(and_(*conds))
 
-    total = base_q.count()
     ordered_q = base_q.order_by(latest_record_expr.desc(), DN.id.desc())
-
-    if page_size is None:
-        items = ordered_q.all()
-    else:
-        items = ordered_q.offset((page - 1) * page_size).limit(page_size).all()
-    return total, items
+    return _page_with_total(ordered_q, page, page_size)
 
 
 def get_dn_unique_field_values(db: Session) -> Tuple[Dict[str, List[str]], int]:
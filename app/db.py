@@ -1,11 +1,43 @@
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
 from .settings import settings
 
-engine = create_engine(settings.database_url, pool_pre_ping=True)
+
+def _engine_options(url: str) -> dict:
+    options: dict = {"pool_pre_ping": True}
+    parsed = make_url(url)
+    # SQLite (local dev/tests) uses its own pool classes that take no sizing arguments.
+    if parsed.get_backend_name() != "sqlite":
+        options.update(
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_recycle=settings.db_pool_recycle,
+            pool_timeout=settings.db_pool_timeout,
+            # LIFO keeps the hot connections busy and lets idle extras age out via pool_recycle.
+            pool_use_lifo=True,
+            insertmanyvalues_page_size=settings.db_insertmanyvalues_page_size,
+        )
+    if parsed.get_driver_name() == "psycopg2":
+        # executemany UPDATEs (e.g. the sheet sync's bulk UPDATE by primary key) otherwise go out one
+        # statement per row; batch them into pages of statements per round trip.
+        options.update(
+            executemany_mode="values_plus_batch",
+            executemany_batch_page_size=settings.db_executemany_page_size,
+        )
+    return options
+
+
+engine = create_engine(settings.database_url, **_engine_options(settings.database_url))
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
 Base = declarative_base()
 
+def uses_postgresql(db: Session, driver: str | None = None) -> bool:
+    """Whether ``db`` is bound to PostgreSQL, optionally through a specific DBAPI ``driver``."""
+    dialect = db.get_bind().dialect
+    return dialect.name == "postgresql" and (driver is None or dialect.driver == driver)
+
+
 def get_db():
     db = SessionLocal()
     try:
@@ -1,7 +1,9 @@
 """Database schema migration utilities."""
 
-from sqlalchemy import text, inspect, Table
+from sqlalchemy import Index, text, inspect, Table
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session
+from sqlalchemy.schema import CreateIndex
 
 from app.utils.logging import logger
 from app.models import Base
@@ -245,6 +247,86 @@ def prepare_dn_table_migration(db: Session) -> None:
         raise
 
 
+# Tables that are large in production: startup only reports their missing indexes;
+# build them with ``scripts/create_missing_indexes.py`` (CONCURRENTLY on PostgreSQL).
+STARTUP_INDEX_SKIP_TABLES = frozenset({"dn", "dn_record"})
+
+
+def get_existing_index_names(bind: Engine, table_name: str) -> set[str]:
+    """Return the index names defined on ``table_name``, expression indexes included.
+
+    Inspector reflection skips expression indexes on some dialects, so PostgreSQL and
+    SQLite are read from their catalogs instead.
+    """
+    dialect = bind.dialect.name
+    with bind.connect() as conn:
+        if dialect == "postgresql":
+            rows = conn.execute(
+                text("SELECT indexname FROM pg_indexes WHERE schemaname = current_schema() AND tablename = :table"),
+                {"table": table_name},
+            )
+            return {row[0] for row in rows}
+        if dialect == "sqlite":
+            rows = conn.execute(
+                text("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = :table"),
+                {"table": table_name},
+            )
+            return {row[0] for row in rows}
+        return {index["name"] for index in inspect(conn).get_indexes(table_name)}
+
+
+def get_missing_indexes(bind: Engine, table_name: str, model_table: Table) -> list[Index]:
+    """Return the model indexes of ``model_table`` not present in the database."""
+    if not inspect(bind).has_table(table_name):
+        return []
+    existing = get_existing_index_names(bind, table_name)
+    return sorted(
+        (index for index in model_table.indexes if index.name not in existing),
+        key=lambda index: index.name,
+    )
+
+
+def create_indexes(bind: Engine, table_name: str, indexes: list[Index]) -> None:
+    """Create ``indexes`` one statement at a time.
+
+    On PostgreSQL each index is built with ``CREATE INDEX CONCURRENTLY`` on an autocommit
+    connection, so writes to the table continue while it builds.
+    """
+    if not indexes:
+        return
+    concurrently = bind.dialect.name == "postgresql"
+    with bind.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        for index in indexes:
+            log_migration_action(table_name, "create_index", index.name)
+            if concurrently:
+                index.dialect_options["postgresql"]["concurrently"] = True
+            try:
+                conn.execute(CreateIndex(index, if_not_exists=True))
+            finally:
+                if concurrently:
+                    index.dialect_options["postgresql"]["concurrently"] = False
+
+
+def ensure_table_indexes(db: Session, table_name: str, model_table: Table) -> None:
+    """Create model indexes missing from an existing table (create_all skips existing tables)."""
+    try:
+        missing = get_missing_indexes(db.bind, table_name, model_table)
+        if not missing:
+            return
+        if table_name in STARTUP_INDEX_SKIP_TABLES:
+            logger.warning(
+                "Table %s is missing indexes %s; build them with scripts/create_missing_indexes.py",
+                table_name,
+                ", ".join(index.name for index in missing),
+            )
+            return
+        create_indexes(db.bind, table_name, missing)
+
+    except Exception as e:
+        logger.error("Failed to create indexes for table %s: %s", table_name, e)
+        raise
+
+
 def run_startup_migrations(db: Session) -> None:
     """Run all necessary startup migrations to sync database schema with models."""
     logger.info("Running startup database migrations")
@@ -253,6 +335,7 @@ def run_startup_migrations(db: Session) -> None:
         # Get all tables from the Base metadata
         for table_name, table in Base.metadata.tables.items():
             ensure_table_schema(db, table_name, table)
+            ensure_table_indexes(db, table_name, table)
 
         logger.info("Completed startup database migrations")
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 import os
 from datetime import datetime, timedelta
 
+import anyio.to_thread
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.triggers.cron import CronTrigger
@@ -16,6 +17,8 @@ from fastapi.staticfiles import StaticFiles
 from app.api import router as api_router
 from app.core.aging_orders import scheduled_aging_orders_sheet_sync
 from app.core.sync import scheduled_dn_sheet_sync
+from app.core.sheet_queue import start_sheet_sync_worker, stop_sheet_sync_worker
+from app.services.dn_batcher import dn_batcher
 from app.core.status_delivery_summary import (
     scheduled_status_delivery_lsp_summary_capture,
 )
@@ -70,6 +73,13 @@ async def all_exception_handler(request: Request, exc: Exception):
     return JSONResponse(status_code=500, content={"ok": False, "error": "internal_error"})
 
 
+@app.on_event("startup")
+async def _size_threadpool() -> None:
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = settings.threadpool_size
+    logger.info("Threadpool limited to %d worker threads", limiter.total_tokens)
+
+
 @app.on_event("startup")
 async def _start_scheduler() -> None:
     global _scheduler
@@ -110,6 +120,16 @@ async def _start_scheduler() -> None:
     _scheduler.start()
 
 
+@app.on_event("startup")
+async def _start_sheet_sync_worker() -> None:
+    await start_sheet_sync_worker()
+
+
+@app.on_event("startup")
+async def _start_dn_batcher() -> None:
+    await dn_batcher.start()
+
+
 @app.on_event("shutdown")
 async def _shutdown_scheduler() -> None:
     global _scheduler
@@ -118,6 +138,16 @@ async def _shutdown_scheduler() -> None:
         _scheduler = None
 
 
+@app.on_event("shutdown")
+async def _stop_sheet_sync_worker() -> None:
+    await stop_sheet_sync_worker()
+
+
+@app.on_event("shutdown")
+async def _stop_dn_batcher() -> None:
+    await dn_batcher.stop()
+
+
 if __name__ == "__main__":  # pragma: no cover
     import uvicorn
 
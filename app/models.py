@@ -1,11 +1,16 @@
 import json
-from sqlalchemy import Column, String, Integer, DateTime, Text, UniqueConstraint, Boolean
+from sqlalchemy import Column, String, Integer, DateTime, Text, UniqueConstraint, Boolean, Index
 from sqlalchemy.sql import func
 from .db import Base
 
 
 class Vehicle(Base):
     __tablename__ = "vehicle"
+    __table_args__ = (
+        # Serve the vehicle list filters: status plus an arrive/depart time window.
+        Index("ix_vehicle_status_arrive", "status", "arrive_time"),
+        Index("ix_vehicle_status_depart", "status", "depart_time"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     vehicle_plate = Column(String(32), unique=True, index=True, nullable=False)
@@ -25,6 +30,10 @@ class Vehicle(Base):
     )
 
 
+# Plate lookups compare upper(vehicle_plate); this expression index serves them.
+Index("ix_vehicle_plate_upper", func.upper(Vehicle.vehicle_plate))
+
+
 class DN(Base):
     __tablename__ = "dn"
     id = Column(Integer, primary_key=True, index=True)
@@ -68,6 +77,18 @@ class DN(Base):
     update_count = Column(Integer, nullable=False, default=0, server_default="0")
 
 
+# search_dn_list filters compare trimmed (and for status_delivery, lowercased) values;
+# these expression indexes match those predicates so the dashboard filters avoid full scans.
+# Startup does not build indexes on dn; existing databases need the one-off
+# scripts/create_missing_indexes.py (or scripts/create_dn_filter_indexes.sql) run once.
+Index("ix_dn_status_delivery_norm", func.lower(func.trim(DN.status_delivery)))
+Index("ix_dn_plan_mos_date_trim", func.trim(DN.plan_mos_date))
+Index("ix_dn_lsp_trim", func.trim(DN.lsp))
+Index("ix_dn_region_trim", func.trim(DN.region))
+Index("ix_dn_status_wh_trim", func.trim(DN.status_wh))
+Index("ix_dn_subcon_trim", func.trim(DN.subcon))
+
+
 class DNRecord(Base):
     __tablename__ = "dn_record"
     id = Column(Integer, primary_key=True, index=True)
@@ -4,12 +4,17 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 __all__ = ["VehicleSigninRequest", "VehicleDepartRequest"]
 
+# Strings arrive stripped from pydantic-core, so endpoints only check for emptiness.
+_REQUEST_CONFIG = ConfigDict(populate_by_name=True, extra="ignore", str_strip_whitespace=True, frozen=True)
+
 
 class VehicleSigninRequest(BaseModel):
+    model_config = _REQUEST_CONFIG
+
     vehicle_plate: str = Field(..., alias="vehiclePlate")
     lsp: str = Field(..., alias="LSP")
     vehicle_type: str | None = Field(None, alias="vehicleType")
@@ -17,13 +22,9 @@ class VehicleSigninRequest(BaseModel):
     contact_number: str | None = Field(None, alias="contactNumber")
     arrive_time: datetime | None = Field(None, alias="arriveTime")
 
-    class Config:
-        populate_by_name = True
-
 
 class VehicleDepartRequest(BaseModel):
+    model_config = _REQUEST_CONFIG
+
     vehicle_plate: str = Field(..., alias="vehiclePlate")
     depart_time: datetime | None = Field(None, alias="departTime")
-
-    class Config:
-        populate_by_name = True
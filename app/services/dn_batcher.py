@@ -0,0 +1,144 @@
+"""Coalesce concurrent DN updates into batched database writes."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from app.crud import apply_dn_updates
+from app.db import SessionLocal
+from app.utils.logging import logger
+
+__all__ = [
+    "DN_BATCH_WINDOW_SECONDS",
+    "DN_BATCH_MAX_SIZE",
+    "DNUpdateResult",
+    "DNUpdateBatcher",
+    "dn_batcher",
+]
+
+DN_BATCH_WINDOW_SECONDS = 0.005
+DN_BATCH_MAX_SIZE = 256
+
+DNUpdateResult = tuple[Optional[str], Optional[int], int, int]
+
+
+@dataclass(slots=True)
+class _PendingUpdate:
+    dn_number: str
+    dn_fields: dict[str, Any]
+    record_fields: dict[str, Any]
+    future: asyncio.Future[DNUpdateResult] = field(repr=False)
+
+
+class DNUpdateBatcher:
+    """Collect DN updates for a short window and write them in one transaction.
+
+    ``submit`` resolves to the same ``(gs_sheet, gs_row, dn_id, record_id)`` tuple
+    :func:`app.crud.apply_dn_updates` returns for a single update.
+    """
+
+    def __init__(self, window_seconds: float = DN_BATCH_WINDOW_SECONDS, max_size: int = DN_BATCH_MAX_SIZE) -> None:
+        self.window_seconds = window_seconds
+        self.max_size = max_size
+        self._queue: asyncio.Queue[_PendingUpdate] | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        queue, self._queue = self._queue, None
+        while queue is not None and not queue.empty():
+            pending = queue.get_nowait()
+            if not pending.future.done():
+                pending.future.set_exception(RuntimeError("DN update batcher stopped"))
+
+    async def submit(
+        self,
+        dn_number: str,
+        dn_fields: dict[str, Any],
+        record_fields: dict[str, Any],
+    ) -> DNUpdateResult:
+        if self._queue is None:
+            raise RuntimeError("DN update batcher is not running")
+        future: asyncio.Future[DNUpdateResult] = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait(_PendingUpdate(dn_number, dn_fields, record_fields, future))
+        return await future
+
+    async def _drain(self, queue: asyncio.Queue[_PendingUpdate]) -> list[_PendingUpdate]:
+        batch = [await queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.window_seconds
+        while len(batch) < self.max_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        queue = self._queue
+        assert queue is not None
+        while True:
+            batch = await self._drain(queue)
+            try:
+                results = await asyncio.to_thread(_write_batch, batch)
+            except Exception as exc:
+                if len(batch) == 1:
+                    logger.exception("DN update failed for %s", batch[0].dn_number)
+                    _resolve(batch[0], exc=exc)
+                    continue
+                # One bad update rolls back the whole transaction; replay each update on its
+                # own, in order, so only the failing request sees the error.
+                logger.exception("Batched DN update failed for %d updates; retrying individually", len(batch))
+                for pending in batch:
+                    try:
+                        (result,) = await asyncio.to_thread(_write_batch, [pending])
+                    except Exception as single_exc:
+                        logger.exception("DN update failed for %s", pending.dn_number)
+                        _resolve(pending, exc=single_exc)
+                    else:
+                        _resolve(pending, result=result)
+                continue
+            for pending, result in zip(batch, results):
+                _resolve(pending, result=result)
+
+
+def _resolve(
+    pending: _PendingUpdate,
+    result: DNUpdateResult | None = None,
+    exc: BaseException | None = None,
+) -> None:
+    if pending.future.done():
+        return
+    if exc is not None:
+        pending.future.set_exception(exc)
+    else:
+        pending.future.set_result(result)
+
+
+def _write_batch(batch: list[_PendingUpdate]) -> list[DNUpdateResult]:
+    with SessionLocal() as db:
+        return apply_dn_updates(
+            db,
+            [(pending.dn_number, pending.dn_fields, pending.record_fields) for pending in batch],
+        )
+
+
+dn_batcher = DNUpdateBatcher()
@@ -9,6 +9,21 @@ class Settings(BaseSettings):
 
     app_env: str = os.getenv("APP_ENV", "development")
     database_url: str | None = os.getenv("DATABASE_URL")  # 不给默认，缺失就暴露问题
+    # Per-process pool: each uvicorn worker opens up to db_pool_size + db_max_overflow
+    # connections, so workers * (size + overflow) must stay below Postgres max_connections.
+    db_pool_size: int = int(os.getenv("DB_POOL_SIZE", str(max(10, (os.cpu_count() or 1) * 2))))
+    db_max_overflow: int = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+    db_pool_recycle: int = int(os.getenv("DB_POOL_RECYCLE", "300"))
+    db_pool_timeout: float = float(os.getenv("DB_POOL_TIMEOUT", "10"))
+    # Statements per psycopg2 execute_batch round trip for executemany UPDATE/DELETE.
+    db_executemany_page_size: int = int(os.getenv("DB_EXECUTEMANY_PAGE_SIZE", "500"))
+    # Rows per multi-row INSERT ... VALUES statement when an executemany INSERT is batched.
+    db_insertmanyvalues_page_size: int = int(os.getenv("DB_INSERTMANYVALUES_PAGE_SIZE", "5000"))
+    # Re-normalize plan_mos_date/status_delivery of every active DN after each sheet sync.
+    dn_sync_normalize_database: bool = os.getenv("DN_SYNC_NORMALIZE_DATABASE", "").strip().lower() in {"1", "true", "yes"}
+    # Sync routes run on AnyIO's worker threads (40 by default); keep at least one
+    # thread per pooled connection so requests queue on the pool, not on the threadpool.
+    threadpool_size: int = int(os.getenv("THREADPOOL_SIZE", "0")) or max(40, db_pool_size + db_max_overflow)
     allowed_origins: list[str] | str = Field(default_factory=lambda: ["*"])
     storage_driver: str = os.getenv("STORAGE_DRIVER", "disk")
     storage_disk_path: str = os.getenv("STORAGE_DISK_PATH", "/data/uploads")
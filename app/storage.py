@@ -1,7 +1,9 @@
-import os, uuid
+import os, shutil, uuid
+from typing import BinaryIO
 from .settings import settings
 
 _s3 = None
+_COPY_CHUNK_SIZE = 1 << 20
 
 def _s3_client():
     global _s3
@@ -16,7 +18,9 @@ def _s3_client():
         )
     return _s3
 
-def save_file(content: bytes, content_type: str):
+def save_file(content: bytes | BinaryIO, content_type: str):
+    """Persist an upload. ``content`` may be raw bytes or a readable binary file object;
+    file objects are streamed in chunks so large uploads are never fully buffered."""
     ext = {
         "image/jpeg": ".jpg",
         "image/png": ".png",
@@ -27,7 +31,15 @@ def save_file(content: bytes, content_type: str):
 
     if settings.storage_driver == "s3":
         s3 = _s3_client()
-        s3.put_object(Bucket=settings.s3_bucket, Key=key, Body=content, ContentType=content_type, ACL="public-read")
+        if isinstance(content, (bytes, bytearray)):
+            s3.put_object(Bucket=settings.s3_bucket, Key=key, Body=content, ContentType=content_type, ACL="public-read")
+        else:
+            s3.upload_fileobj(
+                content,
+                settings.s3_bucket,
+                key,
+                ExtraArgs={"ContentType": content_type, "ACL": "public-read"},
+            )
         base = settings.storage_base_url or settings.s3_endpoint.rstrip("/") + "/" + settings.s3_bucket
         return f"{base}/{key}"
     else:
@@ -35,5 +47,8 @@ def save_file(content: bytes, content_type: str):
         os.makedirs(os.path.join(base_dir, os.path.dirname(key)), exist_ok=True)
         path = os.path.join(base_dir, key)
         with open(path, "wb") as f:
-            f.write(content)
+            if isinstance(content, (bytes, bytearray)):
+                f.write(content)
+            else:
+                shutil.copyfileobj(content, f, _COPY_CHUNK_SIZE)
         return f"/uploads/{key}"
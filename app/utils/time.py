@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
+import re
 
 PLAN_MOS_DATE_FORMATS: tuple[str, ...] = (
     "%d %b %y",
@@ -13,6 +15,14 @@ PLAN_MOS_DATE_FORMATS: tuple[str, ...] = (
     "%d-%m-%Y",
     "%Y/%m/%d",
 )
+# "D Mon YY" / "D Mon YYYY", the dominant sheet date layouts, parsed without strptime.
+_DAY_MON_YEAR = re.compile(r"([0-9]{1,2}) ([A-Za-z]{3}) ([0-9]{2}|[0-9]{4})")
+_MONTH_ABBR = {
+    name: number
+    for number, name in enumerate(
+        ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"), start=1
+    )
+}
 
 __all__ = [
     "TZ_GMT7",
@@ -20,10 +30,17 @@ __all__ = [
     "to_gmt7_iso",
     "parse_gmt7_date_range",
     "parse_plan_mos_date",
+    "parse_day_mon_year",
+    "current_sheet_timestamp_gmt7",
 ]
 
 
-TZ_GMT7 = timezone(timedelta(hours=7))
+_GMT7_OFFSET = timedelta(hours=7)
+_GMT7_SUFFIX = "+07:00"
+TZ_GMT7 = timezone(_GMT7_OFFSET)
+
+# Google Sheet timestamp layout (M/D/YYYY H:MM:SS, no zero padding on month/day/hour).
+_SHEET_TIMESTAMP_FORMAT = "{0.month}/{0.day}/{0.year} {0.hour}:{0:%M:%S}"
 
 
 def ensure_gmt7_timezone(dt: datetime | None) -> datetime | None:
@@ -40,10 +57,17 @@ def to_gmt7_iso(dt: datetime | None) -> str | None:
     if dt is None:
         return None
     if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=timezone.utc)
+        # Naive values are UTC: shift by the fixed offset and append its suffix,
+        # which avoids attaching a tzinfo and converting through astimezone().
+        return (dt + _GMT7_OFFSET).isoformat() + _GMT7_SUFFIX
     return dt.astimezone(TZ_GMT7).isoformat()
 
 
+def current_sheet_timestamp_gmt7() -> str:
+    """Return the current GMT+7 time formatted for ATA/ATD cells in Google Sheets."""
+    return _SHEET_TIMESTAMP_FORMAT.format(datetime.now(TZ_GMT7))
+
+
 def parse_gmt7_date_range(
     date_from: datetime | None, date_to: datetime | None
 ) -> tuple[datetime | None, datetime | None]:
@@ -62,8 +86,34 @@ def parse_gmt7_date_range(
     return _normalize(date_from, True), _normalize(date_to, False)
 
 
+def parse_day_mon_year(value: str) -> date | None:
+    """Parse ``D Mon YY`` / ``D Mon YYYY`` (English month abbreviation) without strptime.
+
+    Two-digit years use strptime's ``%y`` pivot. Returns ``None`` for any other layout
+    or an impossible date, so callers can fall back to their strptime formats.
+    """
+    match = _DAY_MON_YEAR.fullmatch(value)
+    if match is None:
+        return None
+    month = _MONTH_ABBR.get(match[2].lower())
+    if month is None:
+        return None
+    year = int(match[3])
+    if len(match[3]) == 2:
+        # Same pivot as strptime's %y: 69-99 -> 19xx, 00-68 -> 20xx.
+        year += 1900 if year >= 69 else 2000
+    try:
+        return date(year, month, int(match[1]))
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=1024)
 def parse_plan_mos_date(value: str | None) -> date | None:
-    """Parse a Plan MOS date string into a ``date`` if possible."""
+    """Parse a Plan MOS date string into a ``date`` if possible.
+
+    Cached because DN tables repeat the same handful of plan dates on many rows.
+    """
 
     if not value or not isinstance(value, str):
         return None
@@ -84,6 +134,10 @@ def parse_plan_mos_date(value: str | None) -> date | None:
     for incorrect, correct in month_replacements.items():
         normalized = normalized.replace(incorrect, correct)
 
+    parsed = parse_day_mon_year(normalized)
+    if parsed is not None:
+        return parsed
+
     for fmt in PLAN_MOS_DATE_FORMATS:
         try:
             return datetime.strptime(normalized, fmt).date()
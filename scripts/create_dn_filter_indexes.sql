@@ -0,0 +1,14 @@
+-- Expression indexes for the search_dn_list dashboard filters (ix_dn_*_trim / ix_dn_status_delivery_norm).
+-- Startup does not build indexes on dn, so run this once on existing databases,
+-- or run: python scripts/create_missing_indexes.py dn
+--
+-- CONCURRENTLY keeps dn writable during each build. It cannot run inside a transaction block,
+-- so execute the statements one at a time in autocommit mode (the psql default).
+-- If a build is interrupted, the index stays INVALID: DROP INDEX CONCURRENTLY it and re-run.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_dn_status_delivery_norm ON dn (lower(trim(status_delivery)));
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_dn_plan_mos_date_trim ON dn (trim(plan_mos_date));
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_dn_lsp_trim ON dn (trim(lsp));
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_dn_region_trim ON dn (trim(region));
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_dn_status_wh_trim ON dn (trim(status_wh));
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_dn_subcon_trim ON dn (trim(subcon));
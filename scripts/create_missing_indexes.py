@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+"""
+Build model indexes that are missing from an existing database.
+
+Startup migrations skip index builds on the large tables (dn, dn_record) so a deploy
+never blocks writes; run this once after deploying a release that declares new
+indexes on them. On PostgreSQL every index is built with CREATE INDEX CONCURRENTLY,
+and indexes left INVALID by an interrupted concurrent build are dropped and rebuilt.
+
+Usage:
+    python scripts/create_missing_indexes.py [--dry-run] [TABLE ...]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import text  # noqa: E402
+from app.db import engine  # noqa: E402
+from app.db_migrations import STARTUP_INDEX_SKIP_TABLES, create_indexes, get_missing_indexes  # noqa: E402
+from app.models import Base  # noqa: E402
+from app.utils.logging import logger  # noqa: E402
+
+_INVALID_INDEXES_SQL = text(
+    """
+    SELECT index_class.relname
+    FROM pg_index
+    JOIN pg_class AS index_class ON index_class.oid = pg_index.indexrelid
+    JOIN pg_class AS table_class ON table_class.oid = pg_index.indrelid
+    JOIN pg_namespace ON pg_namespace.oid = table_class.relnamespace
+    WHERE NOT pg_index.indisvalid
+      AND table_class.relname = :table
+      AND pg_namespace.nspname = current_schema()
+    """
+)
+
+
+def drop_invalid_indexes(table_name: str, dry_run: bool) -> list[str]:
+    """Drop indexes an interrupted CONCURRENTLY build left INVALID so they get rebuilt."""
+    if engine.dialect.name != "postgresql":
+        return []
+    declared = {index.name for index in Base.metadata.tables[table_name].indexes}
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        invalid = [name for (name,) in conn.execute(_INVALID_INDEXES_SQL, {"table": table_name}) if name in declared]
+        for name in invalid:
+            if dry_run:
+                logger.info(f"[DRY RUN] Would drop invalid index {name} on {table_name}")
+                continue
+            logger.info(f"Dropping invalid index {name} on {table_name}")
+            conn.execute(text(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"'))
+    return invalid
+
+
+def create_missing_indexes(tables: list[str], dry_run: bool = False) -> dict[str, list[str]]:
+    """Build the missing model indexes of ``tables``; returns the index names per table."""
+    built: dict[str, list[str]] = {}
+    for table_name in tables:
+        model_table = Base.metadata.tables[table_name]
+        drop_invalid_indexes(table_name, dry_run)
+        missing = get_missing_indexes(engine, table_name, model_table)
+        built[table_name] = [index.name for index in missing]
+        if not missing:
+            logger.info(f"Table {table_name}: no missing indexes")
+            continue
+        if dry_run:
+            for index in missing:
+                logger.info(f"[DRY RUN] Would create index {index.name} on {table_name}")
+            continue
+        create_indexes(engine, table_name, missing)
+    return built
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build model indexes missing from an existing database")
+    parser.add_argument(
+        "tables",
+        nargs="*",
+        default=sorted(STARTUP_INDEX_SKIP_TABLES),
+        help="Tables to check (default: the tables startup migrations skip)",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Show which indexes would be built without changing the database",
+    )
+    args = parser.parse_args()
+
+    unknown = [table for table in args.tables if table not in Base.metadata.tables]
+    if unknown:
+        parser.error(f"unknown tables: {', '.join(unknown)}")
+
+    try:
+        built = create_missing_indexes(args.tables, dry_run=args.dry_run)
+    except Exception as e:
+        logger.error(f"Index build failed: {e}", exc_info=True)
+        sys.exit(1)
+
+    for table_name, names in built.items():
+        print(f"{table_name}: {', '.join(names) if names else 'up to date'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Test batched DN updates used by the /update endpoint."""
+
+import os
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+os.environ.setdefault("STORAGE_DISK_PATH", "./data/uploads")
+
+from app.models import Base, DN, DNRecord  # noqa: E402
+from app.crud import apply_dn_updates  # noqa: E402
+
+
+@pytest.fixture
+def test_db():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def _record(status_delivery=None, remark=None, updated_by=None):
+    return {
+        "status_delivery": status_delivery,
+        "status_site": None,
+        "remark": remark,
+        "photo_url": None,
+        "lng": None,
+        "lat": None,
+        "updated_by": updated_by,
+        "phone_number": None,
+    }
+
+
+def test_apply_dn_updates_upserts_and_counts(test_db):
+    test_db.add(DN(dn_number="DN0001", remark="old", gs_sheet="Plan", gs_row=7, update_count=2))
+    test_db.commit()
+
+    results = apply_dn_updates(
+        test_db,
+        [
+            ("DN0001", {"status_delivery": "ON THE WAY"}, _record("ON THE WAY", updated_by="alice")),
+            ("DN0002", {"status_delivery": "POD"}, _record("POD", remark="done")),
+            ("DN0001", {"status_delivery": "POD"}, _record("POD")),
+        ],
+    )
+
+    assert [result[:2] for result in results] == [("Plan", 7), (None, None), ("Plan", 7)]
+    assert len({result[3] for result in results}) == 3
+
+    test_db.expire_all()
+    existing = test_db.query(DN).filter(DN.dn_number == "DN0001").one()
+    assert existing.update_count == 4
+    assert existing.status_delivery == "POD"
+    assert existing.remark is None
+    assert existing.last_updated_by == "alice"
+    assert results[0][2] == results[2][2] == existing.id
+
+    created = test_db.query(DN).filter(DN.dn_number == "DN0002").one()
+    assert created.update_count == 1
+    assert created.remark == "done"
+    assert created.is_deleted == "N"
+
+    records = test_db.query(DNRecord).order_by(DNRecord.id).all()
+    assert [(record.id, record.dn_number) for record in records] == [
+        (results[0][3], "DN0001"),
+        (results[1][3], "DN0002"),
+        (results[2][3], "DN0001"),
+    ]
+
+
+def test_apply_dn_updates_hides_location_of_deleted_dn(test_db):
+    test_db.add(DN(dn_number="DN0003", is_deleted="Y", gs_sheet="Plan", gs_row=3))
+    test_db.commit()
+
+    (result,) = apply_dn_updates(test_db, [("DN0003", {}, _record("POD"))])
+
+    assert result[:2] == (None, None)
+    test_db.expire_all()
+    assert test_db.query(DN).filter(DN.dn_number == "DN0003").one().is_deleted == "N"
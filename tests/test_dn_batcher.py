@@ -0,0 +1,40 @@
+"""Test that a failing DN update does not fail the rest of its batch."""
+
+import asyncio
+import os
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+os.environ.setdefault("STORAGE_DISK_PATH", "./data/uploads")
+
+from app.services import dn_batcher  # noqa: E402
+from app.services.dn_batcher import DNUpdateBatcher  # noqa: E402
+
+
+def test_failing_update_only_fails_its_own_request(monkeypatch):
+    calls = []
+
+    def fake_write_batch(batch):
+        calls.append([pending.dn_number for pending in batch])
+        if any(pending.dn_number == "BAD" for pending in batch):
+            raise ValueError("bad row")
+        return [(None, None, index, index) for index, _ in enumerate(batch)]
+
+    monkeypatch.setattr(dn_batcher, "_write_batch", fake_write_batch)
+
+    async def scenario():
+        batcher = DNUpdateBatcher(window_seconds=0.05)
+        await batcher.start()
+        try:
+            return await asyncio.gather(
+                *(batcher.submit(number, {}, {}) for number in ("DN1", "BAD", "DN2")),
+                return_exceptions=True,
+            )
+        finally:
+            await batcher.stop()
+
+    first, bad, second = asyncio.run(scenario())
+
+    assert calls == [["DN1", "BAD", "DN2"], ["DN1"], ["BAD"], ["DN2"]]
+    assert first == (None, None, 0, 0)
+    assert isinstance(bad, ValueError)
+    assert second == (None, None, 0, 0)
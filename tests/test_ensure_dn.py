@@ -0,0 +1,47 @@
+"""Test the single-statement ensure_dn upsert."""
+
+import os
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+os.environ.setdefault("STORAGE_DISK_PATH", "./data/uploads")
+
+from app.models import Base, DN  # noqa: E402
+from app.crud import ensure_dn  # noqa: E402
+
+
+@pytest.fixture
+def test_db():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def test_ensure_dn_creates_missing_dn(test_db):
+    dn = ensure_dn(test_db, "DN0001", status_delivery="NO STATUS", remark=None)
+
+    assert dn.id is not None
+    assert dn.status_delivery == "NO STATUS"
+    assert dn.is_deleted == "N"
+    assert dn.update_count == 0
+
+
+def test_ensure_dn_updates_and_undeletes_existing_dn(test_db):
+    test_db.add(DN(dn_number="DN0002", is_deleted="Y", remark="old", last_updated_by="bob", lsp="LSP"))
+    test_db.commit()
+
+    dn = ensure_dn(test_db, "DN0002", remark="new", last_updated_by=None)
+
+    assert dn.is_deleted == "N"
+    assert dn.remark == "new"
+    assert dn.last_updated_by is None
+    assert dn.lsp == "LSP"
+    assert test_db.query(DN).count() == 1
@@ -0,0 +1,40 @@
+"""Test the startup index backfill and its large-table guard."""
+
+import os
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+os.environ.setdefault("STORAGE_DISK_PATH", "./data/uploads")
+
+from app.db_migrations import ensure_table_indexes, get_missing_indexes  # noqa: E402
+from app.models import Base, DN, Vehicle  # noqa: E402
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'indexes.db'}")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX ix_vehicle_plate_upper"))
+        conn.execute(text("DROP INDEX ix_dn_lsp_trim"))
+    yield engine
+    engine.dispose()
+
+
+def test_expression_indexes_are_detected_as_missing(engine):
+    assert [index.name for index in get_missing_indexes(engine, "vehicle", Vehicle.__table__)] == [
+        "ix_vehicle_plate_upper"
+    ]
+    assert [index.name for index in get_missing_indexes(engine, "dn", DN.__table__)] == ["ix_dn_lsp_trim"]
+
+
+def test_startup_builds_small_tables_and_skips_large_ones(engine):
+    with Session(engine) as db:
+        ensure_table_indexes(db, "vehicle", Vehicle.__table__)
+        ensure_table_indexes(db, "dn", DN.__table__)
+
+    assert get_missing_indexes(engine, "vehicle", Vehicle.__table__) == []
+    assert [index.name for index in get_missing_indexes(engine, "dn", DN.__table__)] == ["ix_dn_lsp_trim"]
@@ -0,0 +1,31 @@
+"""Test the identifier membership filter used by the bulk DN lookups."""
+
+import os
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+os.environ.setdefault("STORAGE_DISK_PATH", "./data/uploads")
+
+from app.models import DN  # noqa: E402
+from app.crud import _in_values  # noqa: E402
+
+
+def test_postgresql_binds_the_list_as_one_array():
+    db = Session(bind=create_engine("postgresql+psycopg2://user@localhost/db"))
+    numbers = [f"DN{index}" for index in range(500)]
+    compiled = select(DN.id).where(_in_values(db, DN.dn_number, numbers)).compile(
+        dialect=postgresql.psycopg2.dialect()
+    )
+
+    assert "= ANY (%(param_1)s::VARCHAR[])" in str(compiled)
+    assert compiled.params == {"param_1": numbers}
+
+
+def test_other_dialects_keep_expanding_in():
+    db = Session(bind=create_engine("sqlite:///:memory:"))
+    condition = _in_values(db, DN.dn_number, ["DN1", "DN2"])
+
+    assert condition.compare(DN.dn_number.in_(["DN1", "DN2"]))
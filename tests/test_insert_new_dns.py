@@ -0,0 +1,65 @@
+"""Test bulk DN creation used by the batch_update endpoint."""
+
+import os
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+os.environ.setdefault("STORAGE_DISK_PATH", "./data/uploads")
+
+from app.models import Base, DN, DNRecord  # noqa: E402
+from app.crud import bulk_add_dn_records, insert_new_dns  # noqa: E402
+
+
+@pytest.fixture
+def test_db():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def test_insert_new_dns_returns_only_inserted_numbers(test_db):
+    test_db.add(DN(dn_number="DN0001", status_delivery="POD"))
+    test_db.commit()
+
+    inserted = insert_new_dns(test_db, ["DN0001", "DN0002", "DN0003"], status_delivery="NO STATUS")
+
+    assert inserted == {"DN0002", "DN0003"}
+    existing = test_db.query(DN).filter(DN.dn_number == "DN0001").one()
+    assert existing.status_delivery == "POD"
+    created = test_db.query(DN).filter(DN.dn_number == "DN0002").one()
+    assert created.status_delivery == "NO STATUS"
+    assert created.is_deleted == "N"
+
+
+def test_insert_new_dns_with_empty_input(test_db):
+    assert insert_new_dns(test_db, []) == set()
+    assert test_db.query(DN).count() == 0
+
+
+def test_bulk_add_dn_records_for_new_dns(test_db):
+    inserted = insert_new_dns(test_db, ["DN0004", "DN0005"], status_delivery="NO STATUS", update_count=1)
+    bulk_add_dn_records(test_db, sorted(inserted), status_delivery="NO STATUS")
+
+    records = test_db.query(DNRecord).order_by(DNRecord.dn_number).all()
+    assert [(record.dn_number, record.status_delivery) for record in records] == [
+        ("DN0004", "NO STATUS"),
+        ("DN0005", "NO STATUS"),
+    ]
+    assert {dn.update_count for dn in test_db.query(DN).all()} == {1}
+
+
+def test_uncommitted_inserts_roll_back_together(test_db):
+    inserted = insert_new_dns(test_db, ["DN0006"], commit=False, status_delivery="NO STATUS", update_count=1)
+    bulk_add_dn_records(test_db, sorted(inserted), commit=False, status_delivery="NO STATUS")
+    test_db.rollback()
+
+    assert test_db.query(DN).count() == 0
+    assert test_db.query(DNRecord).count() == 0
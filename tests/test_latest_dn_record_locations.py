@@ -0,0 +1,69 @@
+"""Test the projected DN lookups used by the sheet sync."""
+
+import os
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+os.environ.setdefault("STORAGE_DISK_PATH", "./data/uploads")
+
+from app.models import Base, DN, DNRecord  # noqa: E402
+from app.crud import (  # noqa: E402
+    get_dn_map_by_numbers,
+    get_dn_rows_by_numbers,
+    get_latest_dn_record_locations_map,
+    get_latest_dn_records_map,
+)
+
+
+@pytest.fixture
+def test_db():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def test_latest_locations_match_latest_records(test_db):
+    same_time = datetime(2025, 1, 2, 8, 0)
+    test_db.add_all(
+        [
+            DNRecord(dn_number="DN1", photo_url="old", lng="1", lat="1", created_at=datetime(2025, 1, 1)),
+            DNRecord(dn_number="DN1", photo_url="new", lng="2", lat="2", created_at=datetime(2025, 1, 3)),
+            DNRecord(dn_number="DN2", photo_url="first", lng="3", lat="3", created_at=same_time),
+            DNRecord(dn_number="DN2", photo_url="second", lng="4", lat="4", created_at=same_time),
+            DNRecord(dn_number="DN3", photo_url="other", lng="5", lat="5", created_at=same_time),
+        ]
+    )
+    test_db.commit()
+
+    numbers = ["DN1", "DN2", "DN4", ""]
+    expected = get_latest_dn_records_map(test_db, numbers)
+    locations = get_latest_dn_record_locations_map(test_db, numbers)
+
+    assert set(locations) == set(expected) == {"DN1", "DN2"}
+    for number, record in expected.items():
+        row = locations[number]
+        assert (row.photo_url, row.lng, row.lat) == (record.photo_url, record.lng, record.lat)
+    assert locations["DN2"].photo_url == "second"
+
+
+def test_dn_rows_hold_the_same_columns_as_orm_rows(test_db):
+    test_db.add_all([DN(dn_number="DN1", lsp="LSP", update_count=2), DN(dn_number="DN2", remark="r")])
+    test_db.commit()
+
+    orm_map = get_dn_map_by_numbers(test_db, ["DN1", "DN2", "DN9"])
+    row_map = get_dn_rows_by_numbers(test_db, ["DN1", "DN2", "DN9"])
+
+    assert set(row_map) == set(orm_map) == {"DN1", "DN2"}
+    for number, dn in orm_map.items():
+        for column in DN.__table__.columns:
+            assert row_map[number][column.name] == getattr(dn, column.name)
+    assert get_dn_rows_by_numbers(test_db, []) == {}
@@ -0,0 +1,58 @@
+"""Test the single-query pagination used by the DN search helpers."""
+
+import os
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+os.environ.setdefault("STORAGE_DISK_PATH", "./data/uploads")
+
+from app.models import Base, DNRecord  # noqa: E402
+from app.crud import list_dn_records_by_dn_numbers, search_dn_records  # noqa: E402
+
+
+@pytest.fixture
+def test_db():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    db = TestingSessionLocal()
+    start = datetime(2025, 1, 1)
+    for index in range(25):
+        db.add(
+            DNRecord(
+                dn_number=f"DN{index % 5}",
+                status_delivery="POD" if index % 2 else "ARRIVED AT SITE",
+                created_at=start + timedelta(minutes=index),
+            )
+        )
+    db.commit()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def test_pages_carry_the_full_match_count(test_db):
+    total, first_page = search_dn_records(test_db, status_delivery="POD", page=1, page_size=5)
+    _, last_page = search_dn_records(test_db, status_delivery="POD", page=3, page_size=5)
+
+    assert total == 12
+    assert len(first_page) == 5
+    assert len(last_page) == 2
+    assert first_page[0].created_at > first_page[-1].created_at
+
+
+def test_page_past_the_end_still_reports_total(test_db):
+    assert search_dn_records(test_db, page=9, page_size=10) == (25, [])
+    assert list_dn_records_by_dn_numbers(test_db, ["DN1"], page=4, page_size=5) == (5, [])
+    assert list_dn_records_by_dn_numbers(test_db, ["DN9"], page=1, page_size=5) == (0, [])
+
+
+def test_unpaginated_search_counts_returned_rows(test_db):
+    total, items = search_dn_records(test_db, dn_number="DN2")
+
+    assert total == len(items) == 5
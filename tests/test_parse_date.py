@@ -0,0 +1,36 @@
+"""Test Plan MOS date parsing in app.core.sheet.parse_date."""
+
+import os
+from datetime import datetime
+
+import pytest
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+os.environ.setdefault("STORAGE_DISK_PATH", "./data/uploads")
+
+from app.core.sheet import parse_date  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("1 Jan 24", datetime(2024, 1, 1)),
+        ("01 Jan 2024", datetime(2024, 1, 1)),
+        ("05 sep 25", datetime(2025, 9, 5)),
+        ("1 Jan 68", datetime(2068, 1, 1)),
+        ("1 Jan 69", datetime(1969, 1, 1)),
+        (" 7  Sept  25 ", datetime(2025, 9, 7)),
+        ("3 Okt 2025", datetime(2025, 10, 3)),
+        ("1-Jan-2024", datetime(2024, 1, 1)),
+        ("1-Jan-24", datetime(2024, 1, 1)),
+        ("5Jan", datetime(1900, 1, 5)),
+        ("2024/3/1", datetime(2024, 3, 1)),
+    ],
+)
+def test_parse_date_known_formats(raw, expected):
+    assert parse_date(raw) == expected
+
+
+@pytest.mark.parametrize("raw", ["TBD", "31 Feb 24", "2024/13/01", "1 January 24", "1Jan24", ""])
+def test_parse_date_returns_input_when_unparseable(raw):
+    assert parse_date(raw) == raw
@@ -0,0 +1,191 @@
+"""Test how Plan MOS sheet values are fetched for syncing and archiving."""
+
+import os
+import threading
+import time
+
+import gspread.exceptions
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+os.environ.setdefault("STORAGE_DISK_PATH", "./data/uploads")
+
+from app.core import sheet  # noqa: E402
+from app.dn_columns import get_sheet_columns  # noqa: E402
+
+
+class FakePlanSheet:
+    spreadsheet_id = "spreadsheet-1"
+
+    def __init__(self, sheet_id, title, dn_numbers, delay):
+        self.id = sheet_id
+        self.title = title
+        self._dn_numbers = dn_numbers
+        self._delay = delay
+        self.thread_name = None
+        self.requested_range = None
+
+    def values(self, range_name):
+        # Mimics the values endpoint: rows from A4 on, trailing empty cells dropped.
+        self.thread_name = threading.current_thread().name
+        self.requested_range = range_name
+        time.sleep(self._delay)
+        return [[dn] for dn in self._dn_numbers]
+
+
+def test_process_all_sheets_keeps_sheet_order(monkeypatch):
+    sheets = [
+        FakePlanSheet(1, "Plan MOS 01", ["DN1", "DN2"], delay=0.05),
+        FakePlanSheet(2, "Plan MOS 02", ["DN3"], delay=0.0),
+        FakePlanSheet(3, "Plan MOS 03", ["DN4"], delay=0.02),
+    ]
+    by_title = {plan_sheet.title: plan_sheet for plan_sheet in sheets}
+
+    def fake_values_get(spreadsheet_id, range_name):
+        assert spreadsheet_id == "spreadsheet-1"
+        return by_title[range_name.split("'")[1]].values(range_name)
+
+    monkeypatch.setattr(sheet, "fetch_plan_sheets", lambda sh: sheets)
+    monkeypatch.setattr(sheet, "sheets_values_get", fake_values_get)
+
+    combined = sheet.process_all_sheets(object())
+
+    columns = get_sheet_columns()
+    assert combined[columns[0]].tolist() == ["DN1", "DN2", "DN3", "DN4"]
+    assert combined[columns[1]].tolist() == ["", "", "", ""]
+    assert combined["gs_sheet"].tolist() == ["Plan MOS 01", "Plan MOS 01", "Plan MOS 02", "Plan MOS 03"]
+    assert combined["gs_row"].tolist() == [4, 5, 4, 4]
+    assert all(s.thread_name.startswith("plan-sheet-fetch") for s in sheets)
+    assert sheets[0].requested_range.startswith("'Plan MOS 01'!A4:")
+
+
+class FakeArchiveSpreadsheet:
+    def __init__(self, value_ranges):
+        self.value_ranges = value_ranges
+        self.batch_get_calls = []
+        self.batch_updates = []
+
+    def values_batch_get(self, ranges, params=None):
+        self.batch_get_calls.append(list(ranges))
+        self.batch_get_params = params
+        return {"valueRanges": self.value_ranges}
+
+    def batch_update(self, body):
+        self.batch_updates.append(body)
+
+
+class FakeClient:
+    def __init__(self, spreadsheet):
+        self._spreadsheet = spreadsheet
+
+    def open_by_url(self, url):
+        return self._spreadsheet
+
+
+def make_archive_row(plan, status):
+    columns = get_sheet_columns()
+    row = [""] * len(columns)
+    row[0] = "DN"
+    row[columns.index("plan_mos_date")] = plan
+    row[columns.index("status_delivery")] = status
+    return row
+
+
+def test_mark_plan_mos_rows_for_archiving_reads_all_sheets_in_one_call(monkeypatch):
+    columns = get_sheet_columns()
+    sheets = [FakePlanSheet(1, "Plan MOS 01", [], 0.0), FakePlanSheet(2, "Plan MOS 02", [], 0.0)]
+    for plan_sheet in sheets:
+        plan_sheet.col_count = len(columns)
+    spreadsheet = FakeArchiveSpreadsheet(
+        [
+            {
+                "range": "'Plan MOS 01'!A4:Z1000",
+                "values": [make_archive_row("2020/01/01", "POD"), make_archive_row("2020/01/01", "On Site")],
+            },
+            {"range": "'Plan MOS 02'!A4:Z1000"},
+        ]
+    )
+    monkeypatch.setattr(sheet, "get_gspread_client", lambda: FakeClient(spreadsheet))
+    monkeypatch.setattr(sheet, "fetch_plan_sheets", lambda sh: sheets)
+
+    result = sheet.mark_plan_mos_rows_for_archiving(threshold_days=7)
+
+    assert len(spreadsheet.batch_get_calls) == 1
+    assert [r.split("!")[0] for r in spreadsheet.batch_get_calls[0]] == ["'Plan MOS 01'", "'Plan MOS 02'"]
+    assert all(s.thread_name is None for s in sheets)
+    assert result["matched_rows"] == 1
+    assert result["affected_rows"][0]["sheet"] == "Plan MOS 01"
+    assert result["affected_rows"][0]["row"] == 4
+    assert len(spreadsheet.batch_updates) == 1
+
+
+def test_mark_plan_mos_rows_for_archiving_merges_adjacent_rows(monkeypatch):
+    columns = get_sheet_columns()
+    plan_sheet = FakePlanSheet(1, "Plan MOS 01", [], 0.0)
+    plan_sheet.col_count = len(columns)
+    old, pod = "2020/01/01", "POD"
+    rows = [
+        make_archive_row(old, pod),
+        make_archive_row(old, pod),
+        make_archive_row(old, pod),
+        make_archive_row(old, "On Site"),
+        make_archive_row(old, pod),
+    ]
+    spreadsheet = FakeArchiveSpreadsheet([{"values": rows}])
+    monkeypatch.setattr(sheet, "get_gspread_client", lambda: FakeClient(spreadsheet))
+    monkeypatch.setattr(sheet, "fetch_plan_sheets", lambda sh: [plan_sheet])
+
+    result = sheet.mark_plan_mos_rows_for_archiving(threshold_days=7)
+
+    assert result["formatted_rows"] == 4
+    requests = spreadsheet.batch_updates[0]["requests"]
+    assert [(r["repeatCell"]["range"]["startRowIndex"], r["repeatCell"]["range"]["endRowIndex"]) for r in requests] == [
+        (3, 6),
+        (7, 8),
+    ]
+
+
+def test_mark_plan_mos_rows_for_archiving_reads_serial_dates(monkeypatch):
+    columns = get_sheet_columns()
+    plan_sheet = FakePlanSheet(1, "Plan MOS 01", [], 0.0)
+    plan_sheet.col_count = len(columns)
+    old_serial = make_archive_row("", "POD")
+    old_serial[columns.index("plan_mos_date")] = 43831  # 2020-01-01
+    recent_serial = make_archive_row("", "POD")
+    recent_serial[columns.index("plan_mos_date")] = 80000.5  # far future
+    spreadsheet = FakeArchiveSpreadsheet([{"values": [old_serial, recent_serial]}])
+    monkeypatch.setattr(sheet, "get_gspread_client", lambda: FakeClient(spreadsheet))
+    monkeypatch.setattr(sheet, "fetch_plan_sheets", lambda sh: [plan_sheet])
+
+    result = sheet.mark_plan_mos_rows_for_archiving(threshold_days=7)
+
+    assert spreadsheet.batch_get_params["valueRenderOption"] == "UNFORMATTED_VALUE"
+    assert spreadsheet.batch_get_params["dateTimeRenderOption"] == "SERIAL_NUMBER"
+    assert result["matched_rows"] == 1
+    assert result["affected_rows"][0]["plan_mos_date"] == "01 Jan 20"
+
+
+class FakeErrorResponse:
+    def __init__(self, code):
+        self._code = code
+        self.text = ""
+
+    def json(self):
+        return {"error": {"code": self._code, "message": "quota", "status": "RESOURCE_EXHAUSTED"}}
+
+
+def test_archive_batches_retry_rate_limit_errors(monkeypatch):
+    calls = []
+
+    class FlakySpreadsheet:
+        def batch_update(self, body):
+            calls.append(body)
+            if len(calls) < 3:
+                raise gspread.exceptions.APIError(FakeErrorResponse(429))
+
+    delays = []
+    monkeypatch.setattr(sheet, "sleep", delays.append)
+
+    sheet._send_archive_batches(FlakySpreadsheet(), [[{"repeatCell": {}}]])
+
+    assert len(calls) == 3
+    assert delays == [1.0, 2.0]
@@ -0,0 +1,48 @@
+"""Test coalescing of Google Sheet writes into batchUpdate calls."""
+
+import os
+
+import pytest
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+os.environ.setdefault("STORAGE_DISK_PATH", "./data/uploads")
+
+from app.core import sheet_batcher  # noqa: E402
+from app.core.sheet_batcher import SheetWriteBatcher  # noqa: E402
+
+
+class FakeSpreadsheet:
+    id = "sheet-1"
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    calls = []
+    monkeypatch.setattr(sheet_batcher, "apply_repeat_cell_requests", lambda spreadsheet, requests: calls.append(requests))
+    return calls
+
+
+def test_batcher_flushes_when_row_limit_reached(sent):
+    spreadsheet = FakeSpreadsheet()
+    batcher = SheetWriteBatcher(window_seconds=60, max_rows=3)
+
+    for row in range(3):
+        batcher.enqueue(spreadsheet, [{"repeatCell": {"row": row}}])
+
+    assert sent == [[{"repeatCell": {"row": 0}}, {"repeatCell": {"row": 1}}, {"repeatCell": {"row": 2}}]]
+
+
+def test_batcher_holds_writes_until_flush(sent):
+    spreadsheet = FakeSpreadsheet()
+    batcher = SheetWriteBatcher(window_seconds=60, max_rows=100)
+
+    batcher.enqueue(spreadsheet, [{"repeatCell": {"row": 1}}])
+    batcher.enqueue(spreadsheet, [{"repeatCell": {"row": 2}}])
+    assert sent == []
+
+    batcher.flush_all()
+    assert len(sent) == 1
+    assert len(sent[0]) == 2
+
+    batcher.flush_all()
+    assert len(sent) == 1
@@ -0,0 +1,48 @@
+"""Test the COPY helpers used by the sheet sync on PostgreSQL."""
+
+import os
+from unittest.mock import MagicMock
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+os.environ.setdefault("STORAGE_DISK_PATH", "./data/uploads")
+
+from app.core.sync import _copy_insert_new_dns  # noqa: E402
+
+
+class FakeCursor:
+    def __init__(self):
+        self.statements = []
+        self.copied = None
+        self.closed = False
+
+    def execute(self, sql):
+        self.statements.append(sql)
+
+    def copy_expert(self, sql, buffer):
+        self.statements.append(sql)
+        self.copied = buffer.read()
+
+    def close(self):
+        self.closed = True
+
+
+def test_copy_insert_new_dns_stages_rows_and_skips_conflicts():
+    cursor = FakeCursor()
+    db = MagicMock()
+    db.connection.return_value.connection.cursor.return_value = cursor
+
+    _copy_insert_new_dns(
+        db,
+        [
+            {"dn_number": "DN1", "remark": "a\tb\\c", "gs_row": 4},
+            {"dn_number": "DN2", "lsp": "line\nbreak"},
+        ],
+    )
+
+    create, copy, insert, drop = cursor.statements
+    assert create.startswith("CREATE TEMP TABLE _sync_dn_staging ON COMMIT DROP AS SELECT")
+    assert copy == 'COPY _sync_dn_staging ("dn_number", "remark", "gs_row", "lsp") FROM STDIN'
+    assert cursor.copied == "DN1\ta\\tb\\\\c\t4\t\\N\nDN2\t\\N\t\\N\tline\\nbreak\n"
+    assert insert.endswith("FROM _sync_dn_staging ON CONFLICT (dn_number) DO NOTHING")
+    assert drop == "DROP TABLE _sync_dn_staging"
+    assert cursor.closed
@@ -0,0 +1,126 @@
+"""Test the Google Sheet round-trips made by sync_dn_record_to_sheet."""
+
+import os
+
+import pytest
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+os.environ.setdefault("STORAGE_DISK_PATH", "./data/uploads")
+
+from app.core import sheet  # noqa: E402
+from app.dn_columns import get_sheet_columns  # noqa: E402
+
+
+class FakeWorksheet:
+    id = 7
+    title = "Plan MOS 1"
+
+    def __init__(self, dn_column):
+        self.dn_column = dn_column
+        self.reads = 0
+
+    def col_values(self, col):
+        self.reads += 1
+        return list(self.dn_column)
+
+
+class FakeSpreadsheet:
+    id = "spreadsheet-1"
+
+    def __init__(self, worksheet):
+        self._worksheet = worksheet
+
+    def worksheets(self):
+        return [self._worksheet]
+
+
+class FakeClient:
+    opened = 0
+
+    def __init__(self, spreadsheet):
+        self._spreadsheet = spreadsheet
+
+    def open_by_url(self, url):
+        FakeClient.opened += 1
+        return self._spreadsheet
+
+
+@pytest.fixture
+def fake_sheet(monkeypatch):
+    FakeClient.opened = 0
+    worksheet = FakeWorksheet(["DN", "", "", "DN0001", "DN0002"])
+    spreadsheet = FakeSpreadsheet(worksheet)
+
+    writes = []
+    sheet.reset_sheet_cache()
+    monkeypatch.setattr(sheet, "get_gspread_client", lambda: FakeClient(spreadsheet))
+    monkeypatch.setattr(sheet, "apply_repeat_cell_requests", lambda sh, requests: writes.append(requests))
+    yield worksheet, writes
+    sheet.reset_sheet_cache()
+
+
+def _written_rows(writes):
+    return {req["repeatCell"]["range"]["startRowIndex"] + 1 for batch in writes for req in batch}
+
+
+def test_matching_row_is_written_after_a_single_read(fake_sheet):
+    worksheet, writes = fake_sheet
+
+    result = sheet.sync_dn_record_to_sheet("Plan MOS 1", 5, "DN0002", status_delivery="POD")
+
+    assert result["updated"] is True
+    assert "row_corrected" not in result
+    assert worksheet.reads == 1
+    assert _written_rows(writes) == {5}
+
+
+def test_moved_row_is_found_in_the_same_read(fake_sheet):
+    worksheet, writes = fake_sheet
+
+    result = sheet.sync_dn_record_to_sheet("Plan MOS 1", 5, "DN0001", status_delivery="POD")
+
+    assert result["row_corrected"] == 4
+    assert worksheet.reads == 1
+    assert _written_rows(writes) == {4}
+
+
+def test_batched_write_is_reported_as_queued(fake_sheet):
+    _, writes = fake_sheet
+    queued = []
+
+    class FakeBatcher:
+        def enqueue(self, spreadsheet, requests):
+            queued.append(requests)
+
+    result = sheet.sync_dn_record_to_sheet("Plan MOS 1", 5, "DN0002", status_delivery="POD", batcher=FakeBatcher())
+
+    assert result["queued"] is True
+    assert result["updated"] is False
+    assert _written_rows(queued) == {5}
+    assert writes == []
+
+
+def test_missing_dn_reports_error_without_writing(fake_sheet):
+    _, writes = fake_sheet
+
+    result = sheet.sync_dn_record_to_sheet("Plan MOS 1", 5, "DN9999", status_delivery="POD")
+
+    assert result == {"error": "dn_number not found in sheet"}
+    assert writes == []
+
+
+def test_spreadsheet_is_opened_once_across_syncs(fake_sheet):
+    sheet.sync_dn_record_to_sheet("Plan MOS 1", 5, "DN0002", status_delivery="POD")
+    sheet.sync_dn_record_to_sheet("Plan MOS 1", 4, "DN0001", status_delivery="POD")
+
+    assert FakeClient.opened == 1
+
+
+def test_unknown_sheet_title_reopens_spreadsheet_once(fake_sheet):
+    _, writes = fake_sheet
+
+    result = sheet.sync_dn_record_to_sheet("Plan MOS 2", 5, "DN0002", status_delivery="POD")
+
+    assert "error" in result
+    assert FakeClient.opened == 2
+    assert writes == []
@@ -74,7 +74,7 @@ def test_driver_contact_number_protection_with_update_count(db_session: Session)
     }])
     
     # 5. Mock the sheet fetching functions
-    with patch("app.core.sync.create_gspread_client") as mock_client, \
+    with patch("app.core.sync.get_gspread_client") as mock_client, \
          patch("app.core.sync.process_all_sheets") as mock_process:
         
         mock_gc = MagicMock()
@@ -117,7 +117,7 @@ def test_driver_contact_number_updates_when_update_count_zero(db_session: Sessio
     }])
     
     # 3. Mock the sheet fetching functions
-    with patch("app.core.sync.create_gspread_client") as mock_client, \
+    with patch("app.core.sync.get_gspread_client") as mock_client, \
          patch("app.core.sync.process_all_sheets") as mock_process:
         
         mock_gc = MagicMock()
@@ -179,7 +179,7 @@ def test_driver_contact_number_multiple_updates(db_session: Session):
     }])
     
     # 5. Mock the sheet fetching functions
-    with patch("app.core.sync.create_gspread_client") as mock_client, \
+    with patch("app.core.sync.get_gspread_client") as mock_client, \
          patch("app.core.sync.process_all_sheets") as mock_process:
         
         mock_gc = MagicMock()
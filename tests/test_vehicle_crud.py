@@ -16,6 +16,7 @@ from app.crud import (  # noqa: E402
     get_vehicle_by_plate,
     mark_vehicle_departed,
     list_vehicles,
+    list_vehicles_rows,
 )
 from app.time_utils import TZ_GMT7  # noqa: E402
 
@@ -113,3 +114,24 @@ def test_vehicle_depart_and_listing(db_session):
 
     assert [vehicle.vehicle_plate for vehicle in arrived_list] == []
 
+
+def test_list_vehicles_rows_matches_orm_listing(db_session):
+    upsert_vehicle_signin(
+        db_session,
+        vehicle_plate="B1111AA",
+        lsp="Main LSP",
+        arrive_time=datetime(2025, 3, 23, 7, 0, tzinfo=TZ_GMT7),
+    )
+    upsert_vehicle_signin(
+        db_session,
+        vehicle_plate="B2222BB",
+        lsp="Other LSP",
+        arrive_time=datetime(2025, 3, 23, 9, 0, tzinfo=TZ_GMT7),
+    )
+
+    rows = list_vehicles_rows(db_session, status="arrived")
+    vehicles = list_vehicles(db_session, status="arrived")
+
+    assert [row["vehicle_plate"] for row in rows] == [vehicle.vehicle_plate for vehicle in vehicles]
+    assert [row["lsp"] for row in rows] == ["Other LSP", "Main LSP"]
+    assert list_vehicles_rows(db_session, status="departed") == []